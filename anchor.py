@@ -0,0 +1,101 @@
+# anchor.py — Fused cursor anchor from several stable hand landmarks
+#
+# The cursor used to follow the index MCP (landmark 5) alone. Here it
+# follows a weighted combination of the wrist, the four finger MCPs and the
+# palm centroid: one (21,) weight vector dotted with the (21, 2) landmarks.
+# Averaging several points cancels part of each landmark's jitter.
+#
+# As thumb and index tip close in on a pinch, the weights slide from the
+# index-led OPEN set to the PINCH set, which leaves out the index and thumb
+# side of the hand: that side moves while pinching, the rest does not.
+# Switching weight sets outright would jump the cursor, because the two
+# sets sit at different points on the hand. So the anchor integrates the
+# weighted landmark *motion* frame to frame. It is pulled back onto the
+# absolute OPEN anchor (time constant ANCHOR_RECENTER_SECONDS) only while
+# the hand is open. A pinch therefore never moves the cursor by itself,
+# and after release the anchor eases back to where the open hand puts it.
+import math
+
+import numpy as np
+import config
+
+WRIST = 0
+PALM = (0, 5, 9, 13, 17)  # wrist + finger MCPs; their mean is the palm centroid
+
+# (landmark index or "centroid", weight)
+OPEN_WEIGHTS = ((5, 0.40), (9, 0.20), (0, 0.10), (13, 0.05), (17, 0.05), ("centroid", 0.20))
+PINCH_WEIGHTS = ((9, 0.30), (0, 0.20), (13, 0.15), (17, 0.10), ("centroid", 0.25))
+
+
+def weight_vector(weights):
+    """[(landmark | "centroid", w), ...] -> normalised (21,) weights."""
+    w = np.zeros(21, dtype=np.float32)
+    for point, weight in weights:
+        if point == "centroid":
+            w[list(PALM)] += weight / len(PALM)
+        else:
+            w[point] += weight
+    return w / w.sum()
+
+
+class FusedAnchor:
+    def __init__(self, open_weights=OPEN_WEIGHTS, pinch_weights=PINCH_WEIGHTS,
+                 recenter_seconds=None, pinch_open=None, pinch_closed=None):
+        self.open_w = weight_vector(open_weights)
+        self.pinch_w = weight_vector(pinch_weights)
+        self.recenter = config.ANCHOR_RECENTER_SECONDS if recenter_seconds is None else recenter_seconds
+        # thumb-index tip gap / hand size: weights start moving at pinch_open,
+        # fully on the pinch set by pinch_closed (the gesture threshold)
+        self.pinch_open = pinch_open or config.ANCHOR_PINCH_OPEN
+        self.pinch_closed = pinch_closed or config.GESTURE_PINCH_RATIO
+
+        self.x = None
+        self.y = None
+        self.closure = 0.0
+        self._prev = None
+        self._prev_t = None
+
+    def reset(self):
+        """Hand lost: the next update starts from the absolute open anchor."""
+        self.x = self.y = None
+        self._prev = None
+        self._prev_t = None
+        self.closure = 0.0
+
+    def pinch_closure(self, xy):
+        """0 = fingers apart (>= pinch_open), 1 = pinched (<= pinch_closed)."""
+        size = max(float(np.linalg.norm(xy[9] - xy[WRIST])), 1e-6)
+        gap = float(np.linalg.norm(xy[4] - xy[8])) / size
+        c = (self.pinch_open - gap) / (self.pinch_open - self.pinch_closed)
+        return min(max(c, 0.0), 1.0)
+
+    def update(self, lm, t=None):
+        """lm: (21, 3) normalised landmarks -> (x, y) anchor, normalised camera coords."""
+        xy = lm[:, :2]
+        closure = self.closure = self.pinch_closure(xy)
+        open_x, open_y = self.open_w @ xy
+
+        if self._prev is None:
+            self.x, self.y = float(open_x), float(open_y)
+        else:
+            w = self.open_w + closure * (self.pinch_w - self.open_w)
+            dx, dy = w @ (xy - self._prev)
+            x = self.x + float(dx)
+            y = self.y + float(dy)
+
+            if self.recenter > 0.0 and t is not None and self._prev_t is not None:
+                pull = 1.0 - math.exp(-max(t - self._prev_t, 0.0) / self.recenter)
+            else:
+                pull = 1.0 if self.recenter <= 0.0 else 0.1
+            pull *= 1.0 - closure
+            self.x = x + (float(open_x) - x) * pull
+            self.y = y + (float(open_y) - y) * pull
+
+        self._prev = np.array(xy, dtype=np.float32)
+        self._prev_t = t
+        return self.x, self.y
+
+
+def index_mcp(lm):
+    """The original single-landmark anchor."""
+    return float(lm[5, 0]), float(lm[5, 1])
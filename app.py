@@ -0,0 +1,648 @@
+# app.py — asyncio application core
+#
+# One asyncio loop on the main thread owns pygame. Work is split into:
+#
+#   frame tasks       run every frame, in priority order, inside the frame
+#                     task (input → game logic → render)
+#   tracking task     awaits backend.process_frame() on a single-thread
+#                     executor (camera / replay) or polls it on the loop
+#                     (mouse); results land in the loop, never a shared queue
+#   background tasks  telemetry flushes, level/asset I/O, ... — they only get
+#                     the loop while the frame task is sleeping, via
+#                     App.background_slot()
+#
+# The input backend (input_backends.py) is opened — and its model warmed up
+# — on the tracker executor after the window is up, so cv2 / mediapipe never
+# delay the first frame. A splash screen is drawn and input is ignored until
+# the backend reaches config.INPUT_GATE. A backend that fails to open (no
+# camera) is retried with backoff, and the splash shows why it is waiting.
+# Quitting cancels every task; trackers are released on their own thread.
+# PROFILE_HOTKEY / SIGUSR1 toggles the sampling profiler (profiler.py);
+# MEMORY_MONITOR samples RSS / tracemalloc growth (memory_monitor.py).
+# Palm-detector re-runs and tracking losses (continuity.py) go to telemetry
+# every flush and into the shutdown report.
+import asyncio
+import signal
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pygame
+import config
+
+from cursor import SmoothCursor
+from asset_cache import CursorAssetCache
+from frame_clock import FrameClock
+from calibration import Calibration, PointerAcceleration
+from frame_pacer import FramePacer
+from gestures import Gesture, GestureDebouncer
+from telemetry import Telemetry
+from smooth import CursorSmoother
+from assets import AssetManager
+from hittest import DwellTracker, SpatialGrid
+from board import build_targets, draw_targets
+from effects import EffectsLayer
+from input_backends import Readiness, create_backend
+from splash import Splash
+from quality import QualityGovernor
+from render_target import RenderTarget
+from startup import StartupLog
+from profiler import SamplingProfiler
+from memory_monitor import MB, MemoryMonitor
+from histogram import linear_edges
+
+# Frame task priorities (lower runs first within a frame)
+PRIORITY_INPUT = 0
+PRIORITY_ASSETS = 5
+PRIORITY_LOGIC = 10
+PRIORITY_RENDER = 20
+
+HAND_CURSOR = 0  # DwellTracker cursor id of the tracked hand
+
+BACKGROUND_MIN_GAP = 0.002  # seconds of sleep left before background work may run
+
+
+class App:
+    def __init__(self, backend=None, startup=None, profile=False, clock=None, memory=None):
+        self.startup = startup or StartupLog()
+
+        # --------------------------------------------
+        # INITIALIZE PYGAME
+        # --------------------------------------------
+        pygame.init()
+
+        self.screen = pygame.display.set_mode(
+            (config.DISPLAY_WIDTH, config.DISPLAY_HEIGHT),
+            pygame.DOUBLEBUF
+        )
+
+        pygame.display.set_caption("Hand Cursor Game")
+        pygame.mouse.set_visible(False)
+
+        # scene canvas at RENDER_WIDTH x RENDER_HEIGHT, further scaled by quality tiers
+        self.target = RenderTarget(self.screen, (config.RENDER_WIDTH, config.RENDER_HEIGHT))
+        # one monotonic sample per frame (a VirtualClock drives simulated-time soak runs;
+        # it only moves while the loop sleeps, so the pacer must not spin on it)
+        self.frame_clock = clock or FrameClock()
+        self.pacer = FramePacer() if clock is None else FramePacer(source=clock.time, spin_budget=0.0)
+        self.presence = None             # set by camera backends once opened
+        self.continuity = None           # set by backends that track detection on/off
+        self.telemetry = Telemetry.from_config(thread=False)  # flushed by a background task
+
+        # --------------------------------------------
+        # CREATE CURSOR + SMOOTHER
+        # --------------------------------------------
+        self.cursor = SmoothCursor(
+            outer_radius=50,
+            inner_radius=40,
+            color=(153, 255, 255),  # green for pinch
+            asset_cache=CursorAssetCache(),
+            clock=self.frame_clock
+        )
+
+        self.effects = EffectsLayer()
+        self.effects.attach(self.cursor)  # sparkles on correct, embers + shake on wrong
+
+        # Steps glow / arc resolution / fades / render scale down when frames run long
+        self.quality = QualityGovernor() if config.QUALITY_ENABLED else None
+        if self.quality is not None:
+            self.quality.add_listener(self.on_quality_change)
+            self.apply_quality(self.quality.tier)
+
+        self.smoother = CursorSmoother(dead_zone=config.SMOOTHER_DEAD_ZONE,
+                                       responsiveness=config.SMOOTHER_RESPONSIVENESS)
+        self.calibration = Calibration.load_or_default()
+        self.pointer_accel = PointerAcceleration() if config.POINTER_ACCEL_ENABLED else None
+        self.assets = AssetManager()
+        self.targets = SpatialGrid()          # the current level's objects (board.py)
+        self.dwell = DwellTracker(self.targets)
+
+        # name or InputBackend instance; nothing heavy is imported until open()
+        self.backend = backend if hasattr(backend, "process_frame") else create_backend(backend)
+        self.input_gate = Readiness.gate(config.INPUT_GATE)
+        self.input_ready = False
+        self.readiness = Readiness.NONE
+        self.backend_error = None  # why backend.open() failed (shown on the splash)
+        self.retry_at = None       # frame-clock time of the next open() attempt
+        self.splash = Splash()
+
+        # off until toggled: no sampling thread exists, so no cost
+        self.profiler = SamplingProfiler()
+        self._profile_key = pygame.key.key_code(config.PROFILE_HOTKEY)
+        self._profile_at_start = profile
+        self._profile_task = None  # join + write of a halted capture
+
+        # soak runs pass their own monitor on the simulated clock
+        self.memory = memory
+        if memory is None and config.MEMORY_MONITOR:
+            self.memory = MemoryMonitor()
+        if self.memory is not None:
+            self.memory.add_listener(self.on_memory_alert)
+            self.telemetry.define_histogram("memory.rss_mb", linear_edges(0.0, 4096.0, 8.0))
+
+        # --------------------------------------------
+        # STATE
+        # --------------------------------------------
+        self.running = True
+        self.target_x = config.DISPLAY_WIDTH // 2
+        self.target_y = config.DISPLAY_HEIGHT // 2
+        self.sx = self.target_x
+        self.sy = self.target_y
+        self.pinch_active = False  # debounced pinch (GESTURE_DEBOUNCE_FRAMES on / off)
+        self.pinch_fired = False   # this pinch already triggered; re-armed when it ends
+        self.hovered = None        # target under the cursor this frame
+        self.now = self.frame_clock.now
+
+        self.level = None              # current assets.Level
+        self.board_level = None        # level whose targets are in self.targets
+        self.next_level = None         # prefetched during LEVEL_COMPLETE_DELAY
+        self.level_complete_until = None
+
+        self._sample = None          # newest HandSample, consumed once per frame
+        self._sample_at = None       # pacer time the newest sample reached the loop
+        self._gesture_events = []    # debounced GestureEvents, never dropped
+        self._debouncer = GestureDebouncer()
+        self._was_present = False
+        self._hand_event = None      # asyncio.Event, created in run()
+        self._last_drawn = None
+        self._presented = False
+
+        self._frame_tasks = []
+        self._background_tasks = []
+        self._tasks = []
+
+        self.add_frame_task(PRIORITY_INPUT, self.handle_input)
+        self.add_frame_task(PRIORITY_INPUT + 1, self.update_readiness)
+        self.add_frame_task(PRIORITY_ASSETS, self.assets.pump)
+        self.add_frame_task(PRIORITY_LOGIC, self.update_logic)
+        self.add_frame_task(PRIORITY_LOGIC + 1, self.update_level)
+        self.add_frame_task(PRIORITY_RENDER, self.render)
+        self.add_background_task(self.telemetry_task)
+        self.add_background_task(self.level_task)
+        if self.memory is not None:
+            self.add_background_task(self.memory_task)
+
+        self.startup.mark("app_init")
+
+    # ---------------------------------------------------------
+    # TASK REGISTRATION
+    # ---------------------------------------------------------
+    def add_frame_task(self, priority, step):
+        """step() -> awaitable or None; runs once per frame, ordered by priority."""
+        self._frame_tasks.append((priority, step))
+        self._frame_tasks.sort(key=lambda item: item[0])
+
+    def add_background_task(self, coro_fn):
+        """coro_fn() is started as its own task and should use background_slot()."""
+        self._background_tasks.append(coro_fn)
+
+    async def background_slot(self):
+        """Wait until the frame task is sleeping with at least BACKGROUND_MIN_GAP to spare."""
+        while True:
+            await self._gap.wait()
+            spare = self.pacer.time_until_wake()
+            if spare >= BACKGROUND_MIN_GAP:
+                return
+            # too close to the next frame: wait until after it has run
+            await asyncio.sleep(max(spare, 0.0) + 0.0005)
+
+    # ---------------------------------------------------------
+    # RUN / SHUTDOWN
+    # ---------------------------------------------------------
+    async def run(self):
+        loop = asyncio.get_running_loop()
+        self._gap = asyncio.Event()
+        self._hand_event = asyncio.Event()  # set when a hand is visible; wakes idle frames
+        self._tracker_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="tracker")
+
+        self._tasks = [loop.create_task(self.tracking_task(), name="tracking")]
+        self._tasks += [loop.create_task(fn(), name=fn.__name__) for fn in self._background_tasks]
+
+        sigusr1 = getattr(signal, "SIGUSR1", None)
+        if sigusr1 is not None:
+            try:
+                loop.add_signal_handler(sigusr1, self.toggle_profiler)
+            except (NotImplementedError, RuntimeError):
+                sigusr1 = None
+        if self._profile_at_start:
+            self.toggle_profiler()
+
+        try:
+            await self.frame_task()
+        finally:
+            if sigusr1 is not None:
+                loop.remove_signal_handler(sigusr1)
+            tasks = self._tasks + ([self._profile_task] if self._profile_task else [])
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            self._tracker_executor.shutdown(wait=True)  # lets tracker.release() run
+            self.profiler.stop()  # writes the capture if one is still running
+            self.shutdown()
+
+    def toggle_profiler(self):
+        if self._profile_task is not None:
+            print("profiler: previous capture is still being written")
+            return
+        thread = self.profiler.halt()
+        if thread is None:
+            self.profiler.start()
+            return
+        # the sampler can be mid-sample and the write takes a while: not on the render loop
+        self._profile_task = asyncio.get_running_loop().create_task(
+            self.finish_profile(thread), name="finish_profile")
+
+    async def finish_profile(self, thread):
+        loop = asyncio.get_running_loop()
+        try:
+            await self.background_slot()
+        finally:  # also when cancelled at shutdown: write the capture rather than lose it
+            self._profile_task = None
+            await loop.run_in_executor(None, self.profiler.finish, thread)
+            self.telemetry.incr("profiler.captures")
+
+    def shutdown(self):
+        self.assets.shutdown()
+        self.telemetry.close()
+        if self.memory is not None:
+            self.memory.close()
+        print(self.startup.report(f"startup/{self.backend.name}"))
+        print(self.pacer.report())
+        if self.quality is not None:
+            print(self.quality.report())
+        if self.memory is not None:
+            self.memory.sample_rss()
+            print(self.memory.report())
+        print(self.assets.report())
+        if self.presence is not None:
+            print(self.presence.report())
+        if self.continuity is not None:
+            print(self.continuity.report())
+        pygame.quit()
+
+    # ---------------------------------------------------------
+    # FRAME TASK (highest priority)
+    # ---------------------------------------------------------
+    async def frame_task(self):
+        while self.running:
+            # Sleep until just before the present deadline; background tasks run meanwhile
+            self._gap.set()
+            await self.pacer.wait_async(self._hand_event)
+            self._gap.clear()
+            await self.step_frame()
+
+    async def step_frame(self):
+        """One frame: tick the clock, run the frame tasks in priority order, account the present."""
+        self.now = self.frame_clock.tick()
+        self._presented = False
+
+        for _, step in self._frame_tasks:
+            result = step()
+            if result is not None:
+                await result
+
+        dropped = self.pacer.dropped
+        if self._presented:
+            self.pacer.frame_presented()
+            self.telemetry.observe("render.frame_ms", self.pacer.frame_dt * 1000.0)
+            if self.quality is not None and self.input_ready:
+                self.quality.add(self.pacer.frame_cost, self.now)
+        else:
+            self.pacer.frame_skipped()
+        if self.pacer.dropped != dropped:
+            self.telemetry.incr("render.frames_dropped")
+
+    def handle_input(self):
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                self.running = False
+            elif event.type == pygame.KEYDOWN and event.key == self._profile_key:
+                self.toggle_profiler()
+
+    def update_readiness(self):
+        backend = self.backend
+        readiness = backend.readiness
+        if readiness == self.readiness:
+            return
+
+        # mark newly reached phases with the time the backend reached them;
+        # phases after the first sample go to telemetry here (earlier ones with it)
+        for flag, t in sorted(backend.ready_at.items(), key=lambda item: item[1]):
+            if not self.readiness & flag:
+                phase = flag.name.lower()
+                seconds = self.startup.mark(phase, now=t)
+                if "first_sample" in self.startup:
+                    self.telemetry.observe(f"startup.{backend.name}.{phase}_ms", seconds * 1000.0)
+        self.readiness = readiness
+
+        if not self.input_ready and readiness & self.input_gate == self.input_gate:
+            self.input_ready = True
+            self.startup.mark("input_ready")
+            self.pacer.mark_activity(self.now)
+
+    def update_logic(self):
+        now = self.now
+
+        if not self.input_ready:
+            # warm-up samples / gestures are not meant for the game
+            self._sample = None
+            self._gesture_events = []
+            return
+
+        # ---------------------------
+        # Latest cursor data
+        # ---------------------------
+        sample = self._sample
+        if sample is not None:
+            self._sample = None
+            self.pacer.input_sampled(self._sample_at)  # input→flip from arrival
+            if sample.present:
+                self.pacer.mark_activity(now)
+
+            if self.backend.screen_space:
+                x = sample.x * config.DISPLAY_WIDTH
+                y = sample.y * config.DISPLAY_HEIGHT
+            else:
+                # Convert camera coords → Pygame coords (calibrated transform,
+                # falls back to the CAMERA_MARGIN_X/Y crop without a calibration file)
+                x, y = self.calibration.map(sample.x, sample.y)
+
+            if self.pointer_accel is None:
+                self.target_x, self.target_y = x, y
+            elif sample.present:
+                # Velocity-based gain; the cursor may sit off the absolute position
+                self.target_x, self.target_y = self.pointer_accel.update(x, y, sample.t)
+            else:
+                self.pointer_accel.reset()  # cursor stays put; re-acquiring starts absolute
+
+        # ---------------------------
+        # Debounced gesture events
+        # ---------------------------
+        events, self._gesture_events = self._gesture_events, []
+        for gesture in events:
+            if gesture.kind == "start":
+                self.telemetry.incr(f"gesture.{gesture.gesture.name.lower()}")
+
+            if gesture.gesture == Gesture.PINCH:
+                self.pinch_active = gesture.kind == "start"
+                if not self.pinch_active:
+                    self.pinch_fired = False
+
+        # ---------------------------
+        # Apply ADAPTIVE smoothing
+        # ---------------------------
+        self.sx, self.sy = self.smoother.update(self.target_x, self.target_y)
+        self.hovered, _, _ = self.dwell.update(HAND_CURSOR, self.sx, self.sy, now)
+
+        # ---------------------------
+        # PINCH ANIMATION LOGIC
+        # ---------------------------
+        cursor = self.cursor
+        time_left = cursor.red_fade_time_left
+
+        if self.pinch_active and not time_left:
+            if not self.pinch_fired:
+                cursor.start_animation()
+            # one trigger per pinch: holding it does not select again
+            if cursor.finished and not self.pinch_fired:
+                self.pinch_fired = True
+                # the grid's topmost target under the cursor decides;
+                # nothing there counts as a wrong selection
+                hit = self.hovered
+                if hit is None or not hit.correct:
+                    cursor.trigger_wrong(now)
+                    self.telemetry.incr("cursor.trigger_wrong")
+                else:
+                    cursor.trigger_correct(now)
+                    self.telemetry.incr("cursor.trigger_correct")
+                    self.select_target(hit.id)
+        else:
+            cursor.stop_animation()
+
+        # Update animation progression
+        cursor.update(now)
+        self.effects.update(self.frame_clock.dt)
+
+    # ---------------------------------------------------------
+    # LEVELS
+    # ---------------------------------------------------------
+    def select_target(self, target_id):
+        """A correct target was picked: it leaves the board, and the last one ends the level."""
+        self.targets.remove(target_id)
+        self.dwell.forget(HAND_CURSOR)
+        self.hovered = None
+        if not any(t.correct for t in self.targets):
+            self.complete_level()
+
+    def complete_level(self):
+        """The next level streams in during LEVEL_COMPLETE_DELAY."""
+        if self.level is None or self.level_complete_until is not None:
+            return
+        self.level_complete_until = self.now + config.LEVEL_COMPLETE_DELAY
+        self.next_level = self.assets.prefetch(self.level.index + 1)
+
+    def update_level(self):
+        level = self.level
+        if level is not None and level.ready and self.board_level is not level:
+            self.set_board(level)
+
+        if self.level_complete_until is None or self.now < self.level_complete_until:
+            return
+
+        # delay over: switch once the prefetched level is converted (never block)
+        if self.next_level is None:
+            self.level_complete_until = None
+            return
+        if self.next_level.ready:
+            self.assets.release_level(self.level.index)
+            self.level, self.next_level = self.next_level, None
+            self.level_complete_until = None
+            self.set_board(self.level)
+
+    def set_board(self, level):
+        """Replace the on-screen targets with a ready level's objects."""
+        self.targets.clear()
+        for target in build_targets(level, self.assets):
+            self.targets.insert(target)
+        self.board_level = level
+        self.hovered = None
+        self._last_drawn = None  # redraw even when the cursor is still
+
+    def render(self):
+        now = self.now
+        pos = (self.sx, self.sy)
+
+        if not self.input_ready:
+            self.splash.draw(self.screen, now, self.readiness, self.backend_error, self.retry_at)
+            pygame.display.flip()
+            self._presented = True
+            self.startup.mark("first_frame")
+            return
+
+        # Nothing moved and nothing is animating → keep the last frame on screen
+        if (self.pacer.idle and self.cursor.is_static(now) and not self.effects.active
+                and self._last_drawn == pos):
+            return
+        self._last_drawn = pos
+
+        # Scene layer: full-screen work, at the current render scale
+        scene = self.target.scene
+        scene.fill((0, 0, 0))
+        self.cursor.draw_fades(scene, now)
+        self.target.present()
+
+        # Native-resolution layer: level objects, particles, cursor
+        draw_targets(self.screen, self.targets, self.hovered)
+        self.effects.draw(self.screen, now)
+        dx, dy = self.effects.shake_offset(now)
+        self.cursor.draw_cursor(self.screen, (pos[0] + dx, pos[1] + dy), now)
+
+        pygame.display.flip()
+        self._presented = True
+        self.startup.mark("first_frame")
+
+    # ---------------------------------------------------------
+    # QUALITY
+    # ---------------------------------------------------------
+    def apply_quality(self, tier):
+        self.cursor.set_quality(tier)
+        self.target.set_scale(tier.render_scale)
+
+    def on_quality_change(self, old, new, percentile):
+        self.apply_quality(new)
+        self._last_drawn = None  # force a redraw with the new tier
+        direction = "down" if self.quality.tiers.index(new) > self.quality.tiers.index(old) else "up"
+        print(f"quality: {old.name} -> {new.name} "
+              f"(p{self.quality.percentile:g} frame cost {percentile * 1000.0:.2f} ms, "
+              f"budget {self.quality.budget * 1000.0:.2f} ms)")
+        self.telemetry.incr(f"render.quality_{direction}")
+        self.telemetry.observe("render.quality_tier", self.quality.index)
+
+    # ---------------------------------------------------------
+    # MEMORY
+    # ---------------------------------------------------------
+    def on_memory_alert(self, monitor, growth, message):
+        self.telemetry.incr("memory.alerts")
+
+    async def memory_task(self):
+        loop = asyncio.get_running_loop()
+        memory = self.memory
+        while True:
+            await self.background_slot()
+            await loop.run_in_executor(None, memory.poll)
+            if memory.rss is not None:
+                self.telemetry.observe("memory.rss_mb", memory.rss / MB)
+            await asyncio.sleep(memory.rss_interval)
+
+    # ---------------------------------------------------------
+    # TRACKING TASK (results via run_in_executor)
+    # ---------------------------------------------------------
+    def _first_sample(self, sample):
+        backend = self.backend
+        startup = self.startup
+        startup.mark("first_sample")
+        startup.add("backend_import", backend.import_seconds)
+        startup.add("backend_open", backend.open_seconds)
+        for phase, seconds in startup.marks.items():
+            self.telemetry.observe(f"startup.{backend.name}.{phase}_ms", seconds * 1000.0)
+
+    def accept_sample(self, sample):
+        """Hand a backend sample to the frame loop (debounced gestures + newest position)."""
+        present = sample.present
+        if "first_sample" not in self.startup:
+            self._first_sample(sample)
+
+        self.telemetry.incr("tracking.frames")
+        if sample.inference:
+            self.telemetry.observe("tracking.inference_ms", sample.inference * 1000.0)
+        if self._was_present and not present:
+            self.telemetry.incr("tracking.lost")
+        self._was_present = present
+
+        self._gesture_events += self._debouncer.update(sample.gestures, sample.t)
+
+        # Always keep the newest sample only (immutable, safe to hand over)
+        self._sample = sample
+        self._sample_at = self.pacer.now()
+        if present and self._hand_event is not None:
+            self._hand_event.set()  # wakes an idle frame task immediately
+
+    async def tracking_task(self):
+        loop = asyncio.get_running_loop()
+        executor = self._tracker_executor
+        telemetry = self.telemetry
+        backend = self.backend
+
+        # Heavy imports + model construction happen here, off the render loop
+        delay = config.OPEN_RETRY_SECONDS
+        while True:
+            try:
+                await loop.run_in_executor(executor, backend.open)
+                break
+            except Exception as e:  # missing camera / mediapipe / replay folder
+                print(f"input backend {backend.name!r} failed to open: {e!r}")
+                telemetry.incr("tracking.open_failed")
+                self.backend_error = f"{backend.name} input unavailable: {e}"
+                if isinstance(e, (ImportError, ValueError)):
+                    return  # not installed / misconfigured: retrying cannot help
+                self.retry_at = self.frame_clock.time() + delay
+                await asyncio.sleep(delay)
+                delay = min(delay * 2.0, config.OPEN_RETRY_MAX_SECONDS)
+        self.backend_error = self.retry_at = None
+        self.presence = backend.presence
+        self.continuity = backend.continuity
+        self.startup.mark("backend_ready")
+
+        failures = 0  # consecutive failed reads
+        try:
+            while True:
+                if backend.blocking:
+                    t0 = time.perf_counter()
+                    frame, sample = await loop.run_in_executor(executor, backend.process_frame)
+                else:
+                    await asyncio.sleep(backend.poll_interval)
+                    t0 = time.perf_counter()
+                    frame, sample = backend.process_frame()
+                if sample is None:
+                    if frame is not None:
+                        telemetry.incr("tracking.frames_skipped_idle")
+                        continue
+                    if backend.exhausted:  # replay without loop: done
+                        telemetry.incr("tracking.exhausted")
+                        return
+                    if backend.no_sample:  # nothing new yet, the source is fine
+                        telemetry.incr("tracking.no_sample")
+                        continue
+                    telemetry.incr("tracking.read_failed")
+                    failures += 1
+                    if failures >= config.READ_RETRY_AFTER:
+                        # camera gone / stalled: stop spinning the executor
+                        exponent = failures - config.READ_RETRY_AFTER
+                        await asyncio.sleep(min(config.READ_RETRY_SECONDS * 2.0 ** min(exponent, 16),
+                                                config.READ_RETRY_MAX_SECONDS))
+                    continue
+                failures = 0
+                # read + inference + executor hand-off, as seen by the loop
+                telemetry.observe("tracking.roundtrip_ms", (time.perf_counter() - t0) * 1000.0)
+                self.accept_sample(sample)
+        finally:
+            # release on the tracker's own thread (it may still be mid-read)
+            executor.submit(backend.release)
+
+    # ---------------------------------------------------------
+    # BACKGROUND TASKS
+    # ---------------------------------------------------------
+    async def level_task(self):
+        if await self.assets.load_levels():
+            self.level = self.assets.request_level(0)
+
+    async def telemetry_task(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            await asyncio.sleep(self.telemetry.interval)
+            await self.background_slot()
+            if self.continuity is not None:
+                detector_runs, losses, dropouts, _ = self.continuity.drain()
+                self.telemetry.incr("tracking.detector_runs", detector_runs)
+                self.telemetry.incr("tracking.losses", losses)
+                self.telemetry.incr("tracking.dropouts", dropouts)
+            await loop.run_in_executor(None, self.telemetry.flush)
@@ -0,0 +1,139 @@
+# asset_cache.py — On-disk cache of pre-rendered cursor layers
+#
+# Each entry is a list of equally sized RGBA surfaces (a glow ring, the frames
+# of an arc animation, ...) stored as one zlib-compressed raw blob. Entries are
+# keyed by the parameters that produced them, so any change to radii /
+# colours / glow layers simply misses and gets rebuilt. One asset name can
+# have several live entries: cursor.SmoothCursor instances with different
+# colours or sizes (the app's cyan cursor and the default green one) both
+# write cursor_idle_g<n> / cursor_arc_<step>, and the cursors/ skins write
+# halo_idle_g<n> / neon_idle_g<n> per size and colour. So entries are never
+# dropped because a sibling with the same name changed. Instead:
+#
+#   - each pygame version gets its own directory; other versions' directories
+#     are removed (their entries could never hit again)
+#   - beyond CURSOR_CACHE_MAX_FILES entries, the least recently used go
+#     (hits refresh the file's mtime)
+import hashlib
+import json
+import os
+import shutil
+import struct
+import zlib
+
+import pygame
+import config
+
+_MAGIC = b"CUR1"
+_HEADER = struct.Struct("<4sIII")  # magic, frame count, width, height
+
+
+_VERSION_DIR = "pygame-" + pygame.version.ver
+
+
+class CursorAssetCache:
+    def __init__(self, cache_dir=None, enabled=None, max_files=None):
+        self.root = cache_dir or config.CURSOR_CACHE_DIR
+        self.cache_dir = os.path.join(self.root, _VERSION_DIR)
+        self.enabled = config.CURSOR_CACHE_ENABLED if enabled is None else enabled
+        self.max_files = max_files or config.CURSOR_CACHE_MAX_FILES
+
+        # stats (for benchmarks / debug overlay)
+        self.hits = 0
+        self.misses = 0
+
+    # ---------------------------------------------------------
+
+    def _path(self, name, params):
+        blob = json.dumps(params, sort_keys=True, default=list)
+        digest = hashlib.sha1(blob.encode("utf-8")).hexdigest()[:16]
+        return os.path.join(self.cache_dir, f"{name}-{digest}.bin")
+
+    def load(self, name, params):
+        """Return the cached surfaces for (name, params), or None on a miss."""
+        if not self.enabled:
+            return None
+
+        path = self._path(name, params)
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except OSError:
+            return None
+
+        try:
+            magic, count, w, h = _HEADER.unpack_from(data)
+            if magic != _MAGIC:
+                return None
+            raw = zlib.decompress(data[_HEADER.size:])
+        except (struct.error, zlib.error):
+            return None
+
+        frame_size = w * h * 4
+        if len(raw) != count * frame_size:
+            return None
+
+        try:
+            os.utime(path)  # recently used: survives pruning
+        except OSError:
+            pass
+
+        return [
+            pygame.image.frombytes(raw[i * frame_size:(i + 1) * frame_size], (w, h), "RGBA")
+            for i in range(count)
+        ]
+
+    def store(self, name, params, surfaces):
+        if not self.enabled or not surfaces:
+            return
+
+        w, h = surfaces[0].get_size()
+        raw = b"".join(pygame.image.tobytes(s, "RGBA") for s in surfaces)
+
+        path = self._path(name, params)
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+
+            tmp = path + ".tmp"
+            with open(tmp, "wb") as f:
+                f.write(_HEADER.pack(_MAGIC, len(surfaces), w, h))
+                f.write(zlib.compress(raw, 1))
+            os.replace(tmp, path)
+            self._drop_stale()
+        except OSError:
+            pass  # cache is best-effort; rendering still works without it
+
+    def get_or_build(self, name, params, builder):
+        """Load surfaces from disk, or call builder() and persist the result."""
+        surfaces = self.load(name, params)
+        if surfaces is not None:
+            self.hits += 1
+            return surfaces
+
+        self.misses += 1
+        surfaces = builder()
+        self.store(name, params, surfaces)
+        return surfaces
+
+    # ---------------------------------------------------------
+
+    def _drop_stale(self):
+        """Remove other pygame versions' entries and the least recently used beyond max_files."""
+        for fn in os.listdir(self.root):
+            if fn.startswith("pygame-") and fn != _VERSION_DIR:
+                shutil.rmtree(os.path.join(self.root, fn), ignore_errors=True)
+
+        entries = []
+        for fn in os.listdir(self.cache_dir):
+            if fn.endswith(".bin"):
+                path = os.path.join(self.cache_dir, fn)
+                try:
+                    entries.append((os.path.getmtime(path), path))
+                except OSError:
+                    pass
+        entries.sort()
+        for _, path in entries[:max(len(entries) - self.max_files, 0)]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
@@ -0,0 +1,234 @@
+# assets.py — Level data, images and sounds loaded off the render thread
+#
+# Decoding (JSON, PNG, WAV/OGG) happens on a worker thread. Images still need
+# convert_alpha(), which must run on the display thread, so finished decodes
+# are queued and AssetManager.pump() converts as many as fit in a small time
+# budget per frame. Everything is kept in an LRU cache bounded by
+# ASSET_MEMORY_BUDGET bytes. Assets of requested levels (current and
+# prefetched) are pinned until release_level(), so a ready level never
+# loses a member to eviction; pinned assets alone may exceed the budget.
+# Without level_data.json there are simply no levels.
+#
+# level_data.json:
+#   {"levels": [{"name": "...", "images": ["a.png", ...], "sounds": ["b.wav", ...],
+#                "targets": [...]}, ...]}
+#
+# A ready level's "targets" become the on-screen objects (board.py).
+import asyncio
+import json
+import os
+import queue
+import time
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+import pygame
+import config
+from histogram import Histogram, linear_edges
+
+
+class Level:
+    """Handle for one level's data + assets; ready once every asset is converted."""
+
+    def __init__(self, index, data):
+        self.index = index
+        self.data = data
+        self.name = data.get("name", f"level_{index}")
+        targets = [t["image"] for t in data.get("targets", ()) if t.get("image")]
+        self.images = list(dict.fromkeys([*data.get("images", []), *targets]))
+        self.sounds = list(data.get("sounds", []))
+        self.pending = set(self.images) | set(self.sounds)
+        self.requested_at = time.perf_counter()
+        self.ready_at = None
+
+    @property
+    def ready(self):
+        return not self.pending
+
+
+class AssetManager:
+    def __init__(self, level_data_path=None, memory_budget=None, pump_budget=None):
+        self.level_data_path = level_data_path or config.LEVEL_DATA_PATH
+        self.memory_budget = memory_budget or config.ASSET_MEMORY_BUDGET
+        self.pump_budget = config.ASSET_PUMP_BUDGET if pump_budget is None else pump_budget
+
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="assets")
+        self._decoded = queue.SimpleQueue()  # (kind, name, object, decode seconds)
+
+        self._cache = OrderedDict()  # name -> (asset, bytes)
+        self._cache_bytes = 0
+        self._inflight = set()
+        self._pins = Counter()  # name -> number of requested levels using it
+
+        self._levels_data = None
+        self._levels = {}
+
+        # metrics
+        self.decode_ms = Histogram(linear_edges(0.0, 200.0, 1.0))
+        self.convert_ms = Histogram(linear_edges(0.0, 20.0, 0.1))
+        self.level_ready_s = []  # (level name, seconds from request to ready)
+        self.evictions = 0
+
+    # ---------------------------------------------------------
+    # LEVELS
+    # ---------------------------------------------------------
+    def _read_levels(self):
+        with open(self.level_data_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        return data["levels"] if isinstance(data, dict) else data
+
+    async def load_levels(self):
+        """Read LEVEL_DATA_PATH on the worker thread. Returns the level count."""
+        loop = asyncio.get_running_loop()
+        try:
+            self._levels_data = await loop.run_in_executor(self._executor, self._read_levels)
+        except FileNotFoundError:
+            self._levels_data = []  # no levels shipped
+        except (OSError, ValueError, KeyError) as e:
+            print(f"level data unavailable: {e}")
+            self._levels_data = []
+        return len(self._levels_data)
+
+    @property
+    def level_count(self):
+        return len(self._levels_data or ())
+
+    def request_level(self, index):
+        """Start (or reuse) loading a level; returns a Level handle immediately."""
+        level = self._levels.get(index)
+        if level is not None:
+            return level
+
+        level = Level(index, self._levels_data[index])
+        level.pending.difference_update(self._cache)  # already converted
+        self._levels[index] = level
+        self._pins.update(set(level.images) | set(level.sounds))
+
+        for name in level.images:
+            self._request("image", name)
+        for name in level.sounds:
+            self._request("sound", name)
+        self._check_ready(level)
+        return level
+
+    def prefetch(self, index):
+        """Warm the cache for a level (e.g. the next one during LEVEL_COMPLETE_DELAY)."""
+        if 0 <= index < self.level_count:
+            return self.request_level(index)
+        return None
+
+    def release_level(self, index):
+        level = self._levels.pop(index, None)
+        if level is None:
+            return
+        self._pins.subtract(set(level.images) | set(level.sounds))
+        self._pins += Counter()  # drop names no level uses any more
+        self._evict()
+
+    # ---------------------------------------------------------
+    # LOOKUPS
+    # ---------------------------------------------------------
+    def image(self, name):
+        return self._get(name)
+
+    def sound(self, name):
+        return self._get(name)
+
+    def _get(self, name):
+        entry = self._cache.get(name)
+        if entry is None:
+            return None
+        self._cache.move_to_end(name)
+        return entry[0]
+
+    # ---------------------------------------------------------
+    # WORKER THREAD
+    # ---------------------------------------------------------
+    def _request(self, kind, name):
+        if name in self._cache or name in self._inflight:
+            return
+        self._inflight.add(name)
+        self._executor.submit(self._decode, kind, name)
+
+    def _decode(self, kind, name):
+        start = time.perf_counter()
+        try:
+            if kind == "image":
+                obj = pygame.image.load(os.path.join(config.IMAGES_DIR, name))
+            elif pygame.mixer.get_init():
+                obj = pygame.mixer.Sound(os.path.join(config.SOUNDS_DIR, name))
+            else:
+                obj = None  # no audio device: treat as loaded, play nothing
+        except (pygame.error, OSError, FileNotFoundError) as e:
+            print(f"asset load failed: {name}: {e}")
+            obj = None
+        self._decoded.put((kind, name, obj, time.perf_counter() - start))
+
+    # ---------------------------------------------------------
+    # MAIN THREAD
+    # ---------------------------------------------------------
+    def pump(self):
+        """Convert decoded assets on the display thread, within pump_budget seconds."""
+        deadline = time.perf_counter() + self.pump_budget
+        while time.perf_counter() < deadline:
+            try:
+                kind, name, obj, decode_s = self._decoded.get_nowait()
+            except queue.Empty:
+                break
+
+            self.decode_ms.add(decode_s * 1000.0)
+            self._inflight.discard(name)
+
+            start = time.perf_counter()
+            if kind == "image" and obj is not None:
+                obj = obj.convert_alpha()
+                size = obj.get_width() * obj.get_height() * obj.get_bytesize()
+            elif kind == "sound" and obj is not None:
+                freq, size_bits, channels = pygame.mixer.get_init()
+                size = int(obj.get_length() * freq * channels * abs(size_bits) // 8)
+            else:
+                size = 0
+            self.convert_ms.add((time.perf_counter() - start) * 1000.0)
+
+            self._store(name, obj, size)
+            for level in self._levels.values():
+                if name in level.pending:
+                    level.pending.discard(name)
+                    self._check_ready(level)
+
+    def _store(self, name, obj, size):
+        self._cache[name] = (obj, size)
+        self._cache_bytes += size
+        self._evict(keep=name)
+
+    def _evict(self, keep=None):
+        """Drop least recently used, unpinned assets until the cache fits the budget."""
+        if self._cache_bytes <= self.memory_budget:
+            return
+        for name in list(self._cache):
+            if self._cache_bytes <= self.memory_budget:
+                break
+            if name == keep or self._pins[name]:
+                continue
+            _, size = self._cache.pop(name)
+            self._cache_bytes -= size
+            self.evictions += 1
+
+    def _check_ready(self, level):
+        if level.ready and level.ready_at is None:
+            level.ready_at = time.perf_counter()
+            self.level_ready_s.append((level.name, level.ready_at - level.requested_at))
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def report(self):
+        lines = [
+            f"decode   {self.decode_ms.summary(scale=1.0)}",
+            f"convert  {self.convert_ms.summary(scale=1.0)}",
+            f"cache    {self._cache_bytes / 1e6:.1f} MB / {self.memory_budget / 1e6:.1f} MB,"
+            f" {len(self._cache)} assets, {self.evictions} evictions",
+        ]
+        for name, seconds in self.level_ready_s:
+            lines.append(f"level    {name}: ready in {seconds * 1000.0:.0f} ms")
+        return "\n".join(lines)
@@ -0,0 +1,132 @@
+# batch_extract.py — Offline landmark extraction from recorded sessions
+#
+# Streams every .mp4 in a folder through MediaPipe Hands (tracking mode,
+# same mirroring as the live tracker), one video per worker process, and
+# writes one folder of column arrays per session:
+#
+#   <out>/<session>/t.npy          (N,)        float64 seconds from video start
+#   <out>/<session>/landmarks.npy  (N, 21, 3)  float32, NaN where no hand
+#   <out>/<session>/score.npy      (N,)        float32 handedness score, 0 = no hand
+#   <out>/<session>/model.json                 Hands settings used (hands_model.py)
+#
+# The model and thresholds are the live tracker's (MP_* in config.py).
+#
+# Load with np.load(..., mmap_mode="r") to replay / tune filters offline.
+#
+#   python batch_extract.py recordings/ [--out data/sessions] [--workers 4]
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+import config
+import hands_model
+from samples import landmark_array
+
+VIDEO_EXTENSIONS = (".mp4", ".avi", ".mov", ".mkv")
+
+
+def extract_session(path, out_dir):
+    """Worker: run one video, write its column arrays. Returns stats."""
+    import cv2
+
+    cv2.setNumThreads(1)  # one core per worker; the pool provides the parallelism
+
+    cpu_start = time.process_time()
+    start = time.perf_counter()
+
+    cap = cv2.VideoCapture(path)
+    fps = cap.get(cv2.CAP_PROP_FPS) or 30.0
+    capacity = max(int(cap.get(cv2.CAP_PROP_FRAME_COUNT)), 1)
+
+    t = np.empty(capacity, dtype=np.float64)
+    landmarks = np.full((capacity, 21, 3), np.nan, dtype=np.float32)
+    score = np.zeros(capacity, dtype=np.float32)
+
+    hands = hands_model.create_hands()
+
+    n = 0
+    while True:
+        ret, frame = cap.read()
+        if not ret:
+            break
+
+        if n == capacity:  # container frame counts are only an estimate
+            capacity *= 2
+            t = np.resize(t, capacity)
+            landmarks = np.concatenate([landmarks, np.full_like(landmarks, np.nan)])
+            score = np.concatenate([score, np.zeros_like(score)])
+
+        frame = cv2.flip(frame, 1)
+        results = hands.process(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
+
+        t[n] = n / fps
+        if results.multi_hand_landmarks:
+            landmarks[n] = landmark_array(results.multi_hand_landmarks[0].landmark)
+            score[n] = results.multi_handedness[0].classification[0].score
+        n += 1
+
+    cap.release()
+    hands.close()
+
+    name = os.path.splitext(os.path.basename(path))[0]
+    session_dir = os.path.join(out_dir, name)
+    os.makedirs(session_dir, exist_ok=True)
+    np.save(os.path.join(session_dir, "t.npy"), t[:n])
+    np.save(os.path.join(session_dir, "landmarks.npy"), landmarks[:n])
+    np.save(os.path.join(session_dir, "score.npy"), score[:n])
+    hands_model.save_settings(session_dir)
+
+    return {
+        "path": path,
+        "frames": n,
+        "detected": int(np.count_nonzero(score[:n])),
+        "wall": time.perf_counter() - start,
+        "cpu": time.process_time() - cpu_start,
+    }
+
+
+def find_videos(folder):
+    return sorted(
+        os.path.join(folder, fn)
+        for fn in os.listdir(folder)
+        if fn.lower().endswith(VIDEO_EXTENSIONS)
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Extract hand landmarks from recorded sessions.")
+    parser.add_argument("folder")
+    parser.add_argument("--out", default=config.SESSIONS_DIR)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    args = parser.parse_args()
+
+    videos = find_videos(args.folder)
+    if not videos:
+        print(f"No videos in {args.folder}")
+        return
+
+    start = time.perf_counter()
+    total_frames = 0
+    total_cpu = 0.0
+
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        futures = [pool.submit(extract_session, path, args.out) for path in videos]
+        for future in as_completed(futures):
+            r = future.result()
+            total_frames += r["frames"]
+            total_cpu += r["cpu"]
+            fps = r["frames"] / r["wall"] if r["wall"] else 0.0
+            print(f"{os.path.basename(r['path']):<32} {r['frames']:6d} frames  "
+                  f"{fps:6.1f} fps  detected {r['detected']:6d}")
+
+    elapsed = time.perf_counter() - start
+    print(f"\n{len(videos)} sessions, {total_frames} frames in {elapsed:.1f}s "
+          f"({total_frames / elapsed:.1f} fps overall, "
+          f"{total_frames / total_cpu if total_cpu else 0.0:.1f} fps per core, "
+          f"{args.workers} workers)")
+
+
+if __name__ == "__main__":
+    main()
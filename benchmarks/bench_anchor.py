@@ -0,0 +1,244 @@
+# bench_anchor.py — Index-MCP vs fused cursor anchor on recorded landmark traces
+#
+# Replays batch_extract.py sessions (t.npy / landmarks.npy / score.npy), maps
+# each anchor to screen pixels through the default margin calibration and
+# runs CursorSmoother at TARGET_FPS on the sample-and-hold input, as the
+# app does. Per anchor / dead zone / smoother responsiveness it reports:
+#
+#   hold jitter   output path length per second while the hand is still (px/s)
+#   track error   RMS distance to a centred moving average of the same anchor
+#                 while the hand moves (px): smoothing lag + residual noise
+#   pinch drift   mean / max output displacement from 0.1 s before a pinch
+#                 starts to CURSOR_DWELL_MS after it (px): the selection jump
+#
+# Without sessions (none given, none in SESSIONS_DIR) a synthetic trace is
+# generated: a hand model moving between targets with minimum-jerk reaches,
+# holding still and pinching, with per-landmark noise.
+#
+# Run from the repo root:
+#   python -m benchmarks.bench_anchor [data/sessions/<name> ...] [--synthetic]
+import argparse
+import glob
+import os
+
+import numpy as np
+
+import config
+import hands_model
+from anchor import FusedAnchor, index_mcp
+from calibration import Calibration
+from gestures import Gesture, GestureEngine
+from smooth import CursorSmoother
+
+# (anchor, dead zone px, smoother responsiveness); the first row is the old default
+SETUPS = (
+    ("index_mcp", 4, 1.0), ("index_mcp", 4, 2.0),
+    ("fused", 4, 1.0), ("fused", 2, 1.0),
+    ("fused", 4, 2.0), ("fused", 2, 2.0), ("fused", 4, 3.0),
+)
+REFERENCE_SECONDS = 0.15   # half-width of the centred moving average
+HOLD_SPEED = 30.0          # px/s: below this the hand counts as still
+MOVE_SPEED = 200.0         # px/s: above this it counts as moving
+
+# open hand, wrist at the origin, hand size (wrist -> middle MCP) = 1
+HAND = np.array([
+    (0.0, 0.0),
+    (-0.25, -0.15), (-0.45, -0.35), (-0.60, -0.55), (-0.70, -0.75),
+    (-0.25, -0.95), (-0.28, -1.30), (-0.30, -1.55), (-0.32, -1.80),
+    (0.0, -1.0), (0.0, -1.40), (0.0, -1.65), (0.0, -1.90),
+    (0.22, -0.95), (0.24, -1.30), (0.25, -1.52), (0.26, -1.72),
+    (0.42, -0.85), (0.47, -1.10), (0.50, -1.28), (0.52, -1.45),
+])
+
+
+def synthetic_session(seconds=180.0, hz=30.0, seed=0):
+    """(t, landmarks (N, 21, 3), score) for a scripted hand; see the header."""
+    rng = np.random.default_rng(seed)
+    n = int(seconds * hz)
+    t = np.arange(n) / hz
+    center = np.empty((n, 2))
+    pinch = np.zeros(n)
+
+    pos = np.array([0.5, 0.6])
+    i = 0
+    while i < n:
+        # reach: minimum-jerk move to a new target
+        goal = rng.uniform((0.3, 0.45), (0.7, 0.8))
+        steps = int(rng.uniform(0.6, 1.2) * hz)
+        s = np.linspace(0.0, 1.0, steps)[:, None]
+        path = pos + (goal - pos) * (10 * s ** 3 - 15 * s ** 4 + 6 * s ** 5)
+        center[i:i + steps] = path[:n - i]
+        i += steps
+        pos = goal
+
+        # hold, pinching on two holds out of three
+        steps = int(rng.uniform(1.4, 2.2) * hz)
+        center[i:i + steps] = pos
+        if rng.random() < 0.67:
+            start = i + int(0.3 * hz)
+            close, held = int(0.15 * hz), int(1.0 * hz)
+            ramp = np.linspace(0.0, 1.0, close)
+            pinch[start:start + close] = ramp[:max(0, n - start)]
+            pinch[start + close:start + close + held] = 1.0
+            pinch[start + close + held:start + 2 * close + held] = ramp[::-1][:max(0, n - start - close - held)]
+        i += steps
+
+    size = 0.12
+    angle = np.radians(4.0 * np.sin(t * 0.7))
+    landmarks = np.empty((n, 21, 3), dtype=np.float32)
+    for k in range(n):
+        hand = HAND.copy()
+        p = pinch[k]
+        if p:
+            meet = (hand[4] + hand[8]) / 2.0 + (0.05, 0.1)
+            for tip, chain in ((8, (6, 7)), (4, (3,))):
+                offset = (meet - hand[tip]) * p
+                hand[tip] += offset
+                for j, joint in enumerate(chain):
+                    hand[joint] += offset * (j + 1) / (len(chain) + 1)
+            hand[5] += np.array((0.08, 0.06)) * p   # index flexion drags its MCP
+            hand[2] += np.array((0.06, -0.04)) * p
+        c, s = np.cos(angle[k]), np.sin(angle[k])
+        rot = np.array(((c, -s), (s, c)))
+        xy = center[k] + (hand @ rot.T) * size
+
+        noise = rng.normal(0.0, 0.0015, (21, 2)) + rng.normal(0.0, 0.0007, 2)
+        noise[[4, 8, 12, 16, 20]] *= 2.0  # fingertips are the noisiest landmarks
+        landmarks[k, :, :2] = xy + noise
+        landmarks[k, :, 2] = 0.0
+    return t, landmarks, np.full(n, 0.95, dtype=np.float32)
+
+
+def load_session(path):
+    for name, (recorded, current) in hands_model.mismatch(path).items():
+        print(f"note: {os.path.basename(os.path.normpath(path))} extracted with {name}={recorded}, "
+              f"config has {current}")
+    return (np.load(os.path.join(path, "t.npy")),
+            np.load(os.path.join(path, "landmarks.npy")),
+            np.load(os.path.join(path, "score.npy")))
+
+
+def anchors(t, landmarks, method):
+    """Per-sample anchor (N, 2) normalised camera coords, NaN where no hand."""
+    out = np.full((len(t), 2), np.nan)
+    fused = FusedAnchor()
+    for i in range(len(t)):
+        lm = landmarks[i]
+        if np.isnan(lm[0, 0]):
+            fused.reset()
+            continue
+        out[i] = fused.update(lm, float(t[i])) if method == "fused" else index_mcp(lm)
+    return out
+
+
+def pinch_onsets(t, landmarks):
+    engine = GestureEngine()
+    onsets = []
+    was = False
+    for i in range(len(t)):
+        lm = landmarks[i]
+        now = not np.isnan(lm[0, 0]) and bool(engine.classify(lm) & Gesture.PINCH)
+        if now and not was:
+            onsets.append(float(t[i]))
+        was = now
+    return onsets
+
+
+def smooth(t, screen, dead_zone, responsiveness, hz):
+    """Run CursorSmoother at hz on sample-and-hold input; returns output at each sample time."""
+    smoother = CursorSmoother(dead_zone=dead_zone, responsiveness=responsiveness)
+    out = np.full_like(screen, np.nan)
+    frame_t = t[0]
+    last = None
+    for i in range(len(t)):
+        if not np.isnan(screen[i, 0]):
+            last = screen[i]
+        end = t[i + 1] if i + 1 < len(t) else t[i] + 1.0 / hz
+        while frame_t < end:
+            if last is not None:
+                out[i] = smoother.update(float(last[0]), float(last[1]))
+            frame_t += 1.0 / hz
+    return out
+
+
+def centred_average(t, xy, half_width):
+    ref = np.full_like(xy, np.nan)
+    lo = np.searchsorted(t, t - half_width)
+    hi = np.searchsorted(t, t + half_width, side="right")
+    valid = ~np.isnan(xy[:, 0])
+    csum = np.vstack([np.zeros((1, 2)), np.cumsum(np.where(valid[:, None], xy, 0.0), axis=0)])
+    count = np.concatenate([[0], np.cumsum(valid)])
+    n = count[hi] - count[lo]
+    ok = (n > 0) & valid
+    ref[ok] = (csum[hi] - csum[lo])[ok] / n[ok, None]
+    return ref
+
+
+def evaluate(t, screen, out, onsets):
+    ref = centred_average(t, screen, REFERENCE_SECONDS)
+    dt = np.gradient(t)
+    speed = np.linalg.norm(np.gradient(ref, axis=0), axis=1) / dt
+
+    step = np.linalg.norm(np.diff(out, axis=0), axis=1)
+    hold = (speed[1:] < HOLD_SPEED) & ~np.isnan(step)
+    jitter = step[hold].sum() / max(dt[1:][hold].sum(), 1e-9)
+
+    move = (speed > MOVE_SPEED) & ~np.isnan(out[:, 0]) & ~np.isnan(ref[:, 0])
+    track = float(np.sqrt(np.mean(np.sum((out[move] - ref[move]) ** 2, axis=1)))) if move.any() else 0.0
+
+    drifts = []
+    dwell = config.CURSOR_DWELL_MS / 1000.0
+    for onset in onsets:
+        a = np.searchsorted(t, onset - 0.1)
+        b = np.searchsorted(t, onset + dwell, side="right")
+        window = out[a:b]
+        window = window[~np.isnan(window[:, 0])]
+        if len(window) > 1:
+            drifts.append(float(np.max(np.linalg.norm(window - window[0], axis=1))))
+    return jitter, track, drifts
+
+
+def run(name, t, landmarks, hz):
+    calibration = Calibration.from_margins()
+    onsets = pinch_onsets(t, landmarks)
+    present = ~np.isnan(landmarks[:, 0, 0])
+    print(f"{name}: {len(t)} samples, {t[-1] - t[0]:.0f} s, {present.mean() * 100:.0f}% with a hand, "
+          f"{len(onsets)} pinches")
+    print(f"  {'anchor':<10} {'dead zone':>9} {'resp.':>5} {'hold jitter':>12} {'track error':>12} "
+          f"{'pinch drift mean / max':>24}")
+
+    screen = {}
+    for method in {m for m, _, _ in SETUPS}:
+        raw = anchors(t, landmarks, method)
+        mapped = np.full_like(raw, np.nan)
+        ok = ~np.isnan(raw[:, 0])
+        mapped[ok] = calibration.map_many(raw[ok])
+        screen[method] = mapped
+
+    for method, dead_zone, responsiveness in SETUPS:
+        out = smooth(t, screen[method], dead_zone, responsiveness, hz)
+        jitter, track, drifts = evaluate(t, screen[method], out, onsets)
+        drift = f"{np.mean(drifts):6.1f} / {np.max(drifts):6.1f} px" if drifts else "n/a"
+        print(f"  {method:<10} {dead_zone:>6} px {responsiveness:>5.1f} {jitter:>8.1f} px/s "
+              f"{track:>9.1f} px {drift:>24}")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("sessions", nargs="*", help="batch_extract.py session folders")
+    parser.add_argument("--synthetic", action="store_true", help="use the generated trace")
+    parser.add_argument("--hz", type=int, default=config.TARGET_FPS, help="smoother update rate")
+    args = parser.parse_args()
+
+    paths = [] if args.synthetic else (args.sessions or sorted(glob.glob(os.path.join(config.SESSIONS_DIR, "*"))))
+    paths = [p for p in paths if os.path.exists(os.path.join(p, "landmarks.npy"))]
+    if not paths:
+        print("no recorded sessions: synthetic trace")
+        run("synthetic", *synthetic_session()[:2], args.hz)
+    for path in paths:
+        t, landmarks, _ = load_session(path)
+        run(os.path.basename(os.path.normpath(path)), t, landmarks, args.hz)
+
+
+if __name__ == "__main__":
+    main()
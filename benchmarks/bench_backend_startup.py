@@ -0,0 +1,93 @@
+# bench_backend_startup.py — Cold start per input backend, one fresh process per run
+#
+# Each run launches a child interpreter that starts App with the given
+# backend and quits as soon as the first frame is presented and the first
+# sample has arrived (or after TIMEOUT seconds). Reports the median of
+# each startup phase (seconds since the child's first import).
+#
+# Run from the repo root:
+#   python -m benchmarks.bench_backend_startup [mouse hand pose replay] [--replay SESSION]
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+RUNS = 5
+TIMEOUT = 20.0
+
+
+def child(name, replay):
+    from startup import PROCESS_START, StartupLog  # first: marks process start
+
+    import asyncio
+
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    import config
+    config.TELEMETRY_ENABLED = False
+    config.TEST_MODE = False
+
+    startup = StartupLog(PROCESS_START)
+    import time
+    start = time.perf_counter()
+    from app import App
+    from input_backends import create_backend
+    startup.add("import_app", time.perf_counter() - start)
+
+    backend = create_backend(name, path=replay) if name == "replay" else create_backend(name)
+    app = App(backend=backend, startup=startup)
+
+    async def stop_when_ready():
+        deadline = time.perf_counter() + TIMEOUT
+        while time.perf_counter() < deadline:
+            if "first_frame" in startup and "first_sample" in startup:
+                break
+            await asyncio.sleep(0.005)
+        app.running = False
+
+    app.add_background_task(stop_when_ready)
+    asyncio.run(app.run())
+    print("STARTUP " + json.dumps(startup.marks))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("backends", nargs="*", default=["mouse", "replay", "hand", "pose"])
+    parser.add_argument("--replay", help="batch_extract.py session folder")
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        child(args.child, args.replay)
+        return
+
+    for name in args.backends:
+        if name == "replay" and not args.replay:
+            print(f"{name:<8} skipped (needs --replay SESSION)")
+            continue
+
+        runs = []
+        for _ in range(RUNS):
+            cmd = [sys.executable, "-m", "benchmarks.bench_backend_startup", "--child", name]
+            if args.replay:
+                cmd += ["--replay", args.replay]
+            out = subprocess.run(cmd, capture_output=True, text=True,
+                                 env=dict(os.environ, SDL_VIDEODRIVER="dummy")).stdout
+            for line in out.splitlines():
+                if line.startswith("STARTUP "):
+                    runs.append(json.loads(line[len("STARTUP "):]))
+
+        if not runs:
+            print(f"{name:<8} failed to start")
+            continue
+        phases = [p for p in runs[0] if all(p in r for r in runs)]
+        parts = []
+        for phase in phases:
+            values = sorted(r[phase] for r in runs)
+            parts.append(f"{phase} {values[len(values) // 2] * 1000:.0f}")
+        missing = "" if "first_sample" in phases else "  (no sample: backend unavailable?)"
+        print(f"{name:<8} median ms: " + ", ".join(parts) + missing)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+# bench_cursor_startup.py — Cold-start time to the first rendered cursor
+#
+# Run from the repo root:  python -m benchmarks.bench_cursor_startup
+import os
+import shutil
+import tempfile
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from asset_cache import CursorAssetCache
+from cursor import SmoothCursor
+
+RUNS = 10
+
+
+def time_first_frame(screen, asset_cache):
+    start = time.perf_counter()
+    cursor = SmoothCursor(outer_radius=50, inner_radius=40,
+                          color=(153, 255, 255), asset_cache=asset_cache)
+    cursor.update()
+    cursor.draw(screen, (400, 300))
+    return time.perf_counter() - start
+
+
+def report(label, samples):
+    samples = sorted(samples)
+    print(f"{label:<16} median {samples[len(samples) // 2] * 1000:7.2f} ms"
+          f"   min {samples[0] * 1000:7.2f} ms")
+
+
+def main():
+    pygame.init()
+    screen = pygame.display.set_mode((800, 600))
+
+    cache_dir = tempfile.mkdtemp(prefix="cursor_cache_")
+    try:
+        no_cache = [time_first_frame(screen, None) for _ in range(RUNS)]
+
+        cold = []
+        for _ in range(RUNS):
+            shutil.rmtree(cache_dir, ignore_errors=True)
+            cold.append(time_first_frame(screen, CursorAssetCache(cache_dir, enabled=True)))
+
+        warm = [time_first_frame(screen, CursorAssetCache(cache_dir, enabled=True))
+                for _ in range(RUNS)]
+
+        report("no cache", no_cache)
+        report("cold cache", cold)
+        report("warm cache", warm)
+
+        size = sum(os.path.getsize(os.path.join(root, f))
+                   for root, _, files in os.walk(cache_dir) for f in files)
+        print(f"cache size on disk: {size / 1024:.1f} KiB")
+    finally:
+        shutil.rmtree(cache_dir, ignore_errors=True)
+        pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
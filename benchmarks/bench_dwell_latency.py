@@ -0,0 +1,63 @@
+# bench_dwell_latency.py — Pinch-to-selection time vs render rate (virtual clock)
+#
+# Holds a pinch on SmoothCursor and the cursors/ skins with a VirtualClock
+# stepping at several frame rates, and reports when the arc closes. With
+# duration-based tweens every rate should land within one frame of
+# CURSOR_DWELL_MS.
+#
+# Run from the repo root:  python -m benchmarks.bench_dwell_latency
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+import config
+
+from cursor import SmoothCursor
+from cursors.cursor_halo import SmoothCursor as HaloCursor
+from cursors.cursor_neon import SmoothCursor as NeonCursor
+from frame_clock import VirtualClock
+
+RATES = (30, 60, 90, 120, 144, 240)
+TIMEOUT = 10.0
+
+
+def time_to_close(make_cursor, fps, screen):
+    clock = VirtualClock(step=1.0 / fps)
+    cursor = make_cursor(clock)
+    start = clock.now
+    cursor.start_animation(start)
+    while clock.now - start < TIMEOUT:
+        now = clock.tick()
+        cursor.update(now)
+        cursor.draw(screen, (400, 300), now)
+        if not cursor.animating:
+            return now - start
+    return float("nan")
+
+
+def main():
+    pygame.init()
+    screen = pygame.display.set_mode((800, 600))
+
+    cursors = (
+        ("cursor", lambda clock: SmoothCursor(outer_radius=50, inner_radius=40, clock=clock)),
+        ("halo", lambda clock: HaloCursor(clock=clock)),
+        ("neon", lambda clock: NeonCursor(clock=clock)),
+    )
+
+    print(f"CURSOR_DWELL_MS = {config.CURSOR_DWELL_MS}")
+    for name, make in cursors:
+        parts = []
+        worst = 0.0
+        for fps in RATES:
+            ms = time_to_close(make, fps, screen) * 1000.0
+            worst = max(worst, abs(ms - config.CURSOR_DWELL_MS) * fps / 1000.0)
+            parts.append(f"{fps:3d} fps {ms:6.1f} ms")
+        print(f"{name:<7} " + "   ".join(parts) + f"   (worst {worst:.2f} frames off)")
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
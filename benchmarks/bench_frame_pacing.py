@@ -0,0 +1,127 @@
+# bench_frame_pacing.py — clock.tick() loop vs FramePacer
+#
+# A producer thread posts timestamped samples at camera rate. For every
+# sample we record how long it waited between arriving and the present of
+# the first frame that drew it (input→present), plus the frame-time
+# distribution. How old a sample is at *every* present is dominated by the
+# camera period, whatever the loop does, so it is not what latching changes.
+#
+# The dummy video driver has no vsync, which hides the cost the pacer
+# removes: a tick() loop reads input right after the previous flip and then
+# blocks in the next flip until vblank. Both loops therefore also run
+# against a simulated TARGET_FPS display whose flip blocks until the next
+# refresh.
+# Run from the repo root:  python -m benchmarks.bench_frame_pacing
+import math
+import os
+import queue
+import threading
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+import config
+from cursor import SmoothCursor
+from frame_pacer import FramePacer
+from histogram import Histogram, linear_edges
+
+SECONDS = 3.0
+CAMERA_HZ = 30
+
+
+def producer(q, stop):
+    while not stop.is_set():
+        try:
+            q.get_nowait()
+        except queue.Empty:
+            pass
+        q.put(time.perf_counter())
+        time.sleep(1.0 / CAMERA_HZ)
+
+
+class Display:
+    """flip(); with vsync it blocks until the next refresh of a TARGET_FPS display."""
+
+    def __init__(self, vsync, origin):
+        self.vsync = vsync
+        self.origin = origin
+        self.period = 1.0 / config.TARGET_FPS
+
+    def flip(self):
+        pygame.display.flip()
+        if not self.vsync:
+            return
+        now = time.perf_counter()
+        vblank = self.origin + math.ceil((now - self.origin) / self.period) * self.period
+        if vblank - now > 0.001:
+            time.sleep(vblank - now - 0.001)
+        while time.perf_counter() < vblank:
+            pass
+
+
+def render(screen, cursor, display):
+    screen.fill((0, 0, 0))
+    cursor.update()
+    cursor.draw(screen, (400.5, 300.5))
+    display.flip()
+
+
+def run(screen, cursor, use_pacer, vsync):
+    q = queue.Queue(maxsize=1)
+    stop = threading.Event()
+    threading.Thread(target=producer, args=(q, stop), daemon=True).start()
+
+    frame_times = Histogram(linear_edges(0.0, 0.050, 0.0005))
+    latency = Histogram(linear_edges(0.0, 0.050, 0.0005))
+    clock = pygame.time.Clock()
+    # the pacer's schedule starts on the simulated display's refresh grid
+    pacer = FramePacer(target_hz=config.TARGET_FPS, idle_after=1e9)
+    display = Display(vsync, pacer.now())
+
+    last = time.perf_counter()
+    end = last + SECONDS
+    while time.perf_counter() < end:
+        if use_pacer:
+            pacer.wait()
+        try:
+            stamp = q.get_nowait()
+        except queue.Empty:
+            stamp = None
+
+        render(screen, cursor, display)
+        now = time.perf_counter()
+        if stamp is not None:
+            latency.add(now - stamp)
+        frame_times.add(now - last)
+        last = now
+
+        if use_pacer:
+            pacer.frame_presented()
+        else:
+            clock.tick(config.TARGET_FPS)
+
+    stop.set()
+    return frame_times, latency
+
+
+def main():
+    pygame.init()
+    screen = pygame.display.set_mode((800, 600))
+    cursor = SmoothCursor(outer_radius=50, inner_radius=40)
+
+    for vsync in (False, True):
+        print(f"{'simulated vsync' if vsync else 'no vsync (dummy driver)'} at {config.TARGET_FPS} Hz")
+        for label, use_pacer in ((f"clock.tick({config.TARGET_FPS})", False),
+                                 (f"FramePacer({config.TARGET_FPS})", True)):
+            frame_times, latency = run(screen, cursor, use_pacer, vsync)
+            print(f"  {label}")
+            print(f"    frame time     {frame_times.summary()}")
+            print(f"    input→present  {latency.summary()}")
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+# bench_gestures.py — Per-frame cost of gesture classification (budget 0.2 ms)
+#
+# Run from the repo root:  python -m benchmarks.bench_gestures
+import time
+
+import numpy as np
+
+from gestures import Gesture, GestureDebouncer, GestureEngine
+
+FRAMES = 20000
+BUDGET_MS = 0.2
+
+# A roughly open right hand in normalised image coordinates
+OPEN_HAND = np.array([
+    [0.50, 0.80, 0.0],
+    [0.44, 0.76, 0.0], [0.40, 0.70, 0.0], [0.37, 0.65, 0.0], [0.34, 0.61, 0.0],
+    [0.45, 0.62, 0.0], [0.44, 0.54, 0.0], [0.44, 0.49, 0.0], [0.44, 0.45, 0.0],
+    [0.50, 0.61, 0.0], [0.50, 0.52, 0.0], [0.50, 0.47, 0.0], [0.50, 0.42, 0.0],
+    [0.55, 0.62, 0.0], [0.56, 0.54, 0.0], [0.56, 0.49, 0.0], [0.56, 0.45, 0.0],
+    [0.59, 0.65, 0.0], [0.61, 0.59, 0.0], [0.62, 0.55, 0.0], [0.62, 0.52, 0.0],
+], dtype=np.float32)
+
+
+def main():
+    rng = np.random.default_rng(0)
+    frames = OPEN_HAND + rng.normal(0.0, 0.003, (FRAMES, 21, 3)).astype(np.float32)
+
+    engine = GestureEngine()
+    debouncer = GestureDebouncer()
+    print("open hand classified as:", engine.classify(OPEN_HAND).name)
+
+    t = 0.0
+    samples = np.empty(FRAMES)
+    for i, lm in enumerate(frames):
+        start = time.perf_counter()
+        flags = engine.classify(lm, t)
+        debouncer.update(flags, t)
+        samples[i] = time.perf_counter() - start
+        t += 1 / 30
+
+    samples *= 1000.0
+    p50, p99 = np.percentile(samples, (50, 99))
+    print(f"classify+debounce  mean {samples.mean():.4f} ms  p50 {p50:.4f} ms  p99 {p99:.4f} ms")
+    print(f"budget {BUDGET_MS} ms: {'OK' if p99 < BUDGET_MS else 'OVER'}")
+    print("active after run:", Gesture(debouncer.active).name)
+
+
+if __name__ == "__main__":
+    main()
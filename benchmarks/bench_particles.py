@@ -0,0 +1,48 @@
+# bench_particles.py — Frame time vs live particle count
+#
+# Each frame: keep the pool topped up, update, clear the screen, draw. The
+# draw still costs one blit per particle, so the time grows with the count;
+# PARTICLE_CAPACITY caps how far it can grow. Compare p95 with the
+# 1 / TARGET_FPS frame budget.
+#
+# Run from the repo root:  python -m benchmarks.bench_particles
+import os
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+import config
+from effects import ParticlePool
+
+FRAMES = 300
+COUNTS = (0, 500, 1000, 2000, 3000, 5000)
+
+
+def main():
+    pygame.init()
+    screen = pygame.display.set_mode((config.DISPLAY_WIDTH, config.DISPLAY_HEIGHT))
+    print(f"frame budget {1000.0 / config.TARGET_FPS:.2f} ms at {config.TARGET_FPS} Hz, "
+          f"capacity {config.PARTICLE_CAPACITY} particles")
+
+    for target in COUNTS:
+        pool = ParticlePool(spawn_cap=config.PARTICLE_CAPACITY)
+        samples = []
+        for _ in range(FRAMES):
+            start = time.perf_counter()
+            # keep the population topped up (long lives so it stays near target)
+            pool.spawn(target - pool.count, (960, 540), speed=(10.0, 400.0), life=(5.0, 10.0))
+            pool.update(1 / 120)
+            screen.fill((0, 0, 0))
+            pool.draw(screen)
+            samples.append(time.perf_counter() - start)
+        samples.sort()
+        print(f"{target:5d} particles: p50 {samples[len(samples) // 2] * 1000:6.3f} ms"
+              f"  p95 {samples[int(len(samples) * 0.95)] * 1000:6.3f} ms")
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
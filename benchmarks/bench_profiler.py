@@ -0,0 +1,100 @@
+# bench_profiler.py — Sampling-profiler overhead on the render + tracker threads
+#
+# Renders the usual 1080p scene (clear, both fades, pinch arc, cursor, flip)
+# on the main thread while a stand-in tracker thread runs numpy "inference"
+# in a loop, with the profiler off and sampling at 200 Hz / 1000 Hz. Prints
+# frame cost and tracker throughput for each, then profiles cold cursor
+# sprite builds to show _build_arc showing up in the summary.
+#
+# Run from the repo root:  python -m benchmarks.bench_profiler
+import os
+import tempfile
+import threading
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import numpy as np
+import pygame
+
+from cursor import SmoothCursor
+from histogram import Histogram, linear_edges
+from profiler import SamplingProfiler
+
+FRAMES = 600
+RATES = (None, 200, 1000)  # None = profiler off
+
+
+def tracker(stop, counter):
+    rng = np.random.default_rng(0)
+    frame = rng.random((480, 640), dtype=np.float32)
+    weights = rng.random((640, 64), dtype=np.float32)
+    while not stop.is_set():
+        frame @ weights  # stand-in for model inference
+        counter[0] += 1
+
+
+def run(screen, cursor, rate, out_dir):
+    profiler = SamplingProfiler(interval=1.0 / rate, out_dir=out_dir) if rate else None
+    stop = threading.Event()
+    counter = [0]
+    worker = threading.Thread(target=tracker, args=(stop, counter), name="tracker_0")
+    worker.start()
+    if profiler:
+        profiler.start()
+
+    times = Histogram(linear_edges(0.0, 0.100, 0.0001))
+    start = time.perf_counter()
+    for i in range(FRAMES):
+        t0 = time.perf_counter()
+        if i % 60 == 0:
+            cursor.trigger_correct(t0)
+            cursor.trigger_wrong(t0)
+            cursor.anim.stop("error_ring")
+            cursor.start_animation(t0)
+        cursor.update(t0)
+        screen.fill((0, 0, 0))
+        cursor.draw_fades(screen, t0)
+        cursor.draw_cursor(screen, (960 + i % 100, 540), t0)
+        pygame.display.flip()
+        times.add(time.perf_counter() - t0)
+    elapsed = time.perf_counter() - start
+
+    if profiler:
+        profiler.stop()
+    stop.set()
+    worker.join()
+    return times, counter[0] / elapsed, profiler
+
+
+def main():
+    pygame.init()
+    screen = pygame.display.set_mode((1920, 1080))
+    cursor = SmoothCursor(outer_radius=50, inner_radius=40)
+    out_dir = tempfile.mkdtemp(prefix="handcursor-profile-")
+
+    print(f"{FRAMES} frames at 1920x1080 with a busy tracker thread")
+    for rate in RATES:
+        times, tracker_hz, profiler = run(screen, cursor, rate, out_dir)
+        label = f"{rate} Hz" if rate else "off"
+        extra = f"   {profiler.samples} samples" if profiler else ""
+        print(f"  profiler {label:<8} frame p50 {times.percentile(50) * 1000:5.2f} ms"
+              f"   mean {times.mean * 1000:5.2f} ms   tracker {tracker_hz:6.0f} it/s{extra}")
+
+    # hot-path capture: cold sprite builds (no disk cache) under the profiler
+    profiler = SamplingProfiler(interval=0.001, out_dir=out_dir)
+    profiler.start()
+    end = time.perf_counter() + 2.0
+    while time.perf_counter() < end:
+        SmoothCursor(outer_radius=50, inner_radius=40, asset_cache=None)
+    paths = profiler.stop()
+    print("cold cursor builds, top MainThread functions:")
+    lines = profiler.summary().splitlines()
+    first = next(i for i, line in enumerate(lines) if line.startswith("thread MainThread"))
+    print("\n".join(lines[first + 1:first + 7]))
+    print(f"(written to {paths[0]})")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
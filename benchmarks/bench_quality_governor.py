@@ -0,0 +1,112 @@
+# bench_quality_governor.py — Frame time under synthetic CPU load, governed vs fixed tier
+#
+# Renders the usual scene (clear, both full-screen fades, pinch arc) through
+# FramePacer at --hz while a busy-loop adds --load-ms of CPU work per frame
+# during the 'onset' and 'loaded' phases. Runs once pinned to the top tier
+# and once with QualityGovernor, and prints per-phase frame cost
+# percentiles, dropped frames and the governor's tier changes.
+#
+# Run from the repo root:
+#   python -m benchmarks.bench_quality_governor [--hz 60] [--load-ms 9] [--size 1920x1080]
+import argparse
+import os
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from cursor import SmoothCursor
+from frame_pacer import FramePacer
+from histogram import Histogram, linear_edges
+from quality import TIERS, QualityGovernor
+from render_target import RenderTarget
+
+PHASES = (("idle", 3.0, False), ("onset", 3.0, True), ("loaded", 6.0, True), ("recovered", 8.0, False))
+
+
+def busy(seconds):
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+def run(screen, hz, load, governed):
+    target = RenderTarget(screen)
+    cursor = SmoothCursor(outer_radius=50, inner_radius=40)
+    pacer = FramePacer(target_hz=hz, idle_after=1e9)
+    governor = QualityGovernor(target_hz=hz) if governed else None
+
+    def apply(tier):
+        cursor.set_quality(tier)
+        target.set_scale(tier.render_scale)
+
+    apply(governor.tier if governor else TIERS[0])
+    if governor:
+        governor.add_listener(lambda old, new, p: apply(new))
+
+    start = time.perf_counter()
+    results = []
+    for name, seconds, loaded in PHASES:
+        costs = Histogram(linear_edges(0.0, 0.100, 0.00025))
+        dropped = pacer.dropped
+        phase_end = time.perf_counter() + seconds
+        next_trigger = 0.0
+        while time.perf_counter() < phase_end:
+            now = pacer.wait()
+            pygame.event.pump()
+            if now >= next_trigger:  # keep both fades and the arc running
+                cursor.trigger_correct(now)
+                cursor.trigger_wrong(now)
+                cursor.anim.stop("error_ring")
+                cursor.start_animation(now)
+                next_trigger = now + 1.0
+            if loaded:
+                busy(load)
+
+            cursor.update(now)
+            scene = target.scene
+            scene.fill((0, 0, 0))
+            cursor.draw_fades(scene, now)
+            target.present()
+            cursor.draw_cursor(screen, (960, 540), now)
+            pygame.display.flip()
+
+            pacer.frame_presented()
+            costs.add(pacer.frame_cost)
+            if governor:
+                governor.add(pacer.frame_cost, now)
+        results.append((name, costs, pacer.dropped - dropped,
+                        governor.tier.name if governor else TIERS[0].name))
+
+    changes = [(t - start, old, new) for t, old, new, _ in governor.changes] if governor else []
+    return results, changes
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--hz", type=int, default=60)
+    parser.add_argument("--load-ms", type=float, default=9.0)
+    parser.add_argument("--size", default="1920x1080")
+    args = parser.parse_args()
+
+    pygame.init()
+    size = tuple(int(v) for v in args.size.split("x"))
+    screen = pygame.display.set_mode(size)
+    budget = 1000.0 / args.hz
+    print(f"{size[0]}x{size[1]} @ {args.hz} Hz (budget {budget:.2f} ms), "
+          f"load {args.load_ms:.1f} ms/frame from 'onset' to 'loaded'")
+
+    for governed in (False, True):
+        results, changes = run(screen, args.hz, args.load_ms / 1000.0, governed)
+        print("governed" if governed else "fixed high")
+        for name, costs, dropped, tier in results:
+            print(f"  {name:<10} cost {costs.summary()}  dropped {dropped:4d}  tier at end {tier}")
+        for t, old, new in changes:
+            print(f"  {t:6.2f}s  {old} -> {new}")
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
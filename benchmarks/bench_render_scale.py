@@ -0,0 +1,65 @@
+# bench_render_scale.py — Frame cost at 1080p / 1440p / 4K, native vs internal resolution
+#
+# Renders the full-screen path (clear, both screen fades, upscale, cursor,
+# flip) with the dummy video driver for each display size and each internal
+# render resolution, nearest-neighbour and bilinear.
+#
+# Run from the repo root:  python -m benchmarks.bench_render_scale
+import os
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from cursor import SmoothCursor
+from histogram import Histogram, linear_edges
+from render_target import RenderTarget
+
+FRAMES = 120
+DISPLAYS = ((1920, 1080), (2560, 1440), (3840, 2160))
+INTERNAL = (None, (1920, 1080), (1280, 720))  # None = native
+
+
+def run(screen, cursor, base_size, smooth):
+    target = RenderTarget(screen, base_size, smooth=smooth)
+    cursor.trigger_correct()
+    cursor.trigger_wrong()
+    cursor.anim.stop("error_ring")
+    w, h = screen.get_size()
+
+    times = Histogram(linear_edges(0.0, 0.200, 0.0005))
+    for i in range(FRAMES):
+        start = time.perf_counter()
+        now = start
+        scene = target.scene
+        scene.fill((0, 0, 0))
+        cursor.draw_fades(scene, now)
+        target.present()
+        cursor.draw_cursor(screen, (w * 0.25 + i, h * 0.5), now)
+        pygame.display.flip()
+        times.add(time.perf_counter() - start)
+    return times
+
+
+def main():
+    pygame.init()
+    for size in DISPLAYS:
+        screen = pygame.display.set_mode(size)
+        cursor = SmoothCursor(outer_radius=50, inner_radius=40)
+        print(f"display {size[0]}x{size[1]}")
+        for base in INTERNAL:
+            if base is not None and base[0] >= size[0]:
+                continue
+            label = "native" if base is None else f"{base[0]}x{base[1]}"
+            for smooth in ((False,) if base is None else (False, True)):
+                times = run(screen, cursor, base, smooth)
+                kind = "" if base is None else (" smooth" if smooth else " fast")
+                print(f"  {label + kind:<18} p50 {times.percentile(50) * 1000:6.2f} ms"
+                      f"   p95 {times.percentile(95) * 1000:6.2f} ms"
+                      f"   mean {times.mean * 1000:6.2f} ms")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+# bench_tracker_net.py — Loopback throughput, latency and clock-offset estimate
+#
+# Server and client live in this process (separate threads) and talk over
+# loopback UDP and a Unix datagram socket:
+#
+#   throughput  publish as fast as possible; received / lost / stale counts
+#   latency     publish at RATE_HZ; send → receive transit percentiles
+#   offset      server clock skewed by SKEW seconds; estimated vs true offset
+#
+# Run from the repo root:  python -m benchmarks.bench_tracker_net
+import os
+import socket
+import tempfile
+import threading
+import time
+
+import numpy as np
+
+from gestures import Gesture
+from samples import HandSample, freeze
+from tracker_net import TrackerClient, TrackerServer, encode_sample
+
+THROUGHPUT_SAMPLES = 50000
+RATE_HZ = 1000
+LATENCY_SECONDS = 2.0
+SKEW = 123.456
+
+
+def free_udp_address():
+    s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    s.bind(("127.0.0.1", 0))
+    port = s.getsockname()[1]
+    s.close()
+    return f"udp://127.0.0.1:{port}"
+
+
+def make_sample(i, t):
+    landmarks = freeze(np.random.default_rng(i).uniform(0.2, 0.8, (21, 3)).astype(np.float32))
+    return HandSample(t=t, seq=i, x=0.5, y=0.5, present=True, landmarks=landmarks,
+                      confidence=0.97, handedness="Right", gestures=Gesture.PINCH)
+
+
+def connect(address, server_source=time.perf_counter):
+    server = TrackerServer(address, source=server_source)
+    client = TrackerClient(address, ping_interval=0.05)
+    deadline = time.perf_counter() + 2.0
+    while not server.clients and time.perf_counter() < deadline:
+        client.poll()
+        client.wait(0.01)
+    return server, client
+
+
+def receive(client, stop):
+    while not stop.is_set():
+        client.wait(0.05)
+        client.poll()
+
+
+def run(address):
+    # --- throughput ---
+    server, client = connect(address)
+    sample = make_sample(0, time.perf_counter())
+    stop = threading.Event()
+    reader = threading.Thread(target=receive, args=(client, stop))
+    reader.start()
+    start = time.perf_counter()
+    for _ in range(THROUGHPUT_SAMPLES):
+        server.publish(sample)
+    elapsed = time.perf_counter() - start
+    time.sleep(0.2)
+    stop.set()
+    reader.join()
+    print(f"  throughput  sent {server.sent} in {elapsed * 1000:.0f} ms "
+          f"({server.sent / elapsed / 1000:.0f} k/s), received {client.received}, "
+          f"lost {client.lost}, stale {client.stale}, send errors {server.send_errors}")
+    server.close()
+    client.close()
+
+    # --- latency at a tracker-like rate ---
+    server, client = connect(address)
+    client.transit.reset()
+    stop = threading.Event()
+    reader = threading.Thread(target=receive, args=(client, stop))
+    reader.start()
+    period = 1.0 / RATE_HZ
+    next_t = time.perf_counter()
+    end = next_t + LATENCY_SECONDS
+    i = 0
+    while next_t < end:
+        while time.perf_counter() < next_t:
+            pass
+        i += 1
+        server.publish(make_sample(i, time.perf_counter()))
+        next_t += period
+    time.sleep(0.1)
+    stop.set()
+    reader.join()
+    print(f"  latency     {RATE_HZ} Hz x {LATENCY_SECONDS:.0f} s: "
+          f"{client.transit.summary(scale=1e6, unit='us')}, lost {client.lost}")
+    server.close()
+    client.close()
+
+    # --- clock offset with a skewed server clock ---
+    server, client = connect(address, server_source=lambda: time.perf_counter() + SKEW)
+    for _ in range(20):
+        client.ping()
+        client.wait(0.05)
+        client.poll()
+    print(f"  offset      true {SKEW * 1e6:.1f} us, estimated {client.clock_offset * 1e6:.1f} us "
+          f"(error {abs(client.clock_offset - SKEW) * 1e6:.1f} us, rtt {client.rtt * 1e6:.1f} us)")
+    server.close()
+    client.close()
+
+
+def main():
+    sample = make_sample(0, 0.0)
+    print(f"packet size: {len(encode_sample(sample, 1, 0.0))} bytes with landmarks, "
+          f"{len(encode_sample(sample, 1, 0.0, landmarks=False))} without")
+
+    print("udp")
+    run(free_udp_address())
+    if hasattr(socket, "AF_UNIX"):
+        print("unix")
+        path = os.path.join(tempfile.mkdtemp(prefix="handcursor-"), "tracker.sock")
+        run(f"unix://{path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+# bench_tracking_continuity.py — Palm re-detections and dropouts per tracking setting
+#
+# Streams recorded videos through MediaPipe Hands (tracking mode, mirrored
+# like the live tracker) once per setting:
+#
+#   min_tracking_confidence   0.3 / 0.5 / 0.7 (MP_MIN_TRK_CONF)
+#   preconditioning           off / gamma / auto (precondition.py)
+#
+# For each it reports inference time on detector and tracked frames, palm
+# detector runs and tracking losses per minute of video, and how many
+# losses were dropouts: the hand found again within
+# CONTINUITY_DROPOUT_SECONDS. Good settings lower both rates without
+# raising tracked-frame inference time. --darken 0.4 scales the frames to
+# simulate a dim room, which is where preconditioning should pay off.
+#
+# Timestamps are video time, so rates are per minute of recording whatever
+# the machine's speed.
+#
+# batch_extract.py sessions (landmarks only, no video) given with
+# --sessions are summarised as recorded, under the settings they were
+# extracted with.
+#
+# Run from the repo root:
+#   python -m benchmarks.bench_tracking_continuity session1.mp4 [...] [--darken 0.4]
+#   python -m benchmarks.bench_tracking_continuity --sessions data/sessions/*
+import argparse
+import os
+import time
+
+import numpy as np
+
+import config
+import hands_model
+from continuity import TrackingContinuity
+
+TRACKING_CONFIDENCES = (0.3, 0.5, 0.7)
+PRECONDITION_MODES = ("off", "gamma", "auto")
+
+
+def run_video(path, min_trk_conf, precondition_mode, darken=1.0):
+    """One pass of a video under one setting -> (TrackingContinuity, video seconds, lut rebuilds)."""
+    import cv2
+    from precondition import FramePreconditioner
+
+    cap = cv2.VideoCapture(path)
+    fps = cap.get(cv2.CAP_PROP_FPS) or 30.0
+    hands = hands_model.create_hands(min_tracking_confidence=min_trk_conf)
+    precondition = FramePreconditioner(mode=precondition_mode)
+    continuity = TrackingContinuity(source=lambda: 0.0)
+
+    n = 0
+    while True:
+        ret, frame = cap.read()
+        if not ret:
+            break
+        frame = cv2.flip(frame, 1)
+        if darken != 1.0:
+            frame = cv2.convertScaleAbs(frame, alpha=darken)
+        rgb = precondition(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
+
+        start = time.perf_counter()
+        results = hands.process(rgb)
+        continuity.update(bool(results.multi_hand_landmarks), time.perf_counter() - start, n / fps)
+        n += 1
+
+    cap.release()
+    hands.close()
+    return continuity, n / fps, precondition.rebuilds
+
+
+def row(label, continuity, seconds):
+    minutes = max(seconds, 1e-9) / 60.0
+    detect = continuity.detect_time.percentile(50) * 1000.0 if continuity.detect_time.count else float("nan")
+    track = continuity.track_time.percentile(50) * 1000.0 if continuity.track_time.count else float("nan")
+    hand = continuity.present_frames / continuity.frames * 100.0 if continuity.frames else 0.0
+    return (f"  {label:<14} {hand:5.0f}% {detect:8.1f} {track:8.1f} "
+            f"{continuity.detector_runs / minutes:9.0f} {continuity.losses / minutes:9.1f} "
+            f"{continuity.dropout_rate * 100.0:8.0f}%")
+
+
+HEADER = (f"  {'setting':<14} {'hand':>6} {'detect':>8} {'track':>8} "
+          f"{'det./min':>9} {'loss/min':>9} {'dropout':>9}\n"
+          f"  {'':<14} {'':>6} {'p50 ms':>8} {'p50 ms':>8}")
+
+
+def bench_videos(paths, darken):
+    for path in paths:
+        print(f"{os.path.basename(path)}" + (f" (darkened x{darken:g})" if darken != 1.0 else ""))
+        print(HEADER)
+        for conf in TRACKING_CONFIDENCES:
+            for mode in PRECONDITION_MODES:
+                continuity, seconds, rebuilds = run_video(path, conf, mode, darken)
+                note = f"  lut x{rebuilds}" if mode == "auto" else ""
+                print(row(f"trk {conf:.1f} {mode}", continuity, seconds) + note)
+
+
+def bench_sessions(paths):
+    print("recorded sessions (as extracted, no inference times)")
+    print(HEADER)
+    for path in paths:
+        for name, (recorded, current) in hands_model.mismatch(path).items():
+            print(f"  note: extracted with {name}={recorded}, config has {current}")
+        t = np.load(os.path.join(path, "t.npy"), mmap_mode="r")
+        landmarks = np.load(os.path.join(path, "landmarks.npy"), mmap_mode="r")
+        continuity = TrackingContinuity(source=lambda: 0.0)
+        for i in range(len(t)):
+            continuity.update(not np.isnan(landmarks[i, 0, 0]), now=float(t[i]))
+        seconds = float(t[-1] - t[0]) if len(t) else 0.0
+        print(row(os.path.basename(os.path.normpath(path))[:14], continuity, seconds))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("videos", nargs="*", help="recorded .mp4 sessions")
+    parser.add_argument("--sessions", nargs="*", default=[], help="batch_extract.py session folders")
+    parser.add_argument("--darken", type=float, default=1.0, help="scale frame brightness (dim-room test)")
+    args = parser.parse_args()
+
+    if not args.videos and not args.sessions:
+        parser.error("give videos and/or --sessions")
+    if args.videos:
+        bench_videos(args.videos, args.darken)
+    sessions = [p for p in args.sessions if os.path.exists(os.path.join(p, "landmarks.npy"))]
+    if sessions:
+        bench_sessions(sessions)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+# bench_tracking_throughput.py — Hand vs pose tracking throughput on recorded video
+#
+# Run from the repo root:
+#   python -m benchmarks.bench_tracking_throughput session1.mp4 [session2.mp4 ...]
+import sys
+import time
+
+import config
+
+config.TEST_MODE = False  # no debug window / landmark drawing while timing
+
+from hand_cursor_tracker import HandCursorTracker
+from palm_tracker import PalmTracker
+
+
+def run(tracker):
+    frames = 0
+    found = 0
+    start = time.perf_counter()
+    while True:
+        frame, sample = tracker.process_frame()
+        if frame is None:
+            break
+        frames += 1
+        found += bool(sample and sample.present)
+    elapsed = time.perf_counter() - start
+    tracker.release()
+    return frames, found, elapsed
+
+
+def main(paths):
+    if not paths:
+        print("usage: python -m benchmarks.bench_tracking_throughput VIDEO...")
+        return
+
+    modes = (
+        ("hand", HandCursorTracker),
+        (f"pose/{config.POSE_LANDMARK} c{config.POSE_MODEL_COMPLEXITY}", PalmTracker),
+    )
+    for path in paths:
+        print(path)
+        for label, cls in modes:
+            frames, found, elapsed = run(cls(source=path))
+            fps = frames / elapsed if elapsed else 0.0
+            rate = 100.0 * found / frames if frames else 0.0
+            print(f"  {label:<16} {frames:6d} frames  {fps:7.1f} fps  "
+                  f"{1000.0 / fps if fps else 0.0:6.2f} ms/frame  detected {rate:5.1f}%")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,210 @@
+# soak.py — Headless long-run memory soak of the full app
+#
+# Runs App.run() itself on an event loop whose clock is a VirtualClock:
+# whenever no callback is ready, simulated time jumps to the next timer.
+# So every task runs as in the app, only faster than real time: the frame
+# task and its pacer waits (at --fps), the tracking task polling the
+# backend, the background_slot() tasks (telemetry flushes to a temporary
+# JSONL file, level loading, the memory monitor) and shutdown.
+#
+# The synthetic hand sweeps across the camera, pinches long enough for the
+# arc to close (correct / wrong fades, particles), and leaves for 20 s
+# every 5 minutes (idle mode, tracking lost). A freshly allocated
+# camera-sized frame accompanies every sample, and the hit-test targets are
+# reshuffled every minute. Every 15 minutes the quality tier changes, so
+# sprite variants and the render target are rebuilt. Rendering goes through
+# the dummy video driver.
+#
+# The app's MemoryMonitor runs on the simulated clock and samples RSS (and
+# tracemalloc with --mode tracemalloc). The harness prints progress every
+# half hour of simulated time and a report at the end. The baseline is
+# taken after one full tier cycle (1 h), because every tier's sprite
+# variants stay cached once built. The harness exits with status 1 when RSS
+# grew faster than --max-mb-per-hour after the baseline.
+#
+# The quality governor is off: frame costs in simulated time are
+# meaningless. Tiers are cycled instead.
+#
+# Run from the repo root:
+#   python -m benchmarks.soak [--hours 4] [--fps 30] [--size 640x360] [--mode tracemalloc]
+import argparse
+import asyncio
+import math
+import os
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import numpy as np
+
+import config
+from frame_clock import VirtualClock
+from gestures import Gesture
+from hittest import CircleTarget
+from input_backends import InputBackend
+from memory_monitor import MB, MemoryMonitor
+from quality import TIERS
+from samples import HandSample
+
+CAMERA_HZ = 30
+TARGET_SHUFFLE_SECONDS = 60.0
+TIER_CYCLE_SECONDS = 15 * 60.0
+PROGRESS_SECONDS = 30 * 60.0
+
+
+class VirtualTimeLoop(asyncio.SelectorEventLoop):
+    """Event loop on a VirtualClock: with nothing ready to run, time jumps to the next timer."""
+
+    def __init__(self, clock):
+        super().__init__()
+        self.clock = clock
+
+    def time(self):
+        return self.clock.now
+
+    def _run_once(self):
+        if not self._ready:
+            timers = [handle.when() for handle in self._scheduled if not handle.cancelled()]
+            if timers:
+                delay = min(timers) - self.clock.now
+                if delay > 0.0:
+                    self.clock.advance(delay)
+        super()._run_once()
+
+
+class SyntheticBackend(InputBackend):
+    """Scripted hand on the simulated clock: sweep, pinch every 3 s, away 20 s in every 300 s."""
+    name = "synthetic"
+    blocking = False
+    poll_interval = 1.0 / CAMERA_HZ
+
+    def __init__(self, clock, seed=0):
+        super().__init__()
+        self.clock = clock
+        self.rng = np.random.default_rng(seed)
+        self.seq = 0
+        self._next = 0.0
+
+    def process_frame(self):
+        t = self.clock.now
+        self.no_sample = t < self._next
+        if self.no_sample:
+            return None, None
+        self._next = t + 1.0 / CAMERA_HZ
+        self.seq += 1
+
+        frame = np.empty((config.CAMERA_HEIGHT, config.CAMERA_WIDTH, 3), np.uint8)  # like cvtColor
+        present = t % 300.0 < 280.0
+        jitter = self.rng.normal(0.0, 0.002, 2)
+        sample = HandSample(
+            t=t,
+            seq=self.seq,
+            x=0.5 + 0.3 * math.sin(t * 2 * math.pi / 7.3) + jitter[0],
+            y=0.5 + 0.25 * math.sin(t * 2 * math.pi / 5.1) + jitter[1],
+            present=present,
+            confidence=0.95 if present else 0.0,
+            gestures=Gesture.PINCH if present and t % 3.0 < 1.2 else Gesture.NONE,
+        )
+        return frame, self._detected(sample)
+
+
+def shuffle_targets(app, rng):
+    app.targets.clear()
+    w, h = config.DISPLAY_WIDTH, config.DISPLAY_HEIGHT
+    for i in range(6):
+        center = (float(rng.uniform(0, w)), float(rng.uniform(0, h)))
+        app.targets.insert(CircleTarget(i, center, min(w, h) * 0.1, correct=i % 2 == 0))
+
+
+def scenario(app, clock, seconds, result):
+    """Background task: targets, tier cycling, progress; stops the app after `seconds`."""
+    async def run():
+        rng = np.random.default_rng(1)
+        monitor = app.memory
+        next_targets = next_tier = next_progress = 0.0
+        tier = 0
+        start = time.perf_counter()
+
+        while clock.now < seconds:
+            now = clock.now
+            if now >= next_targets:
+                next_targets = now + TARGET_SHUFFLE_SECONDS
+                shuffle_targets(app, rng)
+            if now >= next_tier:
+                next_tier = now + TIER_CYCLE_SECONDS
+                app.apply_quality(TIERS[tier % len(TIERS)])
+                tier += 1
+            if now >= next_progress:
+                next_progress = now + PROGRESS_SECONDS
+                traced = f"  traced {monitor.traced / MB:7.1f} MB" if monitor.traced is not None else ""
+                print(f"  {now / 3600.0:5.2f} h simulated  {time.perf_counter() - start:7.1f} s real  "
+                      f"rss {(monitor.rss or 0) / MB:7.1f} MB  growth {monitor.growth / MB:+6.1f} MB{traced}",
+                      flush=True)
+            await asyncio.sleep(min(next_targets, next_tier, next_progress, seconds) - now)
+
+        monitor.poll(clock.now)
+        if monitor.tracing:
+            monitor.snapshot(clock.now)
+        result["frames"] = app.frame_clock.frame
+        result["real"] = time.perf_counter() - start
+        app.running = False
+    return run
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--hours", type=float, default=4.0, help="simulated hours")
+    parser.add_argument("--fps", type=int, default=30, help="simulated frame rate")
+    parser.add_argument("--size", default="640x360", help="display size")
+    parser.add_argument("--mode", choices=("rss", "tracemalloc"), default="rss")
+    parser.add_argument("--max-mb-per-hour", type=float, default=1.0)
+    args = parser.parse_args()
+    warmup = TIER_CYCLE_SECONDS * len(TIERS)  # every tier's sprites built once
+    if args.hours * 3600.0 <= warmup * 1.5:
+        parser.error(f"--hours must be above {warmup * 1.5 / 3600.0:g} (warm-up is {warmup / 3600.0:g} h)")
+
+    config.DISPLAY_WIDTH, config.DISPLAY_HEIGHT = (int(v) for v in args.size.split("x"))
+    config.TARGET_FPS = args.fps
+    config.TELEMETRY_ENABLED = True
+    config.TELEMETRY_SINK = "jsonl"
+    config.TELEMETRY_PATH = os.path.join(tempfile.mkdtemp(prefix="soak-"), "telemetry.jsonl")
+    config.TEST_MODE = False
+    config.QUALITY_ENABLED = False
+    from app import App
+
+    clock = VirtualClock()  # moved by the event loop, not by ticks
+    backend = SyntheticBackend(clock)
+    monitor = MemoryMonitor(mode=args.mode, source=clock.time, rss_interval=10.0,
+                            snapshot_interval=600.0, baseline_after=warmup)
+    app = App(backend=backend, clock=clock, memory=monitor)
+    result = {}
+    app.add_background_task(scenario(app, clock, args.hours * 3600.0, result))
+
+    print(f"soak: {args.hours:g} h simulated at {args.fps} fps, "
+          f"{config.DISPLAY_WIDTH}x{config.DISPLAY_HEIGHT}, monitor {args.mode}, "
+          f"telemetry {config.TELEMETRY_PATH}")
+    loop = VirtualTimeLoop(clock)
+    asyncio.set_event_loop(loop)
+    try:
+        loop.run_until_complete(app.run())
+        loop.run_until_complete(loop.shutdown_default_executor())
+    finally:
+        asyncio.set_event_loop(None)
+        loop.close()
+
+    frames, real = result["frames"], result["real"]
+    print(f"{frames} frames in {real:.0f} s real ({frames / real:.0f} fps, "
+          f"{args.hours * 3600.0 / real:.0f}x real time)")
+    rate = monitor.growth_rate() / MB
+
+    if rate > args.max_mb_per_hour:
+        print(f"FAIL: RSS grows {rate:+.2f} MB/h (limit {args.max_mb_per_hour:g})")
+        return 1
+    print(f"ok: RSS {rate:+.2f} MB/h (limit {args.max_mb_per_hour:g})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
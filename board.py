@@ -0,0 +1,81 @@
+# board.py — A ready Level's objects as on-screen hit-test targets
+#
+# Each level entry in level_data.json may list its objects:
+#
+#   "targets": [{"image": "apple.png", "pos": [0.3, 0.5], "correct": true}, ...]
+#
+# pos is the object's centre in normalised display coordinates. Levels
+# without "targets" get OBJECTS_PER_LEVEL of their images at random,
+# non-overlapping spots; the images named in "correct" (default: the first
+# image) are the ones to pick. Objects with an image become pixel-exact
+# MaskTargets; missing images fall back to a circle so the level stays
+# playable. Target ids are (level index, object index).
+import random
+
+import pygame
+import config
+from hittest import CircleTarget, MaskTarget
+
+FALLBACK_RADIUS = 40
+FALLBACK_COLORS = {True: (90, 200, 120), False: (200, 90, 90)}
+PLACEMENT_TRIES = 50
+
+
+def _layout(level, rng):
+    """[(image name or None, (u, v), correct)] for a level without explicit targets."""
+    images = level.images or [None]
+    correct = set(level.data.get("correct", images[:1]))
+    lo, hi = config.OBJECTS_PER_LEVEL
+    count = rng.randint(lo, hi)
+
+    w, h = config.DISPLAY_WIDTH, config.DISPLAY_HEIGHT
+    spacing = 2.5 * FALLBACK_RADIUS
+    placed = []
+    for i in range(count):
+        for _ in range(PLACEMENT_TRIES):
+            u, v = rng.uniform(0.1, 0.9), rng.uniform(0.15, 0.9)
+            if all((u - pu) ** 2 * w * w + (v - pv) ** 2 * h * h >= spacing * spacing
+                   for pu, pv in placed):
+                break
+        placed.append((u, v))
+    # the first object is always a correct one, so every level can be finished
+    names = [images[0]] + [images[rng.randrange(len(images))] for _ in range(count - 1)]
+    return [(name, pos, name in correct) for name, pos in zip(names, placed)]
+
+
+def build_targets(level, assets, rng=None):
+    """Hit-test targets for a ready level; target.data is the surface to draw (or None)."""
+    rng = rng or random.Random(level.index)
+    entries = level.data.get("targets")
+    if entries is None:
+        layout = _layout(level, rng)
+    else:
+        layout = [(e.get("image"), tuple(e["pos"]), bool(e.get("correct", False))) for e in entries]
+
+    w, h = config.DISPLAY_WIDTH, config.DISPLAY_HEIGHT
+    targets = []
+    for i, (name, (u, v), correct) in enumerate(layout):
+        target_id = (level.index, i)
+        cx, cy = u * w, v * h
+        surface = assets.image(name) if name else None
+        if surface is not None:
+            sw, sh = surface.get_size()
+            topleft = (int(cx - sw / 2), int(cy - sh / 2))
+            target = MaskTarget(target_id, topleft, pygame.mask.from_surface(surface),
+                                correct=correct, z=i, data=surface)
+        else:
+            target = CircleTarget(target_id, (cx, cy), FALLBACK_RADIUS, correct=correct, z=i)
+        targets.append(target)
+    return targets
+
+
+def draw_targets(surface, targets, hovered=None):
+    for target in targets:
+        if target.data is not None:
+            surface.blit(target.data, target.bounds[:2])
+        else:
+            center = (round(target.cx), round(target.cy))
+            pygame.draw.circle(surface, FALLBACK_COLORS[target.correct], center, target.radius)
+        if target is hovered:
+            x0, y0, x1, y1 = target.bounds
+            pygame.draw.rect(surface, config.WHITE, (x0, y0, x1 - x0, y1 - y0), 2)
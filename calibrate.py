@@ -0,0 +1,122 @@
+# calibrate.py — Interactive camera-to-screen calibration
+#
+# Point at each on-screen target and hold a pinch until it turns green.
+# The fitted transform is written to config.CALIBRATION_PATH and picked up
+# by main.py on the next start.
+import threading
+import queue
+
+import pygame
+import config
+
+from hand_cursor_tracker import HandCursorTracker
+from calibration import Calibration
+from frame_clock import FrameClock
+
+TARGETS = [(x, y) for y in (0.1, 0.5, 0.9) for x in (0.1, 0.5, 0.9)]
+
+
+# --------------------------------------------
+# THREAD: HAND TRACKING
+# --------------------------------------------
+sample_queue = queue.Queue(maxsize=1)
+
+
+def tracking_loop():
+    tracker = HandCursorTracker()
+    tracker.warm_up()
+
+    while True:
+        frame, sample = tracker.process_frame()
+        if frame is None or sample is None:
+            continue
+
+        try:
+            sample_queue.get_nowait()
+        except queue.Empty:
+            pass
+        sample_queue.put(sample)
+
+
+def main():
+    pygame.init()
+    screen = pygame.display.set_mode((config.DISPLAY_WIDTH, config.DISPLAY_HEIGHT), pygame.DOUBLEBUF)
+    pygame.display.set_caption("Calibration")
+    font = pygame.font.Font(None, 36)
+    clock = pygame.time.Clock()
+    frame_clock = FrameClock()
+
+    threading.Thread(target=tracking_loop, daemon=True).start()
+
+    cam_points = []
+    collected = []
+    pinch_started = None
+    waiting_release = False
+    pinched = False
+
+    running = True
+    while running and len(cam_points) < len(TARGETS):
+        now = frame_clock.tick()
+
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT or (event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE):
+                running = False
+
+        try:
+            sample = sample_queue.get_nowait()
+            u, v, pinched = sample.x, sample.y, sample.pinched
+            if pinched and not waiting_release:
+                if pinch_started is None:
+                    pinch_started = now
+                    collected = []
+                collected.append((u, v))
+        except queue.Empty:
+            pass
+
+        if not pinched:
+            pinch_started = None
+            waiting_release = False
+
+        # target done → average the held samples
+        if pinch_started is not None and now - pinch_started >= config.CALIBRATION_HOLD_SECONDS:
+            xs, ys = zip(*collected)
+            cam_points.append((sum(xs) / len(xs), sum(ys) / len(ys)))
+            pinch_started = None
+            waiting_release = True
+
+        # draw
+        screen.fill((0, 0, 0))
+        if len(cam_points) < len(TARGETS):
+            tx, ty = TARGETS[len(cam_points)]
+            pos = (int(tx * config.DISPLAY_WIDTH), int(ty * config.DISPLAY_HEIGHT))
+            progress = 0.0 if pinch_started is None else (now - pinch_started) / config.CALIBRATION_HOLD_SECONDS
+            color = config.CURSOR_COLOR_GREEN if progress >= 1.0 else config.YELLOW
+            pygame.draw.circle(screen, color, pos, 30, 4)
+            pygame.draw.circle(screen, color, pos, max(1, int(26 * min(progress, 1.0))))
+
+        label = font.render(
+            f"Point at the target and hold a pinch  ({len(cam_points)}/{len(TARGETS)})",
+            True, config.WHITE)
+        screen.blit(label, label.get_rect(center=(config.DISPLAY_WIDTH // 2, 40)))
+
+        pygame.display.flip()
+        clock.tick(60)
+
+    pygame.quit()
+
+    if len(cam_points) < len(TARGETS):
+        print("Calibration aborted.")
+        return
+
+    calib = Calibration.fit(cam_points, TARGETS, model=config.CALIBRATION_MODEL,
+                            response_gamma=config.POINTER_RESPONSE_GAMMA)
+    calib.save()
+
+    print(f"Saved {config.CALIBRATION_PATH}")
+    print(f"RMS mapping error: {calib.error:.1f} px")
+    for corner, (u, v, ok) in calib.reachability().items():
+        print(f"  {corner:<13} camera ({u:5.2f}, {v:5.2f})  {'reachable' if ok else 'OUT OF VIEW'}")
+
+
+if __name__ == "__main__":
+    main()
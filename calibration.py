@@ -0,0 +1,267 @@
+# calibration.py — Camera-to-screen mapping (affine / homography + response curve)
+#                  and velocity-based pointer acceleration
+#
+# Camera positions come in normalised (0..1) camera coordinates. A 3x3 matrix
+# maps them to normalised screen coordinates, an optional response curve bends
+# motion around the screen centre, and the result is scaled to pixels.
+#
+# The response curve (POINTER_RESPONSE_GAMMA) depends on position only: it is
+# a static warp of the screen, not acceleration. PointerAcceleration is the
+# velocity-dependent part: it scales each movement of the mapped position by a
+# gain looked up from the smoothed hand speed, so slow motion is finer than the
+# absolute mapping and fast motion covers more of the screen.
+import json
+import math
+import os
+
+import numpy as np
+import config
+
+_LUT_SIZE = 1025
+_GAIN_LUT_SIZE = 257
+
+
+class Calibration:
+    def __init__(self, matrix=None, response_gamma=1.0, screen_size=None, error=None):
+        self.matrix = np.eye(3) if matrix is None else np.asarray(matrix, dtype=np.float64)
+        self.response_gamma = float(response_gamma)
+        self.screen_size = screen_size or (config.DISPLAY_WIDTH, config.DISPLAY_HEIGHT)
+        self.error = error  # RMS fit error in screen pixels (None if not fitted)
+
+        self._precompute()
+
+    # ---------------------------------------------------------
+    # CONSTRUCTION
+    # ---------------------------------------------------------
+    @classmethod
+    def from_margins(cls, margin_x=None, margin_y=None, **kwargs):
+        """Equivalent of the old fixed rectangular crop + linear scale."""
+        mx = config.CAMERA_MARGIN_X if margin_x is None else margin_x
+        my = config.CAMERA_MARGIN_Y if margin_y is None else margin_y
+        sx = 1.0 / (1.0 - 2 * mx)
+        sy = 1.0 / (1.0 - 2 * my)
+        matrix = [
+            [sx, 0.0, -mx * sx],
+            [0.0, sy, -my * sy],
+            [0.0, 0.0, 1.0],
+        ]
+        return cls(matrix, **kwargs)
+
+    @classmethod
+    def fit(cls, cam_points, screen_points, model="homography", **kwargs):
+        """
+        Fit cam_points (normalised camera) -> screen_points (normalised screen).
+        model: "affine" (>= 3 points) or "homography" (>= 4 points).
+        """
+        cam = np.asarray(cam_points, dtype=np.float64)
+        scr = np.asarray(screen_points, dtype=np.float64)
+
+        if model == "affine":
+            if len(cam) < 3:
+                raise ValueError("affine calibration needs at least 3 points")
+            A = np.column_stack([cam, np.ones(len(cam))])
+            sol, *_ = np.linalg.lstsq(A, scr, rcond=None)
+            matrix = np.vstack([sol.T, [0.0, 0.0, 1.0]])
+        elif model == "homography":
+            if len(cam) < 4:
+                raise ValueError("homography calibration needs at least 4 points")
+            matrix = _fit_homography(cam, scr)
+        else:
+            raise ValueError(f"unknown calibration model: {model!r}")
+
+        calib = cls(matrix, **kwargs)
+        w, h = calib.screen_size
+        residual = (calib._project(cam) - scr) * (w, h)
+        calib.error = float(np.sqrt(np.mean(np.sum(residual ** 2, axis=1))))
+        return calib
+
+    @classmethod
+    def load(cls, path=None, **kwargs):
+        path = path or config.CALIBRATION_PATH
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        kwargs.setdefault("response_gamma", data.get("response_gamma", config.POINTER_RESPONSE_GAMMA))
+        return cls(data["matrix"], error=data.get("error"), **kwargs)
+
+    @classmethod
+    def load_or_default(cls, path=None, **kwargs):
+        """Calibration file if present, otherwise the CAMERA_MARGIN_X/Y crop."""
+        try:
+            return cls.load(path, **kwargs)
+        except (OSError, ValueError, KeyError):
+            kwargs.setdefault("response_gamma", config.POINTER_RESPONSE_GAMMA)
+            return cls.from_margins(**kwargs)
+
+    def save(self, path=None):
+        path = path or config.CALIBRATION_PATH
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({
+                "matrix": self.matrix.tolist(),
+                "response_gamma": self.response_gamma,
+                "error": self.error,
+            }, f, indent=2)
+
+    # ---------------------------------------------------------
+    # HOT PATH
+    # ---------------------------------------------------------
+    def _precompute(self):
+        # Screen scale folded into the matrix -> one multiply per sample
+        w, h = self.screen_size
+        self._inv = np.linalg.inv(self.matrix)
+
+        if self.response_gamma != 1.0:
+            grid = np.linspace(-1.0, 1.0, _LUT_SIZE)
+            self._lut_grid = grid
+            self._lut = np.sign(grid) * np.abs(grid) ** self.response_gamma
+            self._screen_matrix = self.matrix
+            self._scale = np.array([w, h], dtype=np.float64)
+        else:
+            self._lut = None
+            self._screen_matrix = np.diag([w, h, 1.0]) @ self.matrix
+            self._scale = None
+
+    def _project(self, points):
+        p = points @ self.matrix[:, :2].T + self.matrix[:, 2]
+        return p[:, :2] / p[:, 2:3]
+
+    def map_many(self, points):
+        """points: (N, 2) normalised camera coords -> (N, 2) clamped screen pixels."""
+        points = np.asarray(points, dtype=np.float64)
+        p = points @ self._screen_matrix[:, :2].T + self._screen_matrix[:, 2]
+        out = p[:, :2] / p[:, 2:3]
+
+        w, h = self.screen_size
+        if self._lut is not None:
+            d = np.clip(out * 2.0 - 1.0, -1.0, 1.0)
+            out = (np.interp(d, self._lut_grid, self._lut) + 1.0) * 0.5 * self._scale
+        return np.clip(out, 0.0, (w, h))
+
+    def map(self, u, v):
+        """Single normalised camera point -> (x, y) screen pixels."""
+        x, y = self.map_many(((u, v),))[0]
+        return float(x), float(y)
+
+    # ---------------------------------------------------------
+    # REPORTING
+    # ---------------------------------------------------------
+    def reachability(self):
+        """
+        Camera position needed for each screen corner and whether it lies
+        inside the camera frame. Returns {corner: (u, v, reachable)}.
+        """
+        corners = {
+            "top_left": (0.0, 0.0),
+            "top_right": (1.0, 0.0),
+            "bottom_left": (0.0, 1.0),
+            "bottom_right": (1.0, 1.0),
+        }
+        pts = np.array(list(corners.values()))
+        p = pts @ self._inv[:, :2].T + self._inv[:, 2]
+        cam = p[:, :2] / p[:, 2:3]
+
+        report = {}
+        for name, (u, v) in zip(corners, cam):
+            report[name] = (float(u), float(v), bool(0.0 <= u <= 1.0 and 0.0 <= v <= 1.0))
+        return report
+
+
+class PointerAcceleration:
+    """
+    Gain curve on the smoothed speed of the mapped position (screen px/s):
+    POINTER_ACCEL_LOW_GAIN below POINTER_ACCEL_LOW_SPEED, POINTER_ACCEL_HIGH_GAIN
+    above POINTER_ACCEL_HIGH_SPEED, smoothstep in between (precomputed LUT).
+
+    A relative gain lets the cursor drift off the absolute position under the
+    hand. The drift is pulled back only in proportion to how fast the hand
+    moves (POINTER_ACCEL_RESYNC_SECONDS at full speed), so slow precise work is
+    left alone and the next quick sweep re-synchronises.
+    """
+
+    def __init__(self, low_speed=None, high_speed=None, low_gain=None, high_gain=None,
+                 smoothing=None, resync_seconds=None, screen_size=None):
+        self.low_speed = config.POINTER_ACCEL_LOW_SPEED if low_speed is None else low_speed
+        self.high_speed = config.POINTER_ACCEL_HIGH_SPEED if high_speed is None else high_speed
+        self.low_gain = config.POINTER_ACCEL_LOW_GAIN if low_gain is None else low_gain
+        self.high_gain = config.POINTER_ACCEL_HIGH_GAIN if high_gain is None else high_gain
+        self.smoothing = smoothing or config.POINTER_ACCEL_SMOOTHING
+        self.resync_seconds = resync_seconds or config.POINTER_ACCEL_RESYNC_SECONDS
+        self.screen_size = screen_size or (config.DISPLAY_WIDTH, config.DISPLAY_HEIGHT)
+        if not 0.0 <= self.low_speed < self.high_speed:
+            raise ValueError("POINTER_ACCEL_LOW_SPEED must be below POINTER_ACCEL_HIGH_SPEED")
+
+        speeds = np.linspace(0.0, self.high_speed, _GAIN_LUT_SIZE)
+        s = np.clip((speeds - self.low_speed) / (self.high_speed - self.low_speed), 0.0, 1.0)
+        self._gain_lut = self.low_gain + (self.high_gain - self.low_gain) * s * s * (3.0 - 2.0 * s)
+        self._lut_scale = (_GAIN_LUT_SIZE - 1) / self.high_speed
+
+        self.reset()
+
+    def reset(self):
+        """Forget motion history (hand lost): the next update starts on the absolute position."""
+        self.x = self.y = None
+        self.speed = 0.0
+        self._last = None  # (x, y, t) of the previous absolute position
+
+    def gain(self, speed):
+        return float(self._gain_lut[min(int(speed * self._lut_scale), _GAIN_LUT_SIZE - 1)])
+
+    def update(self, x, y, t):
+        """Absolute mapped position (px) at sample time t -> accelerated position (px)."""
+        if self._last is None:
+            self.x, self.y = x, y
+            self._last = (x, y, t)
+            return x, y
+
+        lx, ly, lt = self._last
+        dt = t - lt
+        if dt <= 0.0:
+            return self.x, self.y
+        self._last = (x, y, t)
+
+        dx, dy = x - lx, y - ly
+        self.speed += (math.hypot(dx, dy) / dt - self.speed) * (1.0 - math.exp(-dt / self.smoothing))
+        g = self.gain(self.speed)
+        nx, ny = self.x + g * dx, self.y + g * dy
+
+        fast = min(max((self.speed - self.low_speed) / (self.high_speed - self.low_speed), 0.0), 1.0)
+        pull = fast * (1.0 - math.exp(-dt / self.resync_seconds))
+        nx += (x - nx) * pull
+        ny += (y - ny) * pull
+
+        w, h = self.screen_size
+        self.x = min(max(nx, 0.0), w)
+        self.y = min(max(ny, 0.0), h)
+        return self.x, self.y
+
+
+def _fit_homography(src, dst):
+    """Direct linear transform with Hartley normalisation."""
+    def normaliser(pts):
+        mean = pts.mean(axis=0)
+        scale = np.sqrt(2) / max(np.mean(np.linalg.norm(pts - mean, axis=1)), 1e-12)
+        return np.array([
+            [scale, 0.0, -scale * mean[0]],
+            [0.0, scale, -scale * mean[1]],
+            [0.0, 0.0, 1.0],
+        ])
+
+    Ts, Td = normaliser(src), normaliser(dst)
+    s = src @ Ts[:2, :2].T + Ts[:2, 2]
+    d = dst @ Td[:2, :2].T + Td[:2, 2]
+
+    n = len(s)
+    A = np.zeros((2 * n, 9))
+    A[0::2, 0:2] = s
+    A[0::2, 2] = 1.0
+    A[0::2, 6:8] = -s * d[:, 0:1]
+    A[0::2, 8] = -d[:, 0]
+    A[1::2, 3:5] = s
+    A[1::2, 5] = 1.0
+    A[1::2, 6:8] = -s * d[:, 1:2]
+    A[1::2, 8] = -d[:, 1]
+
+    _, _, vt = np.linalg.svd(A)
+    H = vt[-1].reshape(3, 3)
+    H = np.linalg.inv(Td) @ H @ Ts
+    return H / H[2, 2]
@@ -9,32 +9,91 @@ SOUNDS_DIR = os.path.join(ASSETS_DIR, "sounds")
 FONTS_DIR = os.path.join(ASSETS_DIR, "fonts")
 DATA_DIR = os.path.join(BASE_DIR, "data")
 LEVEL_DATA_PATH = os.path.join(DATA_DIR, "level_data.json")
+SESSIONS_DIR = os.path.join(DATA_DIR, "sessions")  # batch_extract.py output
+CACHE_DIR = os.path.join(BASE_DIR, "cache")
 
 # ----- Display -----
 DISPLAY_WIDTH = 1920
 DISPLAY_HEIGHT = 1080
 FULLSCREEN = False
-TARGET_FPS = 144
+TARGET_FPS = 144          # stands in for the display refresh rate
+IDLE_FPS = 30             # render rate once nothing has moved for a while
+IDLE_AFTER_SECONDS = 5.0
+PACER_SPIN_SECONDS = 0.0015  # spin-wait budget at the end of each frame sleep
+RENDER_WIDTH = None       # internal scene resolution (upscaled to the display);
+RENDER_HEIGHT = None      # None = display size. e.g. 1920 x 1080 on a 4K panel
+RENDER_SMOOTH = False     # bilinear smoothscale instead of nearest-neighbour scale
 
 # ----- Camera / Tracking -----
 CAMERA_WIDTH = 640
 CAMERA_HEIGHT = 480
 PROCESS_EVERY_N_FRAMES = 2  # process every Nth frame
+INPUT_BACKEND = None        # "hand", "pose", "mouse", "replay", "remote"; None = USE_MOUSE / TRACKING_MODE
+REPLAY_PATH = None          # batch_extract.py session folder for the "replay" backend
+TRACKER_ADDRESS = "udp://127.0.0.1:5005"  # tracker_net.py server ("unix:///path" also works)
+TRACKER_PING_SECONDS = 1.0  # client ping / clock-offset refresh interval
+TRACKER_CLIENT_TIMEOUT = 5.0  # server forgets clients silent for this long
+WARMUP_FRAMES = 3           # blank frames run through the model before input is accepted
+INPUT_GATE = "warmed_up"    # readiness needed before the cursor follows input:
+                            # "camera_open", "model_loaded", "warmed_up" or "first_detection"
+                            # (each phase includes the ones before it)
+OPEN_RETRY_SECONDS = 2.0      # backend failed to open (camera unplugged): first retry after this,
+OPEN_RETRY_MAX_SECONDS = 30.0  # doubling up to this
+READ_RETRY_AFTER = 3          # consecutive failed reads before the tracking task backs off,
+READ_RETRY_SECONDS = 0.05     # sleeping this long,
+READ_RETRY_MAX_SECONDS = 1.0  # doubling up to this
+
+# ----- Presence / idle power saving -----
+PRESENCE_ENABLED = True
+PRESENCE_IDLE_AFTER = 5.0   # seconds without a hand before throttling inference
+IDLE_DETECT_HZ = 2          # inference rate while idle (motion check runs every frame)
+MOTION_SIZE = (64, 48)      # downscaled grey image for frame differencing
+MOTION_THRESHOLD = 4.0      # mean abs grey-level difference that counts as motion
 
 # ----- MediaPipe Hands -----
-MP_MODEL_COMPLEXITY = 0
-MP_MIN_DET_CONF = 0.7
+MP_MODEL_COMPLEXITY = 1   # full landmark model (0 = lite)
+MP_MIN_DET_CONF = 0.5
 MP_MIN_TRK_CONF = 0.5
-MP_MAX_HANDS = 1
+MP_MAX_HANDS = 1          # only the first hand drives the cursor
+
+# ----- Tracking continuity -----
+CONTINUITY_DROPOUT_SECONDS = 0.5  # hand lost and found again within this = dropout, not leaving
+PRECONDITION_MODE = "off"         # frames before Hands inference: "off", "gamma" or "auto" (dim rooms)
+PRECONDITION_GAMMA = 0.7          # "gamma" mode; < 1 brightens
+PRECONDITION_DIM_BELOW = 80       # "auto": mean luminance (0..255) below which the LUT engages
+PRECONDITION_TARGET = 110         # "auto": mean luminance after the LUT
+PRECONDITION_CLIP = 1.0           # "auto": % darkest / brightest pixels clipped by the stretch
+PRECONDITION_EVERY = 15           # "auto": frames between luminance measurements
+
+# ----- MediaPipe Pose (TRACKING_MODE = "pose") -----
+TRACKING_MODE = "hand"       # "hand" or "pose"
+POSE_LANDMARK = "wrist"      # "wrist", "index" or "foot"
+POSE_SIDE = "left"           # "left" or "right"
+POSE_MODEL_COMPLEXITY = 0    # 0 = lite, 1 = full, 2 = heavy
+POSE_SMOOTH_LANDMARKS = True
+POSE_MIN_DET_CONF = 0.5
+POSE_MIN_TRK_CONF = 0.5
+POSE_MIN_VISIBILITY = 0.5
 
 # ----- Gesture thresholds -----
-PINCH_DISTANCE_THRESHOLD = 0.05  # normalized coords
-PINCH_DEBOUNCE_SECONDS = 0.3
+GESTURE_PINCH_RATIO = 0.35       # thumb-index tip distance / hand size
+GESTURE_EXTENDED_RATIO = 1.15    # tip-to-wrist / pip-to-wrist above this = finger extended...
+GESTURE_STRAIGHT_COS = -0.7      # ...and cos(MCP-PIP-TIP angle) below this (straighter than ~135°)
+GESTURE_SPREAD_RATIO = 0.25      # mean neighbouring fingertip gap / hand size for an open palm
+GESTURE_SWIPE_SPEED = 6.0        # hand sizes per second
+GESTURE_SWIPE_WINDOW = 0.25      # seconds of wrist history for swipe detection
+GESTURE_DEBOUNCE_FRAMES = 3      # consecutive camera frames to start / end a pose
 
 # ----- Gameplay -----
 OBJECTS_PER_LEVEL = (5, 8)
+HIT_GRID_CELL = 128        # px, spatial index cell size
+HIT_DWELL_SECONDS = 0.8    # hover time that counts as a dwell selection
 LEVEL_COMPLETE_DELAY = 2.0
 
+# ----- Asset loading -----
+ASSET_MEMORY_BUDGET = 256 * 1024 * 1024   # bytes of decoded surfaces + sounds
+ASSET_PUMP_BUDGET = 0.002                 # seconds of convert_alpha() per frame
+
 # ----- Colors -----
 WHITE = (255, 255, 255)
 BLACK = (0, 0, 0)
@@ -43,7 +102,7 @@ RED = (220, 80, 80)
 YELLOW = (255, 220, 80)
 UI_BG = (20, 20, 20)
 
-USE_MOUSE = False   # or False for hand-tracking mode
+USE_MOUSE = False   # True = mouse input backend (no camera, no MediaPipe)
 
 TEST_MODE = True
 
@@ -57,3 +116,85 @@ CURSOR_COLOR_YELLOW = (255, 255, 51, 200)
 
 CAMERA_MARGIN_X = 0.20   # 20% margin on left/right
 CAMERA_MARGIN_Y = 0.20   # 20% margin on top/bottom
+
+# ----- Cursor asset cache -----
+CURSOR_CACHE_ENABLED = True
+CURSOR_CACHE_DIR = os.path.join(CACHE_DIR, "cursor")
+CURSOR_CACHE_MAX_FILES = 64  # least recently used entries beyond this are removed
+CURSOR_ARC_STEP = 3   # degrees between pre-rendered arc frames
+CURSOR_SUBPIXEL_PHASES = 4   # NxN pre-shifted idle ring sprites (1 = integer snapping)
+
+# ----- Quality governor -----
+QUALITY_ENABLED = True
+QUALITY_START_TIER = "high"     # "high", "medium", "low" or "minimal" (quality.TIERS)
+QUALITY_WINDOW = 30             # presented frames per evaluation
+QUALITY_PERCENTILE = 95         # frame-cost percentile compared to the budget
+QUALITY_DEGRADE_AT = 0.85       # percentile / (1 / TARGET_FPS) above this → tier down
+QUALITY_UPGRADE_AT = 0.5        # below this for QUALITY_UPGRADE_HOLD seconds → tier up
+QUALITY_UPGRADE_HOLD = 3.0
+QUALITY_UPGRADE_HOLD_MAX = 60.0 # hold doubles after each upgrade that had to be undone
+QUALITY_MIN_DWELL = 1.0         # seconds between tier changes
+
+# ----- Cursor animation -----
+CURSOR_DWELL_MS = 800            # pinch-hold time for the arc to close (frame-rate independent)
+CURSOR_DWELL_EASING = "linear"   # any name in tween.EASINGS
+
+# ----- Smoothing -----
+SMOOTHER_DEAD_ZONE = 4   # px; input keeps float precision end to end
+SMOOTHER_RESPONSIVENESS = 2.0   # x the original smoothing rates; the fused anchor's lower
+                                # noise pays for the shorter lag (benchmarks/bench_anchor.py)
+
+# ----- Cursor anchor -----
+CURSOR_ANCHOR = "fused"          # "fused" (anchor.py: wrist + MCPs + palm centroid) or "index_mcp"
+ANCHOR_PINCH_OPEN = 0.8          # tip gap / hand size where weights start sliding to the pinch set
+ANCHOR_RECENTER_SECONDS = 0.3    # open hand: time constant back onto the absolute anchor
+
+# ----- Calibration -----
+CALIBRATION_PATH = os.path.join(DATA_DIR, "calibration.json")
+CALIBRATION_MODEL = "homography"   # "affine" or "homography"
+CALIBRATION_HOLD_SECONDS = 0.6     # pinch-hold per on-screen target
+POINTER_RESPONSE_GAMMA = 1.0       # position response curve (not acceleration): >1 = finer near centre, 1 = linear
+
+# ----- Pointer acceleration (velocity-based gain, calibration.PointerAcceleration) -----
+POINTER_ACCEL_ENABLED = False
+POINTER_ACCEL_LOW_SPEED = 150.0     # px/s; at or below: POINTER_ACCEL_LOW_GAIN
+POINTER_ACCEL_HIGH_SPEED = 1500.0   # px/s; at or above: POINTER_ACCEL_HIGH_GAIN
+POINTER_ACCEL_LOW_GAIN = 0.5        # slow hand -> half-size cursor steps (precision)
+POINTER_ACCEL_HIGH_GAIN = 1.0
+POINTER_ACCEL_SMOOTHING = 0.05      # seconds, time constant of the speed estimate
+POINTER_ACCEL_RESYNC_SECONDS = 0.2  # at full speed: time constant back onto the absolute position
+
+# ----- Profiling -----
+PROFILE_HOTKEY = "f9"               # pygame key name; SIGUSR1 also toggles on POSIX
+PROFILE_INTERVAL = 0.005            # seconds between stack samples (200 Hz)
+PROFILE_MAX_SECONDS = 300.0         # sampling stops after this (0 = no limit)
+PROFILE_DIR = os.path.join(DATA_DIR, "profiles")
+
+# ----- Memory monitoring -----
+MEMORY_MONITOR = "rss"              # None, "rss" (always-on) or "tracemalloc" (+ per-module growth, slower)
+MEMORY_RSS_SECONDS = 10.0           # RSS sample interval
+MEMORY_SNAPSHOT_SECONDS = 600.0     # tracemalloc snapshot interval
+MEMORY_TRACE_FRAMES = 1             # traceback depth kept per traced allocation
+MEMORY_BASELINE_AFTER = 120.0       # warm-up (caches, model, first level) before growth is counted
+MEMORY_ALERT_MB = 64                # alert at every this many MB of RSS growth over the baseline
+
+# ----- Telemetry -----
+UNIT_ID = os.environ.get("HANDCURSOR_UNIT_ID", "dev")
+TELEMETRY_ENABLED = True
+TELEMETRY_SINK = "jsonl"            # "jsonl" or "statsd"
+TELEMETRY_FLUSH_SECONDS = 10.0
+TELEMETRY_PATH = os.path.join(DATA_DIR, "telemetry", "telemetry.jsonl")
+TELEMETRY_MAX_BYTES = 5 * 1024 * 1024
+TELEMETRY_BACKUPS = 3
+TELEMETRY_STATSD_HOST = "127.0.0.1"
+TELEMETRY_STATSD_PORT = 8125
+
+# ----- Effects -----
+PARTICLE_CAPACITY = 5120          # live particles; draw cost grows ~0.5 us each (bench_particles)
+PARTICLE_SPAWN_CAP = 512          # max new particles per frame
+PARTICLE_GRAVITY = 400.0          # px/s^2
+PARTICLE_DRAG = 2.0               # 1/s
+EFFECT_CORRECT_PARTICLES = 120
+EFFECT_WRONG_PARTICLES = 60
+EFFECT_SHAKE_PIXELS = 8
+EFFECT_SHAKE_SECONDS = 0.35
@@ -0,0 +1,97 @@
+# continuity.py — Tracking-loss / palm re-detection accounting
+#
+# MediaPipe Hands in video mode runs the expensive palm detector only when it
+# has no hand to track: on the frame after a loss (landmark confidence below
+# min_tracking_confidence) and on every frame while nothing is found. The
+# solution API does not say which path a frame took, so it is inferred from
+# the previous frame: no hand last frame → this frame ran the detector.
+#
+# Per processed frame: detector run or tracked, inference time for each, and
+# loss → reacquisition gaps. A gap no longer than CONTINUITY_DROPOUT_SECONDS
+# counts as a dropout (occlusion, motion blur) rather than the hand leaving.
+import time
+
+import config
+from histogram import Histogram, linear_edges
+
+
+class TrackingContinuity:
+    def __init__(self, dropout_seconds=None, source=time.perf_counter):
+        self.dropout_seconds = dropout_seconds or config.CONTINUITY_DROPOUT_SECONDS
+        self._source = source
+        self.started = source()
+
+        self.frames = 0
+        self.present_frames = 0
+        self.detector_runs = 0
+        self.losses = 0        # hand tracked → not found
+        self.reacquired = 0
+        self.dropouts = 0      # reacquired within dropout_seconds
+
+        self.detect_time = Histogram(linear_edges(0.0, 0.100, 0.0005))  # inference, detector frames (s)
+        self.track_time = Histogram(linear_edges(0.0, 0.100, 0.0005))   # inference, tracked frames (s)
+        self.gaps = Histogram(linear_edges(0.0, 5.0, 0.05))             # loss → reacquired (s)
+
+        self._tracking = False
+        self._lost_at = None
+        self._drained = (0, 0, 0, 0)
+
+    def update(self, present, inference_seconds=None, now=None):
+        """One inferred frame: was a hand found, and how long did inference take."""
+        now = self._source() if now is None else now
+        self.frames += 1
+
+        if self._tracking:
+            hist = self.track_time
+        else:
+            hist = self.detect_time
+            self.detector_runs += 1
+        if inference_seconds is not None:
+            hist.add(inference_seconds)
+
+        if present:
+            self.present_frames += 1
+            if not self._tracking and self._lost_at is not None:
+                gap = now - self._lost_at
+                self.gaps.add(gap)
+                self.reacquired += 1
+                if gap <= self.dropout_seconds:
+                    self.dropouts += 1
+                self._lost_at = None
+        elif self._tracking:
+            self.losses += 1
+            self._lost_at = now
+        self._tracking = present
+
+    def drain(self):
+        """Counts since the last drain: (detector_runs, losses, dropouts, frames) for telemetry."""
+        totals = (self.detector_runs, self.losses, self.dropouts, self.frames)
+        delta = tuple(a - b for a, b in zip(totals, self._drained))
+        self._drained = totals
+        return delta
+
+    def per_minute(self, count, now=None):
+        now = self._source() if now is None else now
+        minutes = max(now - self.started, 1e-9) / 60.0
+        return count / minutes
+
+    @property
+    def dropout_rate(self):
+        """Share of losses that were brief dropouts, not the hand leaving."""
+        return self.dropouts / self.losses if self.losses else 0.0
+
+    def report(self, now=None):
+        now = self._source() if now is None else now
+        detect_share = self.detector_runs / self.frames if self.frames else 0.0
+        lines = [f"continuity   frames={self.frames} hand={self.present_frames} "
+                 f"detector runs={self.detector_runs} ({detect_share * 100.0:.0f}%, "
+                 f"{self.per_minute(self.detector_runs, now):.0f}/min) "
+                 f"losses={self.losses} ({self.per_minute(self.losses, now):.1f}/min) "
+                 f"dropouts={self.dropouts} ({self.dropout_rate * 100.0:.0f}% of losses)"]
+        # replayed sessions have no inference times
+        if self.detect_time.count or self.track_time.count:
+            lines.append(f"  detect     {self.detect_time.summary()}")
+            lines.append(f"  track      {self.track_time.summary()}")
+        if self.gaps.count:
+            lines.append(f"  gap        {self.gaps.summary()}")
+        return "\n".join(lines)
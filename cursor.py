@@ -1,135 +1,252 @@
 import pygame
 import math
 import time
+import config
+from subpixel import SubpixelSprite, build_phase_sprites
+from tween import Animator
+
+
+# Idle-ring glow, innermost first: (offset, width, color), a soft falloff
+# over the band the single flat ring used to cover. Quality tiers keep a
+# prefix (high 4, medium 2, low 1, minimal none).
+GLOW_LAYERS = [
+    (4, 14, (255, 255, 150, 85)),
+    (7, 3, (255, 255, 150, 60)),
+    (10, 3, (255, 255, 150, 35)),
+    (13, 3, (255, 255, 150, 15)),
+]
+GLOW_EXTENT = max(offset for offset, _, _ in GLOW_LAYERS)
 
 
 class SmoothCursor:
-    def __init__(self, outer_radius=60, inner_radius=20, speed=5, color=(0, 255, 0)):
+    """
+    Idle ring + pinch arc. Every animation is a duration-based tween track
+    (tween.Animator), so the arc always takes dwell_ms to close, whatever
+    the frame rate.
+    """
+    def __init__(self, outer_radius=60, inner_radius=20, dwell_ms=None, color=(0, 255, 0),
+                 asset_cache=None, clock=None, easing=None):
         self.outer_radius = outer_radius
         self.inner_radius = inner_radius
-        self.speed = speed
+        self.dwell_seconds = (config.CURSOR_DWELL_MS if dwell_ms is None else dwell_ms) / 1000.0
+        self.easing = easing or config.CURSOR_DWELL_EASING
+        self.asset_cache = asset_cache
+        self.clock = clock  # FrameClock / VirtualClock; None -> sample perf_counter
+        self.anim = Animator(clock)
+        self.last_pos = (0, 0)
+        self._closed = False  # arc completed and not yet consumed by a trigger
+
+        # trigger listeners: fn(cursor, now)
+        self._listeners = {"correct": [], "wrong": []}
 
         # Colors
         self.active_color = color
         self.idle_color = (255, 255, 51, 200)
         self.error_color = (255, 0, 0)
 
-        # Animation state
-        self.angle = 360
-        self.animating = False
-
         # Cached surfaces
         self._cached_idle = None
-        self._cached_angle = None
         self._cached_overlay = None
-
-        # Green animation timers
-        self.hold_until = 0
-        self.cooldown_green = False
-        self.cooldown_until = 0
+        self._arc_frames = None
+        self.arc_step = config.CURSOR_ARC_STEP
+        self.subpixel_phases = config.CURSOR_SUBPIXEL_PHASES
+        self.glow_layers = len(GLOW_LAYERS)
+        self.screen_fades = True
+        self._variants = {}      # (kind, param) -> built sprites, so tier switches are free
+        self._fade_surfaces = {}  # (size, color) -> opaque overlay, faded with set_alpha()
+
+        # Green arc: hold the closed ring, then ignore new pinches for a while
+        self.hold_duration = 0.4
+        self.cooldown_duration = 1.0
 
         # Red ring fade
-        self.error_mode = False
-        self.error_until = 0
         self.error_fade_duration = 2.0
         self.error_max_alpha = 180
 
         # Red screen-shadow fade
-        self.screen_error_mode = False
-        self.screen_error_until = 0
         self.screen_error_fade_duration = 2.0
         self.screen_error_max_alpha = 20  # gentle, easy on eyes
 
         # Green screen fade (correct)
-        self.screen_correct_mode = False
-        self.screen_correct_until = 0
         self.screen_correct_fade_duration = 2.0
         self.screen_correct_max_alpha = 20    # soft, same strength as red
 
 
-        # Build idle circle
+        # Build idle circle + arc animation frames
         self._build_idle_ring()
+        self._build_arc_frames()
+
+    # -------------------------------------------------
+    # ANIMATION STATE (derived from tween tracks)
+    # -------------------------------------------------
+    @property
+    def angle(self):
+        return self.anim.value("arc", 360.0)
+
+    @property
+    def animating(self):
+        # until update() has processed the arc's completion
+        track = self.anim.get("arc")
+        return track is not None and not track.completed
+
+    @property
+    def error_mode(self):
+        return self.anim.active("error_ring")
 
     @property
     def red_fade_time_left(self):
-        if not self.screen_error_mode:
-            return 0.0
-        return max(0.0, self.screen_error_until - time.time())
-    
+        return self.anim.remaining("screen_error")
+
     @property
     def finished(self):
-        return (not self.animating) and self.angle >= 360
+        """The arc closed since the last start_animation(); true until a trigger consumes it."""
+        return self._closed
+
+    def is_static(self, now=None):
+        """True when nothing is animating or fading, i.e. a redraw would look identical."""
+        return not (self.animating or self.anim.running(self._time(now)))
+
+    def _time(self, now=None):
+        if now is not None:
+            return now
+        if self.clock is not None:
+            return self.clock.now
+        return time.perf_counter()
 
 
+    # -------------------------------------------------
+    # QUALITY (quality.QualityGovernor tiers)
+    # -------------------------------------------------
+    def set_quality(self, tier):
+        """Apply a quality.QualityTier: glow layers, arc resolution, screen fades."""
+        self.screen_fades = tier.screen_fades
+        glow_layers = min(tier.glow_layers, len(GLOW_LAYERS))
+        if glow_layers != self.glow_layers:
+            self.glow_layers = glow_layers
+            self._build_idle_ring()
+        if tier.arc_step != self.arc_step:
+            self.arc_step = tier.arc_step
+            self._build_arc_frames()
+            self._cached_overlay = None
+
+    def _variant(self, kind, param, name, params, build):
+        """Built sprites for one tier variant: memory, then disk cache, then build()."""
+        key = (kind, param)
+        sprites = self._variants.get(key)
+        if sprites is None:
+            if self.asset_cache is not None:
+                sprites = self.asset_cache.get_or_build(name, params, build)
+            else:
+                sprites = build()
+            self._variants[key] = sprites
+        return sprites
+
     # -------------------------------------------------
     # BUILD IDLE YELLOW RING
     # -------------------------------------------------
+    def _idle_params(self):
+        return {
+            "outer_radius": self.outer_radius,
+            "idle_color": self.idle_color,
+            "glow": GLOW_LAYERS[:self.glow_layers],  # (offset, width, color)
+            "phases": self.subpixel_phases,
+        }
+
     def _build_idle_ring(self):
-        glow_offset = 10
-        max_radius = self.outer_radius + glow_offset
+        params = self._idle_params()
+        glow = params["glow"]
+        max_radius = self.outer_radius + GLOW_EXTENT  # same size with or without glow
         size = max_radius * 2
 
-        surf = pygame.Surface((size, size), pygame.SRCALPHA)
-        center = (max_radius, max_radius)
+        def draw_ring(scale):
+            surf = pygame.Surface((size * scale, size * scale), pygame.SRCALPHA)
+            center = (max_radius * scale, max_radius * scale)
+
+            for glow_offset, glow_width, glow_color in glow:
+                pygame.draw.circle(surf, glow_color, center,
+                                   (self.outer_radius + glow_offset) * scale, glow_width * scale)
+            pygame.draw.circle(surf, self.idle_color, center, self.outer_radius * scale, 10 * scale)
+            pygame.draw.circle(surf, (0, 0, 0, 0), center, 2 * scale)
+            return surf
 
-        glow_color = (255, 255, 150, 70)
-        pygame.draw.circle(surf, glow_color, center, self.outer_radius + glow_offset, 20)
-        pygame.draw.circle(surf, self.idle_color, center, self.outer_radius, 10)
-        pygame.draw.circle(surf, (0, 0, 0, 0), center, 2)
+        def build():
+            return build_phase_sprites(draw_ring, self.subpixel_phases)
 
-        self._cached_idle = surf
+        sprites = self._variant("idle", self.glow_layers, f"cursor_idle_g{self.glow_layers}",
+                                params, build)
+
+        self._idle_size = (size, size)
+        self._cached_idle = SubpixelSprite(sprites, self.subpixel_phases, self._idle_size)
 
     # -------------------------------------------------
     # PUBLIC CONTROLS
     # -------------------------------------------------
-    def start_animation(self):
-        if self.error_mode or self.screen_error_mode:
+    def start_animation(self, now=None):
+        anim = self.anim
+        if anim.active("error_ring") or anim.active("screen_error"):
             return
-        if not self.animating and not self.cooldown_green:
-            self.angle = 0
-            self.animating = True
-            self._cached_angle = None
-            self.hold_until = 0
+        if not self.animating and not anim.active("cooldown"):
+            anim.play("arc", 0.0, 360.0, self.dwell_seconds, self._time(now),
+                      easing=self.easing, on_complete=self._arc_closed)
+            anim.stop("hold")
+            self._closed = False
 
     def stop_animation(self):
-        self.animating = False
-        self.angle = 360
-        self._cached_angle = None
-        self.hold_until = 0
+        self.anim.stop("arc")
+        self.anim.stop("hold")
+        self._closed = False
+
+    def _arc_closed(self, end):
+        self._closed = True
+        self._cached_overlay = self._arc_frame(360.0)
+        self.anim.play("hold", 1.0, 0.0, self.hold_duration, end)
+        self.anim.play("cooldown", 1.0, 0.0, self.cooldown_duration, end)
+
+    def add_listener(self, event, fn):
+        """event: "correct" or "wrong"; fn(cursor, now) is called on each trigger."""
+        self._listeners[event].append(fn)
+
+    def _notify(self, event, now):
+        for fn in self._listeners[event]:
+            fn(self, now)
+
+    def trigger_correct(self, now=None):
+        now = self._time(now)
+        self._closed = False
 
-    def trigger_correct(self):
         # Stop any animation immediately
-        self.animating = False
-        self.angle = 360
-        self._cached_angle = None
+        self.anim.stop("arc")
 
         # Start green fade
-        self.screen_correct_mode = True
-        self.screen_correct_until = time.time() + self.screen_correct_fade_duration
+        self.anim.play("screen_correct", 1.0, 0.0, self.screen_correct_fade_duration, now)
+        self._notify("correct", now)
+
+    def trigger_wrong(self, now=None):
+        now = self._time(now)
+        self._closed = False
 
-    def trigger_wrong(self):
         # Cursor ring fade
-        self.error_mode = True
-        self.error_until = time.time() + self.error_fade_duration
+        self.anim.play("error_ring", 1.0, 0.0, self.error_fade_duration, now)
 
         # Stop any green animation
-        self.animating = False
-        self.angle = 360
-        self._cached_angle = None
+        self.anim.stop("arc")
 
         # Screen shadow fade
-        self.screen_error_mode = True
-        self.screen_error_until = time.time() + self.screen_error_fade_duration
+        self.anim.play("screen_error", 1.0, 0.0, self.screen_error_fade_duration, now)
+        self._notify("wrong", now)
 
     # -------------------------------------------------
     # BUILD GREEN ARC
     # -------------------------------------------------
-    def _build_arc(self):
+    def _build_arc(self, angle=None):
+        if angle is None:
+            angle = self.angle
+
         radius = 65
         surf = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
 
         start_angle = -90
-        end_angle = start_angle + self.angle + 5
+        end_angle = start_angle + angle + 5
 
         points = [(radius, radius)]
         for a in range(start_angle, int(end_angle) + 1):
@@ -143,108 +260,113 @@ class SmoothCursor:
 
         return surf
 
-    # -------------------------------------------------
-    # UPDATE
-    # -------------------------------------------------
-    def update(self):
-        now = time.time()
-
-        # Handle red ring fade
-        if self.error_mode:
-            if now >= self.error_until:
-                self.error_mode = False
-            return  # freeze animation while red ring is active
+    def _build_arc_frames(self):
+        """
+        The arc at every arc_step degrees. With a disk cache all frames are
+        rendered once and loaded from disk afterwards; without one, each frame
+        is drawn the first time it is shown, so construction stays cheap.
+        """
+        params = {
+            "active_color": self.active_color,
+            "radius": 65,
+            "hole": 51,
+            "step": self.arc_step,
+        }
+        angles = range(0, 360 + self.arc_step, self.arc_step)
+
+        if self.asset_cache is None or not self.asset_cache.enabled:
+            self._arc_frames = self._variants.setdefault(("arc", self.arc_step), [None] * len(angles))
+            return
 
-        # Handle green cooldown
-        if self.cooldown_green and now > self.cooldown_until:
-            self.cooldown_green = False
+        def build():
+            return [self._build_arc(a) for a in angles]
 
-        # Progress green animation
-        if self.animating:
-            self.angle += self.speed
+        self._arc_frames = self._variant("arc", self.arc_step, f"cursor_arc_{self.arc_step}",
+                                         params, build)
 
-            if self.angle >= 360:
-                self.angle = 360
-                self.animating = False
+    def _arc_frame(self, angle):
+        index = min(int(angle // self.arc_step), len(self._arc_frames) - 1)
+        frame = self._arc_frames[index]
+        if frame is None:  # lazily drawn (no disk cache)
+            frame = self._arc_frames[index] = self._build_arc(index * self.arc_step)
+        return frame
 
-                self.cooldown_green = True
-                self.cooldown_until = now + 1
-                self.hold_until = now + 0.4
+    # -------------------------------------------------
+    # UPDATE
+    # -------------------------------------------------
+    def update(self, now=None):
+        # Values are functions of time; this only fires completions (arc → hold + cooldown)
+        self.anim.update(self._time(now))
 
     # -------------------------------------------------
     # DRAW
     # -------------------------------------------------
-    def draw(self, surface, pos):
-        now = time.time()
-
-        # --- Screen red shadow fade ---
-# --- Fullscreen soft red fade ---
-        if self.screen_error_mode:
-            time_left = self.screen_error_until - now
-
-            if time_left <= 0:
-                self.screen_error_mode = False
-            else:
-                alpha = int((time_left / self.screen_error_fade_duration) * self.screen_error_max_alpha)
-
-                width, height = surface.get_size()
-
-                # Make full-screen red overlay (very faint)
-                fullscreen_red = pygame.Surface((width, height), pygame.SRCALPHA)
-                fullscreen_red.fill((255, 0, 0, alpha))
+    def draw(self, surface, pos, now=None):
+        now = self._time(now)
+        self.draw_fades(surface, now)
+        self.draw_cursor(surface, pos, now)
+
+    def _fade_overlay(self, size, color, alpha):
+        # Uniform colour: one cached opaque surface faded with per-surface alpha,
+        # instead of allocating a full-screen SRCALPHA surface every frame
+        key = (size, color)
+        overlay = self._fade_surfaces.get(key)
+        if overlay is None:
+            overlay = self._fade_surfaces[key] = pygame.Surface(size)
+            overlay.fill(color)
+        overlay.set_alpha(alpha)
+        return overlay
+
+    def draw_fades(self, surface, now=None):
+        """Full-screen red / green feedback fades (scene layer, may be a scaled canvas)."""
+        now = self._time(now)
+        anim = self.anim
+        if not self.screen_fades:
+            return
 
-                # Blit the red overlay
-                surface.blit(fullscreen_red, (0, 0))
+        # --- Fullscreen soft red fade ---
+        if anim.active("screen_error", now):
+            alpha = int(anim.value("screen_error", 0.0, now) * self.screen_error_max_alpha)
+            surface.blit(self._fade_overlay(surface.get_size(), (255, 0, 0), alpha), (0, 0))
 
         # --- Fullscreen soft GREEN fade ---
-        if self.screen_correct_mode:
-            time_left = self.screen_correct_until - now
-
-            if time_left <= 0:
-                self.screen_correct_mode = False
-            else:
-                alpha = int((time_left / self.screen_correct_fade_duration) * self.screen_correct_max_alpha)
-
-                width, height = surface.get_size()
-
-                fullscreen_green = pygame.Surface((width, height), pygame.SRCALPHA)
-                fullscreen_green.fill((0, 255, 0, alpha))
+        if anim.active("screen_correct", now):
+            alpha = int(anim.value("screen_correct", 0.0, now) * self.screen_correct_max_alpha)
+            surface.blit(self._fade_overlay(surface.get_size(), (0, 255, 0), alpha), (0, 0))
 
-                surface.blit(fullscreen_green, (0, 0))
+    def draw_cursor(self, surface, pos, now=None):
+        """Idle ring, pinch arc and red ring at pos (display pixels)."""
+        now = self._time(now)
+        anim = self.anim
+        self.last_pos = pos
 
-
-
-        # Draw idle ring
-        surface.blit(self._cached_idle, self._cached_idle.get_rect(center=pos))
+        # Draw idle ring at the exact (float) position; overlays snap to nearest pixel
+        self._cached_idle.blit(surface, pos)
+        pos = (round(pos[0]), round(pos[1]))
 
         # --- Cursor red ring fade ---
-        if self.error_mode:
-            time_left = self.error_until - now
-            if time_left > 0:
-                alpha = int((time_left / self.error_fade_duration) * self.error_max_alpha)
-                red_overlay = pygame.Surface(self._cached_idle.get_size(), pygame.SRCALPHA)
-
-                pygame.draw.circle(
-                    red_overlay,
-                    (255, 0, 0, alpha),
-                    (red_overlay.get_width() // 2, red_overlay.get_height() // 2),
-                    self.outer_radius + 5,
-                    15
-                )
-                surface.blit(red_overlay, red_overlay.get_rect(center=pos))
-
+        if anim.active("error_ring", now):
+            alpha = int(anim.value("error_ring", 0.0, now) * self.error_max_alpha)
+            red_overlay = pygame.Surface(self._idle_size, pygame.SRCALPHA)
+
+            pygame.draw.circle(
+                red_overlay,
+                (255, 0, 0, alpha),
+                (red_overlay.get_width() // 2, red_overlay.get_height() // 2),
+                self.outer_radius + 5,
+                15
+            )
+            surface.blit(red_overlay, red_overlay.get_rect(center=pos))
             return
 
         # --- Hold finished green arc ---
-        if not self.animating and self.angle >= 360:
-            if now < self.hold_until and self._cached_overlay:
+        if not self.animating:
+            if anim.active("hold", now) and self._cached_overlay:
                 surface.blit(self._cached_overlay, self._cached_overlay.get_rect(center=pos))
             return
 
-        # --- Build new arc if needed ---
-        if self._cached_angle != self.angle:
-            self._cached_overlay = self._build_arc()
-            self._cached_angle = self.angle
+        # --- Pick pre-rendered arc frame ---
+        self._cached_overlay = self._arc_frame(anim.value("arc", 360.0, now))
 
         # Draw green arc
         surface.blit(self._cached_overlay, self._cached_overlay.get_rect(center=pos))
@@ -15,7 +15,7 @@ clock = pygame.time.Clock()
 cursor = SmoothCursor(
     outer_radius=50,
     inner_radius=40,
-    speed=5,
+    dwell_ms=800,
     color=(153, 255, 51)  # green for pinch
 )
 
@@ -1,69 +1,102 @@
 # cursor_halo.py
 import pygame
 import math
+import config
+from tween import Animator
 
 class SmoothCursor:
     """
     Idle: full yellow ring + multi-ring halo fade outward.
     Pinch: green arc grows.
     """
-    def __init__(self, outer_radius=90, inner_radius=20, speed=5, color=(0, 255, 0)):
+    def __init__(self, outer_radius=90, inner_radius=20, dwell_ms=None, color=(0, 255, 0),
+                 clock=None, easing=None, asset_cache=None):
         self.outer_radius = outer_radius
         self.inner_radius = inner_radius
-        self.speed = speed
+        self.dwell_seconds = (config.CURSOR_DWELL_MS if dwell_ms is None else dwell_ms) / 1000.0
+        self.easing = easing or config.CURSOR_DWELL_EASING
+        self.anim = Animator(clock)  # clock: FrameClock / VirtualClock, None = perf_counter
+        self.asset_cache = asset_cache  # asset_cache.CursorAssetCache for the glow ring, or None
 
         self.active_color = color
         self.idle_color = (255, 255, 51, 200)
 
-        self.angle = 360
-        self.animating = False
-
         self._cached_idle = None
         self._cached_angle = None
         self._cached_overlay = None
 
+        # quality.QualityTier knobs (see set_quality)
+        self.glow_layers = 4
+        self.arc_step = 1
+
         self._build_idle_ring()
 
     def _build_idle_ring(self):
         glow_offset = 18
         max_r = self.outer_radius + glow_offset
         size = max_r * 2
-        surf = pygame.Surface((size, size), pygame.SRCALPHA)
         center = (max_r, max_r)
 
         # Halo fade: several thin rings with decreasing alpha
         halo_layers = [
-            (self.outer_radius + 6,  12, 45),
-            (self.outer_radius + 10, 10, 32),
-            (self.outer_radius + 14, 8,  22),
-            (self.outer_radius + 18, 6,  14),
-        ]
-        for r, w, a in halo_layers:
-            pygame.draw.circle(surf, (255, 255, 140, a), center, r, w)
-
-        pygame.draw.circle(surf, self.idle_color, center, self.outer_radius, 10)
-        pygame.draw.circle(surf, (0,0,0,0), center, 2)
-
-        self._cached_idle = surf
-
-    def start_animation(self):
-        self.angle = 0
-        self.animating = True
+            (self.outer_radius + 6,  12, (255, 255, 140, 45)),
+            (self.outer_radius + 10, 10, (255, 255, 140, 32)),
+            (self.outer_radius + 14, 8,  (255, 255, 140, 22)),
+            (self.outer_radius + 18, 6,  (255, 255, 140, 14)),
+        ][:self.glow_layers]
+
+        def build():
+            surf = pygame.Surface((size, size), pygame.SRCALPHA)
+            for r, w, c in halo_layers:
+                pygame.draw.circle(surf, c, center, r, w)
+
+            pygame.draw.circle(surf, self.idle_color, center, self.outer_radius, 10)
+            pygame.draw.circle(surf, (0,0,0,0), center, 2)
+            return [surf]
+
+        if self.asset_cache is None:
+            self._cached_idle = build()[0]
+            return
+        params = {
+            "outer_radius": self.outer_radius,
+            "idle_color": self.idle_color,
+            "glow": halo_layers,  # (radius, width, color)
+        }
+        self._cached_idle = self.asset_cache.get_or_build(
+            f"halo_idle_g{self.glow_layers}", params, build)[0]
+
+    def set_quality(self, tier):
+        """Apply a quality.QualityTier: fewer glow rings, coarser arc rebuilds."""
+        self.arc_step = max(1, tier.arc_step)
+        if tier.glow_layers != self.glow_layers:
+            self.glow_layers = tier.glow_layers
+            self._build_idle_ring()
+
+    @property
+    def angle(self):
+        return self.anim.value("arc", 360.0)
+
+    @property
+    def animating(self):
+        track = self.anim.get("arc")
+        return track is not None and not track.completed
+
+    def start_animation(self, now=None):
+        self.anim.play("arc", 0.0, 360.0, self.dwell_seconds, now, easing=self.easing)
         self._cached_angle = None
 
     def set_idle(self):
-        self.angle = 360
-        self.animating = False
+        self.anim.stop("arc")
         self._cached_angle = None
 
-    def _build_arc(self):
+    def _build_arc(self, angle):
         max_r = self.outer_radius + 18
         size = max_r * 2
         surf = pygame.Surface((size, size), pygame.SRCALPHA)
         center = (max_r, max_r)
 
         start_angle = -90
-        end_angle = start_angle + self.angle
+        end_angle = start_angle + angle
         points = [center]
 
         for a in range(start_angle, int(end_angle) + 1):
@@ -78,21 +111,19 @@ class SmoothCursor:
         pygame.draw.circle(surf, (0,0,0,0), center, self.inner_radius)
         return surf
 
-    def update(self):
-        if self.animating:
-            self.angle += self.speed
-            if self.angle >= 360:
-                self.angle = 360
-                self.animating = False
+    def update(self, now=None):
+        self.anim.update(now)
 
-    def draw(self, surface, pos):
+    def draw(self, surface, pos, now=None):
         surface.blit(self._cached_idle, self._cached_idle.get_rect(center=pos))
 
         if self.angle >= 360 and not self.animating:
             return
 
-        if self._cached_angle != self.angle:
-            self._cached_overlay = self._build_arc()
-            self._cached_angle = self.angle
+        # rebuild the arc polygon only every arc_step degrees
+        angle = self.anim.value("arc", 360.0, now) // self.arc_step * self.arc_step
+        if self._cached_angle != angle:
+            self._cached_overlay = self._build_arc(angle)
+            self._cached_angle = angle
 
         surface.blit(self._cached_overlay, self._cached_overlay.get_rect(center=pos))
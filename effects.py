@@ -0,0 +1,182 @@
+# effects.py — Pooled particle + screen-shake feedback layer
+#
+# Particles live in preallocated struct-of-arrays NumPy buffers, packed in
+# [0, count). Updates are whole-array operations; drawing is one
+# Surface.blits() call over sprites pre-rendered into a small sheet
+# (kind x alpha level, converted to the display format). The blit sequence
+# is built by NumPy: an object array of the sheet is indexed by sprite id
+# and positions go through one (n, 2) int buffer, so the only per-particle
+# Python work left is inside blits() itself.
+import math
+
+import numpy as np
+import pygame
+import config
+
+ALPHA_LEVELS = 8  # fade steps pre-rendered per particle kind
+BLIT_CHUNK = 256  # particles per Surface.blits() call
+
+# kind -> (color, radius)
+KINDS = {
+    "sparkle": ((180, 255, 140), 4),
+    "ember": ((255, 80, 60), 3),
+}
+
+
+def build_sprite_sheet(kinds=KINDS, levels=ALPHA_LEVELS):
+    """Returns (list of surfaces indexed kind * levels + level, half sizes, kind names)."""
+    sheet = []
+    halves = []
+    names = list(kinds)
+    for name in names:
+        color, radius = kinds[name]
+        size = radius * 2 + 2
+        for level in range(levels):
+            alpha = int(255 * (level + 1) / levels)
+            surf = pygame.Surface((size, size), pygame.SRCALPHA)
+            pygame.draw.circle(surf, (*color, alpha // 3), (size // 2, size // 2), radius + 1)
+            pygame.draw.circle(surf, (*color, alpha), (size // 2, size // 2), max(1, radius - 1))
+            if pygame.display.get_surface() is not None:
+                surf = surf.convert_alpha()  # display-format sprites take the fast blit path
+            sheet.append(surf)
+        halves.append(size // 2)
+    return sheet, np.array(halves, dtype=np.int32), names
+
+
+class ParticlePool:
+    def __init__(self, capacity=None, spawn_cap=None):
+        self.capacity = capacity or config.PARTICLE_CAPACITY
+        self.spawn_cap = spawn_cap or config.PARTICLE_SPAWN_CAP
+        n = self.capacity
+
+        self.x = np.zeros(n, dtype=np.float32)
+        self.y = np.zeros(n, dtype=np.float32)
+        self.vx = np.zeros(n, dtype=np.float32)
+        self.vy = np.zeros(n, dtype=np.float32)
+        self.age = np.zeros(n, dtype=np.float32)
+        self.life = np.ones(n, dtype=np.float32)
+        self.kind = np.zeros(n, dtype=np.int32)
+        self.count = 0
+
+        self._spawned_this_frame = 0
+        self._rng = np.random.default_rng()
+        self.sheet, self._halves, self._kind_names = build_sprite_sheet()
+        self._sprites = np.empty(len(self.sheet), dtype=object)
+        self._sprites[:] = self.sheet
+        self._pos = np.zeros((n, 2), dtype=np.int32)
+
+    # ---------------------------------------------------------
+
+    def spawn(self, n, pos, kind="sparkle", speed=(80.0, 260.0), life=(0.4, 0.9)):
+        """Radial burst of up to n particles; silently capped per frame and by capacity."""
+        n = min(n, self.spawn_cap - self._spawned_this_frame, self.capacity - self.count)
+        if n <= 0:
+            return 0
+
+        s = slice(self.count, self.count + n)
+        angle = self._rng.uniform(0.0, 2 * math.pi, n)
+        v = self._rng.uniform(speed[0], speed[1], n)
+
+        self.x[s] = pos[0]
+        self.y[s] = pos[1]
+        self.vx[s] = np.cos(angle) * v
+        self.vy[s] = np.sin(angle) * v
+        self.age[s] = 0.0
+        self.life[s] = self._rng.uniform(life[0], life[1], n)
+        self.kind[s] = self._kind_names.index(kind)
+
+        self.count += n
+        self._spawned_this_frame += n
+        return n
+
+    def update(self, dt):
+        self._spawned_this_frame = 0
+        n = self.count
+        if not n:
+            return
+
+        x, y, vx, vy, age = self.x[:n], self.y[:n], self.vx[:n], self.vy[:n], self.age[:n]
+        drag = 1.0 - min(config.PARTICLE_DRAG * dt, 1.0)
+        vx *= drag
+        vy *= drag
+        vy += config.PARTICLE_GRAVITY * dt
+        x += vx * dt
+        y += vy * dt
+        age += dt
+
+        alive = age < self.life[:n]
+        if not alive.all():
+            keep = np.flatnonzero(alive)
+            k = len(keep)
+            for arr in (self.x, self.y, self.vx, self.vy, self.age, self.life, self.kind):
+                arr[:k] = arr[keep]
+            self.count = k
+
+    def draw(self, surface, offset=(0, 0)):
+        n = self.count
+        if not n:
+            return
+
+        kind = self.kind[:n]
+        fade = 1.0 - self.age[:n] / self.life[:n]
+        level = np.clip((fade * ALPHA_LEVELS).astype(np.int32), 0, ALPHA_LEVELS - 1)
+        index = kind * ALPHA_LEVELS + level
+
+        half = self._halves[kind]
+        pos = self._pos[:n]
+        np.add(self.x[:n], offset[0], out=pos[:, 0], casting="unsafe")
+        np.add(self.y[:n], offset[1], out=pos[:, 1], casting="unsafe")
+        pos -= half[:, None]
+
+        # in chunks: only BLIT_CHUNK (sprite, pos) pairs are alive at a time, so
+        # they die young instead of being promoted into full GC collections
+        sprites = self._sprites[index]
+        for i in range(0, n, BLIT_CHUNK):
+            j = i + BLIT_CHUNK
+            surface.blits(zip(sprites[i:j].tolist(), pos[i:j].tolist()), doreturn=False)
+
+    def clear(self):
+        self.count = 0
+
+
+class EffectsLayer:
+    """Particles + screen shake, driven by SmoothCursor.trigger_correct / trigger_wrong."""
+
+    def __init__(self, pool=None):
+        self.pool = pool or ParticlePool()
+        self._shake_until = 0.0
+        self._shake_amplitude = 0.0
+        self._shake_duration = 1.0
+
+    def attach(self, cursor):
+        cursor.add_listener("correct", self.on_correct)
+        cursor.add_listener("wrong", self.on_wrong)
+
+    def on_correct(self, cursor, now):
+        self.pool.spawn(config.EFFECT_CORRECT_PARTICLES, cursor.last_pos, "sparkle")
+
+    def on_wrong(self, cursor, now):
+        self.pool.spawn(config.EFFECT_WRONG_PARTICLES, cursor.last_pos, "ember", speed=(40.0, 140.0))
+        self.shake(now, config.EFFECT_SHAKE_PIXELS, config.EFFECT_SHAKE_SECONDS)
+
+    def shake(self, now, amplitude, duration):
+        self._shake_until = now + duration
+        self._shake_amplitude = amplitude
+        self._shake_duration = duration
+
+    def shake_offset(self, now):
+        left = self._shake_until - now
+        if left <= 0:
+            return (0.0, 0.0)
+        a = self._shake_amplitude * left / self._shake_duration
+        return (a * math.sin(now * 90.0), a * math.cos(now * 70.0))
+
+    @property
+    def active(self):
+        return self.pool.count > 0
+
+    def update(self, dt):
+        self.pool.update(dt)
+
+    def draw(self, surface, now):
+        self.pool.draw(surface, self.shake_offset(now))
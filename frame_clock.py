@@ -0,0 +1,45 @@
+# frame_clock.py — One monotonic time sample per frame, shared by every stage
+import time
+
+
+class FrameClock:
+    """Samples a monotonic source once per tick; everything in that frame uses .now."""
+
+    def __init__(self, source=time.perf_counter):
+        self._source = source
+        self.now = source()
+        self.dt = 0.0
+        self.frame = 0
+        self._ticked = self.now  # time of the last tick (dt is measured from it)
+
+    def tick(self):
+        t = self._source()
+        self.dt = t - self._ticked
+        self.now = self._ticked = t
+        self.frame += 1
+        return t
+
+    def time(self):
+        """Time of the last tick (not a fresh sample)."""
+        return self.now
+
+
+class VirtualClock(FrameClock):
+    """Manually driven clock for tests, replay and faster-than-real-time benchmarks."""
+
+    def __init__(self, start=0.0, step=None):
+        self._t = start
+        self.step = step  # if set, every tick() advances by this many seconds
+        super().__init__(source=lambda: self._t)
+
+    def advance(self, dt):
+        """Move time forward now: .now and .dt (since the last tick) follow without a tick()."""
+        self._t += dt
+        self.now = self._t
+        self.dt = self._t - self._ticked
+        return self._t
+
+    def tick(self):
+        if self.step is not None:
+            self._t += self.step
+        return super().tick()
@@ -0,0 +1,161 @@
+# frame_pacer.py — Late-latching frame pacer (hybrid sleep + spin)
+#
+# Instead of clock.tick() at the end of the frame (input sampled, then a
+# coarse sleep, then present), the pacer sleeps *before* input is read and
+# wakes just early enough to sample, update, draw and flip by the deadline.
+# The final spin yields (the GIL in wait(), the event loop in wait_async()),
+# so a tracker sample that arrives while the pacer spins still makes it into
+# the frame. input_latency is measured from when the sample arrived, not
+# from the latch, so it shows how long input waited to be seen.
+import asyncio
+import time
+
+import config
+from histogram import Histogram, linear_edges
+
+
+class FramePacer:
+    def __init__(self, target_hz=None, idle_hz=None, idle_after=None,
+                 spin_budget=None, interrupt=None, source=time.perf_counter, sleep=time.sleep):
+        # pygame has no portable refresh-rate query, so TARGET_FPS stands in
+        # for the display refresh rate.
+        self.target_hz = target_hz or config.TARGET_FPS
+        self.idle_hz = idle_hz or config.IDLE_FPS
+        self.idle_after = config.IDLE_AFTER_SECONDS if idle_after is None else idle_after
+        self.spin_budget = config.PACER_SPIN_SECONDS if spin_budget is None else spin_budget
+
+        self._source = source
+        self._sleep = sleep
+        self.interrupt = interrupt  # threading.Event that cuts an idle sleep short
+
+        now = source()
+        self._next_present = now + 1.0 / self.target_hz
+        self._last_present = now
+        self._wake_time = now
+        self._input_time = None  # set by input_sampled(), cleared once presented
+        self._last_activity = now
+        self.render_estimate = 0.002  # EMA of wake -> present cost (s)
+
+        self.dropped = 0
+        self.frame_dt = 0.0  # last present-to-present interval
+        self.frame_cost = 0.0  # last wake-to-present time (the frame's actual work)
+        self.frame_times = Histogram(linear_edges(0.0, 0.050, 0.0005))
+        self.input_latency = Histogram(linear_edges(0.0, 0.050, 0.0005))
+
+    # ---------------------------------------------------------
+
+    @property
+    def idle(self):
+        return self._source() - self._last_activity > self.idle_after
+
+    @property
+    def period(self):
+        return 1.0 / (self.idle_hz if self.idle else self.target_hz)
+
+    def mark_activity(self, now=None):
+        """Call whenever there is something worth rendering at full rate."""
+        self._last_activity = self._source() if now is None else now
+
+    def wait(self):
+        """Block until it is time to sample input for the next frame."""
+        wake = self._next_present - self.render_estimate
+        remaining = wake - self._source()
+
+        # idle: sleep on the interrupt so new input restarts full-rate frames now
+        if self.interrupt is not None and self.idle and remaining > 0:
+            if self.interrupt.wait(remaining):
+                self.interrupt.clear()
+                return self._woken_early()
+            remaining = wake - self._source()
+        elif self.interrupt is not None:
+            self.interrupt.clear()
+
+        # coarse sleep, leaving the spin budget for the OS timer slack
+        if remaining > self.spin_budget:
+            self._sleep(remaining - self.spin_budget)
+
+        return self._spin_until(wake)
+
+    async def wait_async(self, interrupt=None):
+        """
+        asyncio version of wait(): other tasks run during the coarse sleep.
+        interrupt is an asyncio.Event that cuts an idle sleep short.
+        """
+        wake = self._next_present - self.render_estimate
+        remaining = wake - self._source()
+
+        if interrupt is not None and self.idle and remaining > 0:
+            try:
+                await asyncio.wait_for(interrupt.wait(), remaining)
+            except asyncio.TimeoutError:
+                remaining = wake - self._source()
+            else:
+                interrupt.clear()
+                return self._woken_early()
+        elif interrupt is not None:
+            interrupt.clear()
+
+        if remaining > self.spin_budget:
+            await asyncio.sleep(remaining - self.spin_budget)
+
+        # spin on the loop, not in it: tracker results keep landing until the latch
+        while self.spin_budget > 0.0 and self._source() < wake:
+            await asyncio.sleep(0)
+        self._wake_time = self._source()
+        return self._wake_time
+
+    def now(self):
+        """A fresh sample of the pacer's time source (e.g. to stamp input arrival)."""
+        return self._source()
+
+    def time_until_wake(self):
+        return self._next_present - self.render_estimate - self._source()
+
+    def _spin_until(self, wake):
+        while self._source() < wake:
+            self._sleep(0)  # releases the GIL: producer threads can post input
+
+        self._wake_time = self._source()
+        return self._wake_time
+
+    def _woken_early(self):
+        self._wake_time = self._source()
+        self.mark_activity(self._wake_time)
+        self._next_present = self._wake_time + self.render_estimate
+        return self._wake_time
+
+    def input_sampled(self, now=None):
+        """Input for this frame arrived at `now` (defaults to the wake time)."""
+        self._input_time = self._wake_time if now is None else now
+
+    def frame_presented(self):
+        """Call right after pygame.display.flip()."""
+        now = self._source()
+
+        self.frame_dt = now - self._last_present
+        self.frame_times.add(self.frame_dt)
+        if self._input_time is not None:  # frames without new input (splash, idle) don't count
+            self.input_latency.add(now - self._input_time)
+            self._input_time = None
+        self._last_present = now
+
+        cost = self.frame_cost = now - self._wake_time
+        self.render_estimate += (cost - self.render_estimate) * 0.1
+
+        self._next_present += self.period
+        if now > self._next_present:
+            # blew the deadline: skip ahead instead of bursting to catch up
+            self.dropped += 1
+            self._next_present = now + self.period
+
+    def frame_skipped(self):
+        """Nothing changed this frame; keep the schedule without presenting."""
+        now = self._source()
+        self._next_present += self.period
+        if now > self._next_present:
+            self._next_present = now + self.period
+
+    def report(self):
+        return (f"frame time   {self.frame_times.summary()}\n"
+                f"input→flip   {self.input_latency.summary()}\n"
+                f"dropped      {self.dropped}")
@@ -0,0 +1,160 @@
+# gestures.py — Landmark feature vector + rule-based gesture classifier
+#
+# All 21 MediaPipe hand landmarks arrive as one (21, 3) array; features are
+# computed with fancy indexing (no per-landmark Python loops) and normalised
+# by hand size (wrist → middle-finger MCP) so they don't depend on how far
+# the hand is from the camera. A finger counts as extended when it reaches
+# past its PIP joint and is straight at it; an open palm also needs the
+# fingers spread, which tells it apart from a flat hand held together.
+from collections import deque, namedtuple
+from enum import IntFlag
+
+import numpy as np
+import config
+
+
+class Gesture(IntFlag):
+    NONE = 0
+    PINCH = 1
+    FIST = 2
+    OPEN_PALM = 4
+    POINT = 8
+    SWIPE_LEFT = 16
+    SWIPE_RIGHT = 32
+
+
+POSES = (Gesture.PINCH, Gesture.FIST, Gesture.OPEN_PALM, Gesture.POINT)
+SWIPES = Gesture.SWIPE_LEFT | Gesture.SWIPE_RIGHT
+
+GestureEvent = namedtuple("GestureEvent", "kind gesture t")  # kind: "start" / "end"
+
+# landmark indices: thumb, index, middle, ring, pinky
+WRIST = 0
+MCP = np.array([2, 5, 9, 13, 17])
+PIP = np.array([3, 6, 10, 14, 18])
+TIP = np.array([4, 8, 12, 16, 20])
+
+# feature vector layout
+F_EXT = slice(0, 5)      # tip-to-wrist / pip-to-wrist per finger
+F_BEND = slice(5, 10)    # cos of the MCP-PIP-TIP angle per finger
+F_PINCH = 10             # thumb tip ↔ index tip
+F_SPREAD = slice(11, 14) # neighbouring fingertip gaps (index..pinky)
+N_FEATURES = 14
+
+
+class GestureEngine:
+    def __init__(self):
+        self.pinch_ratio = config.GESTURE_PINCH_RATIO
+        self.extended_ratio = config.GESTURE_EXTENDED_RATIO
+        self.straight_cos = config.GESTURE_STRAIGHT_COS
+        self.spread_ratio = config.GESTURE_SPREAD_RATIO
+        self.swipe_speed = config.GESTURE_SWIPE_SPEED
+        self.swipe_window = config.GESTURE_SWIPE_WINDOW
+
+        self._features = np.empty(N_FEATURES, dtype=np.float32)
+        self._wrist_history = deque()  # (t, x / hand size)
+
+    # ---------------------------------------------------------
+
+    @staticmethod
+    def hand_size(lm):
+        return max(float(np.linalg.norm(lm[9, :2] - lm[WRIST, :2])), 1e-6)
+
+    def features(self, lm):
+        """lm: (21, 3) normalised landmarks → (N_FEATURES,) float32 vector."""
+        xy = lm[:, :2]
+        size = self.hand_size(lm)
+        out = self._features
+
+        wrist = xy[WRIST]
+        tip_d = np.linalg.norm(xy[TIP] - wrist, axis=1)
+        pip_d = np.linalg.norm(xy[PIP] - wrist, axis=1)
+        out[F_EXT] = tip_d / np.maximum(pip_d, 1e-6)
+
+        a = xy[MCP] - xy[PIP]
+        b = xy[TIP] - xy[PIP]
+        denom = np.linalg.norm(a, axis=1) * np.linalg.norm(b, axis=1)
+        out[F_BEND] = np.einsum("ij,ij->i", a, b) / np.maximum(denom, 1e-9)
+
+        out[F_PINCH] = np.linalg.norm(xy[4] - xy[8]) / size
+        out[F_SPREAD] = np.linalg.norm(xy[TIP[2:]] - xy[TIP[1:4]], axis=1) / size
+        return out
+
+    def classify(self, lm, t=None):
+        """Return a Gesture flag set for this frame (one pose + optional swipe)."""
+        f = self.features(lm)
+        extended = (f[F_EXT] > self.extended_ratio) & (f[F_BEND] < self.straight_cos)
+        fingers = extended[1:]  # index..pinky
+
+        if f[F_PINCH] < self.pinch_ratio:
+            gesture = Gesture.PINCH
+        elif fingers[0] and not fingers[1:].any():
+            gesture = Gesture.POINT
+        elif not fingers.any():
+            gesture = Gesture.FIST
+        elif fingers.all() and f[F_SPREAD].mean() > self.spread_ratio:
+            gesture = Gesture.OPEN_PALM
+        else:
+            gesture = Gesture.NONE
+
+        if t is not None:
+            gesture |= self._swipe(lm, t)
+        return gesture
+
+    def _swipe(self, lm, t):
+        hist = self._wrist_history
+        hist.append((t, lm[WRIST, 0] / self.hand_size(lm)))
+        while hist and t - hist[0][0] > self.swipe_window:
+            hist.popleft()
+        if len(hist) < 2:
+            return Gesture.NONE
+
+        t0, x0 = hist[0]
+        if t - t0 < self.swipe_window * 0.5:
+            return Gesture.NONE
+
+        speed = (hist[-1][1] - x0) / (t - t0)  # hand sizes per second
+        if speed > self.swipe_speed:
+            hist.clear()
+            return Gesture.SWIPE_RIGHT
+        if speed < -self.swipe_speed:
+            hist.clear()
+            return Gesture.SWIPE_LEFT
+        return Gesture.NONE
+
+    def reset(self):
+        self._wrist_history.clear()
+
+
+class GestureDebouncer:
+    """
+    Turns noisy per-frame flags into start/end events: a pose must be seen
+    on `frames` consecutive samples to start and be absent as long to end.
+    Swipes are one-shot and emitted immediately.
+    """
+    def __init__(self, frames=None):
+        self.frames = frames or config.GESTURE_DEBOUNCE_FRAMES
+        self.active = Gesture.NONE
+        self._on = {g: 0 for g in POSES}
+        self._off = {g: 0 for g in POSES}
+
+    def update(self, flags, t):
+        events = []
+        for g in POSES:
+            if flags & g:
+                self._on[g] += 1
+                self._off[g] = 0
+                if not self.active & g and self._on[g] >= self.frames:
+                    self.active |= g
+                    events.append(GestureEvent("start", g, t))
+            else:
+                self._off[g] += 1
+                self._on[g] = 0
+                if self.active & g and self._off[g] >= self.frames:
+                    self.active &= ~g
+                    events.append(GestureEvent("end", g, t))
+
+        for g in (Gesture.SWIPE_LEFT, Gesture.SWIPE_RIGHT):
+            if flags & g:
+                events.append(GestureEvent("start", g, t))
+        return events
@@ -1,61 +1,99 @@
 import cv2
 import mediapipe as mp
 import numpy as np
-import math
+import time
 import config
-from palm_tracker import PalmTracker
-
-pt = PalmTracker()
+from anchor import FusedAnchor, index_mcp
+from continuity import TrackingContinuity
+from gestures import GestureEngine
+from hands_model import create_hands
+from precondition import FramePreconditioner
+from samples import HandSample, freeze, landmark_array
 
 class HandCursorTracker:
-    def __init__(self):
-        self.mp_hands = mp.solutions.hands.Hands(
-            min_detection_confidence=0.5,
-            min_tracking_confidence=0.5
-        )
-        self.mp_draw = mp.solutions.drawing_utils
+    def __init__(self, source=0, presence=None, on_ready=None):
+        # on_ready(phase) is called with "model_loaded" / "camera_open" as they happen
+        on_ready = on_ready or (lambda phase: None)
 
-        self.cap = cv2.VideoCapture(0)
-
-        self.cursor_x = 0
-        self.cursor_y = 0
-        self.palm_cursor_x = 0
-        self.palm_cursor_y = 0
-        self.pinch_threshold = 0.06
-        self.is_pinched = False
+        self.mp_hands = create_hands()  # same MP_* settings as batch_extract.py
+        self.mp_draw = mp.solutions.drawing_utils
+        on_ready("model_loaded")
+
+        self.cap = cv2.VideoCapture(source)  # camera index or video file
+        if self.cap.isOpened():
+            on_ready("camera_open")
+
+        self.gesture_engine = GestureEngine()
+        self.anchor = FusedAnchor() if config.CURSOR_ANCHOR == "fused" else None
+        self.seq = 0
+        self.last_sample = HandSample(t=time.perf_counter(), seq=0, x=0.5, y=0.5, present=False)
+
+        # optional PresenceMonitor: throttles inference while no hand is around
+        self.presence = presence
+
+        # detector re-runs / tracking losses, and the dim-room LUT in front of inference
+        self.continuity = TrackingContinuity()
+        self.precondition = FramePreconditioner()
+
+    def warm_up(self, frames=None):
+        """
+        Run MediaPipe on blank frames so graph initialisation and the first
+        (slowest) inferences happen before real input is expected.
+        """
+        frames = config.WARMUP_FRAMES if frames is None else frames
+        blank = np.zeros((config.CAMERA_HEIGHT, config.CAMERA_WIDTH, 3), dtype=np.uint8)
+        for _ in range(frames):
+            self.mp_hands.process(blank)
 
     def process_frame(self):
+        """Returns (frame, HandSample), (frame, None) if inference was skipped, or (None, None)."""
         ret, frame = self.cap.read()
+        now = time.perf_counter()
         if not ret:
             return None, None
 
+        self.seq += 1
         frame = cv2.flip(frame, 1)
-        rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        results = self.mp_hands.process(rgb)
-
-        h, w, _ = frame.shape
-        self.is_pinched = False
 
-        if results.multi_hand_landmarks:
-            lm = results.multi_hand_landmarks[0].landmark
+        # Idle + no motion → skip MediaPipe on this frame entirely
+        if self.presence is not None and not self.presence.should_infer(frame, now):
+            return frame, None
 
-            # INDEX TIP
-            palm = lm[5]
-            self.palm_cursor_x = int(palm.x * w)
-            self.palm_cursor_y = int(palm.y * h)
+        rgb = self.precondition(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
+        start = time.perf_counter()
+        results = self.mp_hands.process(rgb)
+        inference = time.perf_counter() - start
 
-            index = lm[8]
-            self.cursor_x = int(index.x * w)
-            self.cursor_y = int(index.y * h)
+        h, w, _ = frame.shape
+        present = bool(results.multi_hand_landmarks)
+        self.continuity.update(present, inference, now)
 
-            # PINCH DETECTION
-            thumb = lm[4]
-            dx = thumb.x - index.x
-            dy = thumb.y - index.y
-            dist = math.sqrt(dx * dx + dy * dy)
+        if self.presence is not None:
+            self.presence.update(present)
 
-            if dist < self.pinch_threshold:
-                self.is_pinched = True
+        if present:
+            lm = results.multi_hand_landmarks[0].landmark
+            points = freeze(landmark_array(lm))
+
+            # GESTURES (pinch, fist, open palm, point, swipe) from all 21 landmarks
+            gestures = self.gesture_engine.classify(points, now)
+
+            handedness = results.multi_handedness[0].classification[0]
+
+            # fused palm anchor (or the index MCP alone) drives the cursor, normalised floats
+            x, y = self.anchor.update(points, now) if self.anchor is not None else index_mcp(points)
+            sample = HandSample(
+                t=now,
+                seq=self.seq,
+                x=x,
+                y=y,
+                present=True,
+                landmarks=points,
+                confidence=handedness.score,
+                handedness=handedness.label,
+                gestures=gestures,
+                inference=inference,
+            )
 
             # ---------- TEST MODE VISUALIZATION ----------
             if config.TEST_MODE:
@@ -66,19 +104,27 @@ class HandCursorTracker:
                     mp.solutions.hands.HAND_CONNECTIONS
                 )
 
-                # Draw the cursor point
-                cv2.circle(frame, (self.cursor_x, self.cursor_y), 12,
-                           (0, 255, 0), 2)
+                # Draw the cursor anchor + index tip
+                cv2.circle(frame, (int(x * w), int(y * h)), 6, (0, 255, 255), -1)
+                ix, iy = int(points[8, 0] * w), int(points[8, 1] * h)
+                cv2.circle(frame, (ix, iy), 12, (0, 255, 0), 2)
 
                 # Draw pinch line
-                ix = int(index.x * w)
-                iy = int(index.y * h)
-                tx = int(thumb.x * w)
-                ty = int(thumb.y * h)
-
+                tx, ty = int(points[4, 0] * w), int(points[4, 1] * h)
                 cv2.line(frame, (tx, ty), (ix, iy),
-                         (0, 255, 255) if self.is_pinched else (255, 0, 0),
+                         (0, 255, 255) if sample.pinched else (255, 0, 0),
                          2)
+        else:
+            self.gesture_engine.reset()
+            if self.anchor is not None:
+                self.anchor.reset()
+
+            # no hand: keep the last anchor so the cursor stays put
+            last = self.last_sample
+            sample = HandSample(t=now, seq=self.seq, x=last.x, y=last.y, present=False,
+                                inference=inference)
+
+        self.last_sample = sample
 
         # ---------- SHOW CAMERA WINDOW IF TEST MODE ----------
         if config.TEST_MODE:
@@ -86,7 +132,7 @@ class HandCursorTracker:
             if cv2.waitKey(1) & 0xFF == ord('q'):
                 pass
 
-        return frame, (self.palm_cursor_x, self.palm_cursor_y, self.is_pinched)
+        return frame, sample
 
     def release(self):
         self.cap.release()
@@ -0,0 +1,53 @@
+# hands_model.py — One MediaPipe Hands configuration for every path
+#
+# The live tracker, batch_extract.py and the tracking benchmarks all build
+# their Hands graph here from the MP_* config values, so landmarks tuned
+# offline come from the same model and thresholds as production.
+# batch_extract.py stores settings() next to each session (model.json).
+import json
+import os
+
+import config
+
+MODEL_FILE = "model.json"
+
+
+def settings(**overrides):
+    """Hands keyword arguments from config; overrides win (benchmark sweeps)."""
+    kwargs = {
+        "static_image_mode": False,
+        "model_complexity": config.MP_MODEL_COMPLEXITY,
+        "max_num_hands": config.MP_MAX_HANDS,
+        "min_detection_confidence": config.MP_MIN_DET_CONF,
+        "min_tracking_confidence": config.MP_MIN_TRK_CONF,
+    }
+    kwargs.update(overrides)
+    return kwargs
+
+
+def create_hands(**overrides):
+    import mediapipe as mp
+    return mp.solutions.hands.Hands(**settings(**overrides))
+
+
+def save_settings(session_dir, **overrides):
+    with open(os.path.join(session_dir, MODEL_FILE), "w") as f:
+        json.dump(settings(**overrides), f, indent=2)
+
+
+def load_settings(session_dir):
+    """Settings a session was extracted with, or None for sessions older than model.json."""
+    try:
+        with open(os.path.join(session_dir, MODEL_FILE)) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+
+def mismatch(session_dir):
+    """Settings of a session that differ from the current config: {name: (session, config)}."""
+    recorded = load_settings(session_dir)
+    if recorded is None:
+        return {}
+    current = settings()
+    return {k: (v, current.get(k)) for k, v in recorded.items() if current.get(k) != v}
@@ -0,0 +1,52 @@
+# histogram.py — Fixed-bucket histogram (no per-sample allocation)
+from bisect import bisect_right
+
+
+def linear_edges(start, stop, step):
+    n = int(round((stop - start) / step))
+    return [start + i * step for i in range(n + 1)]
+
+
+class Histogram:
+    def __init__(self, edges):
+        self.edges = list(edges)            # upper bucket bounds, ascending
+        self.counts = [0] * (len(self.edges) + 1)  # last bucket = overflow
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, value):
+        self.counts[bisect_right(self.edges, value)] += 1
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+
+    def reset(self):
+        self.counts = [0] * (len(self.edges) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    @property
+    def mean(self):
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, p):
+        """Upper edge of the bucket containing the p-th percentile (0..100)."""
+        if not self.count:
+            return 0.0
+        rank = self.count * p / 100.0
+        seen = 0
+        for i, c in enumerate(self.counts):
+            seen += c
+            if seen >= rank and c:
+                return self.edges[i] if i < len(self.edges) else self.max
+        return self.max
+
+    def summary(self, scale=1000.0, unit="ms"):
+        return (f"n={self.count} mean={self.mean * scale:.2f}{unit} "
+                f"p50={self.percentile(50) * scale:.2f}{unit} "
+                f"p95={self.percentile(95) * scale:.2f}{unit} "
+                f"p99={self.percentile(99) * scale:.2f}{unit} "
+                f"max={self.max * scale:.2f}{unit}")
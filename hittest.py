@@ -0,0 +1,184 @@
+# hittest.py — Uniform-grid spatial index for "what is under the cursor"
+#
+# Targets are bucketed into square cells by their bounding box; a point query
+# only tests the targets in one cell, so cost depends on local density, not
+# on how many objects are on screen. Shapes: circle, rect, per-pixel mask.
+import pygame
+import config
+
+
+class Target:
+    def __init__(self, target_id, correct=False, z=0, data=None):
+        self.id = target_id
+        self.correct = correct
+        self.z = z          # higher = drawn on top = wins the hit test
+        self.data = data
+        self.bounds = (0, 0, 0, 0)  # x0, y0, x1, y1 (set by subclasses)
+
+    def contains(self, x, y):
+        raise NotImplementedError
+
+    def near(self, x, y, radius):
+        """Cheap hover test: point within `radius` of the bounding box."""
+        x0, y0, x1, y1 = self.bounds
+        dx = max(x0 - x, 0, x - x1)
+        dy = max(y0 - y, 0, y - y1)
+        return dx * dx + dy * dy <= radius * radius
+
+
+class CircleTarget(Target):
+    def __init__(self, target_id, center, radius, **kwargs):
+        super().__init__(target_id, **kwargs)
+        self.cx, self.cy = center
+        self.radius = radius
+        self.bounds = (self.cx - radius, self.cy - radius, self.cx + radius, self.cy + radius)
+
+    def contains(self, x, y):
+        dx = x - self.cx
+        dy = y - self.cy
+        return dx * dx + dy * dy <= self.radius * self.radius
+
+    def near(self, x, y, radius):
+        dx = x - self.cx
+        dy = y - self.cy
+        r = self.radius + radius
+        return dx * dx + dy * dy <= r * r
+
+
+class RectTarget(Target):
+    def __init__(self, target_id, rect, **kwargs):
+        super().__init__(target_id, **kwargs)
+        self.rect = pygame.Rect(rect)
+        self.bounds = (self.rect.left, self.rect.top, self.rect.right, self.rect.bottom)
+
+    def contains(self, x, y):
+        x0, y0, x1, y1 = self.bounds
+        return x0 <= x < x1 and y0 <= y < y1
+
+
+class MaskTarget(Target):
+    """Pixel-exact target, e.g. pygame.mask.from_surface(sprite)."""
+
+    def __init__(self, target_id, topleft, mask, **kwargs):
+        super().__init__(target_id, **kwargs)
+        self.x, self.y = topleft
+        self.mask = mask
+        w, h = mask.get_size()
+        self.bounds = (self.x, self.y, self.x + w, self.y + h)
+
+    def contains(self, x, y):
+        x0, y0, x1, y1 = self.bounds
+        if not (x0 <= x < x1 and y0 <= y < y1):
+            return False
+        return bool(self.mask.get_at((int(x - self.x), int(y - self.y))))
+
+
+class SpatialGrid:
+    def __init__(self, cell_size=None):
+        self.cell_size = cell_size or config.HIT_GRID_CELL
+        self._cells = {}    # (col, row) -> [Target]
+        self._targets = {}  # id -> (Target, [cell keys])
+
+    def __len__(self):
+        return len(self._targets)
+
+    def __iter__(self):
+        return (target for target, _ in self._targets.values())
+
+    def _keys(self, bounds):
+        cs = self.cell_size
+        x0, y0, x1, y1 = bounds
+        return [(c, r)
+                for c in range(int(x0 // cs), int(x1 // cs) + 1)
+                for r in range(int(y0 // cs), int(y1 // cs) + 1)]
+
+    # ---------------------------------------------------------
+
+    def insert(self, target):
+        if target.id in self._targets:
+            self.remove(target.id)
+        keys = self._keys(target.bounds)
+        for key in keys:
+            self._cells.setdefault(key, []).append(target)
+        self._targets[target.id] = (target, keys)
+
+    def remove(self, target_id):
+        entry = self._targets.pop(target_id, None)
+        if entry is None:
+            return
+        target, keys = entry
+        for key in keys:
+            cell = self._cells[key]
+            cell.remove(target)
+            if not cell:
+                del self._cells[key]
+
+    def clear(self):
+        self._cells.clear()
+        self._targets.clear()
+
+    # ---------------------------------------------------------
+
+    def query_point(self, x, y):
+        """All targets containing (x, y), topmost first."""
+        cs = self.cell_size
+        cell = self._cells.get((int(x // cs), int(y // cs)))
+        if not cell:
+            return []
+        hits = [t for t in cell if t.contains(x, y)]
+        hits.sort(key=lambda t: t.z, reverse=True)
+        return hits
+
+    def topmost(self, x, y):
+        cs = self.cell_size
+        cell = self._cells.get((int(x // cs), int(y // cs)))
+        best = None
+        if cell:
+            for t in cell:
+                if (best is None or t.z > best.z) and t.contains(x, y):
+                    best = t
+        return best
+
+    def query_radius(self, x, y, radius):
+        """Targets within `radius` of (x, y) (hover / magnetism), nearest cell scan."""
+        seen = set()
+        out = []
+        for key in self._keys((x - radius, y - radius, x + radius, y + radius)):
+            for t in self._cells.get(key, ()):
+                if t.id not in seen and t.near(x, y, radius):
+                    seen.add(t.id)
+                    out.append(t)
+        return out
+
+
+class DwellTracker:
+    """
+    Per-cursor hover + dwell state. update() returns the target under the
+    cursor, how long it has been there, and whether the dwell threshold was
+    crossed on this very call.
+    """
+    def __init__(self, index, dwell_seconds=None):
+        self.index = index
+        self.dwell_seconds = config.HIT_DWELL_SECONDS if dwell_seconds is None else dwell_seconds
+        self._state = {}  # cursor id -> [target, since, fired]
+
+    def update(self, cursor_id, x, y, now):
+        target = self.index.topmost(x, y)
+        state = self._state.get(cursor_id)
+
+        if state is None or state[0] is not target:
+            state = self._state[cursor_id] = [target, now, False]
+
+        dwell = now - state[1] if target is not None else 0.0
+        fired = False
+        if target is not None and not state[2] and dwell >= self.dwell_seconds:
+            state[2] = True
+            fired = True
+        return target, dwell, fired
+
+    def hovered(self, cursor_id):
+        state = self._state.get(cursor_id)
+        return state[0] if state else None
+
+    def forget(self, cursor_id):
+        self._state.pop(cursor_id, None)
@@ -0,0 +1,312 @@
+# input_backends.py — Selectable cursor input sources
+#
+#   hand     MediaPipe Hands on the camera (hand_cursor_tracker.py)
+#   pose     MediaPipe Pose on the camera (palm_tracker.py)
+#   mouse    pygame mouse, left button = pinch; no cv2 / mediapipe at all
+#   replay   session folder written by batch_extract.py, played in real time
+#   remote   samples streamed by a tracker_net.py server (other process / host)
+#
+# Every backend yields (frame, HandSample) from process_frame(), like the
+# trackers; (None, None) is a failed read unless the backend set no_sample
+# (nothing new was due — e.g. a remote read timing out), which is not an
+# error and must not trigger the read-failure backoff. Constructing a backend is cheap; heavy modules are imported in
+# open(), which App runs on the tracker executor while the window is
+# already up. Backends whose process_frame() blocks on a camera / file are
+# driven from that executor, the others are polled on the event loop.
+#
+# Readiness is tracked as flags with their perf_counter() times, so App can
+# gate input (config.INPUT_GATE) and log cold-start phases. Camera backends
+# also warm the model up on blank frames inside open().
+import os
+import time
+from enum import IntFlag
+
+import numpy as np
+import config
+import hands_model
+from anchor import FusedAnchor, index_mcp
+from continuity import TrackingContinuity
+from gestures import Gesture, GestureEngine
+from samples import HandSample, freeze
+
+
+class Readiness(IntFlag):
+    NONE = 0
+    CAMERA_OPEN = 1
+    MODEL_LOADED = 2
+    WARMED_UP = 4
+    FIRST_DETECTION = 8
+
+    @classmethod
+    def parse(cls, name):
+        """config.INPUT_GATE string ("warmed_up", ...) -> flag."""
+        return cls[name.upper()]
+
+    @classmethod
+    def gate(cls, name):
+        """The named phase and every phase before it ("warmed_up" needs the camera open too)."""
+        flag = cls.parse(name)
+        return cls(flag | (flag - 1))
+
+
+class InputBackend:
+    name = ""
+    blocking = True        # process_frame() waits for I/O → run it on the tracker executor
+    screen_space = False   # samples are 0..1 of the window already (skip calibration)
+    poll_interval = 0.0    # seconds between polls for non-blocking backends
+
+    def __init__(self):
+        self.presence = None       # PresenceMonitor, camera backends only
+        self.continuity = None     # TrackingContinuity, backends that see detection on/off
+        self.exhausted = False     # finite source played out: process_frame() has nothing more
+        self.no_sample = False     # last process_frame() had nothing new yet (not a failure)
+        self.import_seconds = 0.0  # heavy imports done by open()
+        self.open_seconds = 0.0    # open() total, imports included
+        self.readiness = Readiness.NONE
+        self.ready_at = {}         # Readiness flag -> perf_counter() when reached
+
+    def _ready(self, flag):
+        if isinstance(flag, str):
+            flag = Readiness.parse(flag)
+        if not self.readiness & flag:
+            self.ready_at[flag] = time.perf_counter()
+            self.readiness |= flag
+
+    def _detected(self, sample):
+        if sample is not None and sample.present and not self.readiness & Readiness.FIRST_DETECTION:
+            self._ready(Readiness.FIRST_DETECTION)
+        return sample
+
+    def open(self):
+        """Without a camera or model there is nothing to wait for."""
+        for flag in (Readiness.CAMERA_OPEN, Readiness.MODEL_LOADED, Readiness.WARMED_UP):
+            self._ready(flag)
+
+    def process_frame(self):
+        """Returns (frame, HandSample), (frame, None) if skipped, or (None, None) on a failed read."""
+        raise NotImplementedError
+
+    def release(self):
+        pass
+
+
+class _CameraBackend(InputBackend):
+    def __init__(self, source=0):
+        super().__init__()
+        self.source = source
+        self.tracker = None
+
+    def _import(self):
+        """Import and return the tracker class (cv2 + mediapipe come with it)."""
+        raise NotImplementedError
+
+    def open(self):
+        start = time.perf_counter()
+        tracker_cls = self._import()
+        if config.PRESENCE_ENABLED:
+            from presence import PresenceMonitor
+            self.presence = PresenceMonitor()
+        self.import_seconds = time.perf_counter() - start
+
+        self.tracker = tracker_cls(source=self.source, presence=self.presence,
+                                   on_ready=self._ready)
+        if not self.readiness & Readiness.CAMERA_OPEN:
+            self.tracker.release()
+            self.tracker = None
+            raise OSError(f"camera {self.source!r} unavailable")
+        self.tracker.warm_up()
+        self.continuity = getattr(self.tracker, "continuity", None)
+        self._ready(Readiness.WARMED_UP)
+        self.open_seconds = time.perf_counter() - start
+
+    def process_frame(self):
+        frame, sample = self.tracker.process_frame()
+        return frame, self._detected(sample)
+
+    def release(self):
+        if self.tracker is not None:
+            self.tracker.release()
+
+
+class HandBackend(_CameraBackend):
+    name = "hand"
+
+    def _import(self):
+        from hand_cursor_tracker import HandCursorTracker
+        return HandCursorTracker
+
+
+class PoseBackend(_CameraBackend):
+    name = "pose"
+
+    def _import(self):
+        from palm_tracker import PalmTracker
+        return PalmTracker
+
+
+class MouseBackend(InputBackend):
+    name = "mouse"
+    blocking = False
+    screen_space = True
+
+    def __init__(self):
+        super().__init__()
+        self.poll_interval = 1.0 / config.TARGET_FPS
+        self.seq = 0
+
+    def process_frame(self):
+        import pygame  # already initialised by App; keeps this module pygame-free
+
+        self.seq += 1
+        w, h = pygame.display.get_surface().get_size()
+        mx, my = pygame.mouse.get_pos()
+        pressed = pygame.mouse.get_pressed()[0]
+        sample = HandSample(
+            t=time.perf_counter(),
+            seq=self.seq,
+            x=mx / w,
+            y=my / h,
+            present=bool(pygame.mouse.get_focused()),
+            confidence=1.0,
+            gestures=Gesture.PINCH if pressed else Gesture.NONE,
+        )
+        return None, self._detected(sample)
+
+
+class ReplayBackend(InputBackend):
+    """Plays t.npy / landmarks.npy / score.npy from a batch_extract.py session folder."""
+    name = "replay"
+
+    def __init__(self, path=None, loop=True):
+        super().__init__()
+        self.path = path or config.REPLAY_PATH
+        self.loop = loop
+        self.gesture_engine = GestureEngine()
+        self.anchor = FusedAnchor() if config.CURSOR_ANCHOR == "fused" else None
+        self.continuity = TrackingContinuity()  # recorded presence; no inference times
+        self.index = 0
+        self.seq = 0
+        self._start = None
+        self._last = HandSample(t=0.0, seq=0, x=0.5, y=0.5, present=False)
+
+    def open(self):
+        start = time.perf_counter()
+        if not self.path:
+            raise ValueError("replay backend needs a session folder (--replay / REPLAY_PATH)")
+        self.t = np.load(os.path.join(self.path, "t.npy"), mmap_mode="r")
+        self.landmarks = np.load(os.path.join(self.path, "landmarks.npy"), mmap_mode="r")
+        self.score = np.load(os.path.join(self.path, "score.npy"), mmap_mode="r")
+        for name, (recorded, current) in hands_model.mismatch(self.path).items():
+            print(f"replay: session extracted with {name}={recorded}, config has {current}")
+        super().open()
+        self.open_seconds = time.perf_counter() - start
+
+    def process_frame(self):
+        if self.index >= len(self.t):
+            if not self.loop or not len(self.t):
+                self.exhausted = True
+                return None, None
+            self.index = 0
+            self._start = None
+            self.gesture_engine.reset()
+            if self.anchor is not None:
+                self.anchor.reset()
+
+        i = self.index
+        self.index += 1
+
+        # pace to the recorded timestamps
+        now = time.perf_counter()
+        if self._start is None:
+            self._start = now - float(self.t[i])
+        delay = self._start + float(self.t[i]) - now
+        if delay > 0:
+            time.sleep(delay)
+            now = time.perf_counter()
+
+        self.seq += 1
+        points = np.array(self.landmarks[i], dtype=np.float32)
+        self.continuity.update(not np.isnan(points[0, 0]), now=now)
+        if np.isnan(points[0, 0]):
+            self.gesture_engine.reset()
+            if self.anchor is not None:
+                self.anchor.reset()
+            last = self._last
+            sample = HandSample(t=now, seq=self.seq, x=last.x, y=last.y, present=False)
+        else:
+            freeze(points)
+            x, y = self.anchor.update(points, now) if self.anchor is not None else index_mcp(points)
+            sample = HandSample(
+                t=now,
+                seq=self.seq,
+                x=x,
+                y=y,
+                present=True,
+                landmarks=points,
+                confidence=float(self.score[i]),
+                gestures=self.gesture_engine.classify(points, now),
+            )
+        self._last = sample
+        return None, self._detected(sample)
+
+
+class RemoteBackend(InputBackend):
+    """Newest sample from a TrackerServer; lost / late packets are skipped."""
+    name = "remote"
+
+    def __init__(self, address=None, timeout=0.1):
+        super().__init__()
+        self.address = address or config.TRACKER_ADDRESS
+        self.timeout = timeout
+        self.client = None
+
+    def open(self):
+        start = time.perf_counter()
+        from tracker_net import TrackerClient
+        self.client = TrackerClient(self.address)
+        self.client.ping()  # subscribes and starts the clock-offset estimate
+        super().open()
+        self.open_seconds = time.perf_counter() - start
+
+    def process_frame(self):
+        client = self.client
+        deadline = time.perf_counter() + self.timeout
+        sample = client.poll()
+        while sample is None:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                self.no_sample = True  # no packet in the window: the server is just quiet
+                return None, None
+            client.wait(remaining)
+            sample = client.poll()
+        self.no_sample = False
+        return None, self._detected(sample)
+
+    def release(self):
+        if self.client is not None:
+            self.client.close()
+
+
+BACKENDS = {
+    "hand": HandBackend,
+    "pose": PoseBackend,
+    "mouse": MouseBackend,
+    "replay": ReplayBackend,
+    "remote": RemoteBackend,
+}
+
+
+def default_backend_name():
+    """config.INPUT_BACKEND, else the legacy USE_MOUSE / TRACKING_MODE switches."""
+    if config.INPUT_BACKEND:
+        return config.INPUT_BACKEND
+    return "mouse" if config.USE_MOUSE else config.TRACKING_MODE
+
+
+def create_backend(name=None, **kwargs):
+    name = name or default_backend_name()
+    try:
+        cls = BACKENDS[name]
+    except KeyError:
+        raise ValueError(f"unknown input backend {name!r} (choose from {', '.join(BACKENDS)})")
+    return cls(**kwargs)
@@ -0,0 +1,213 @@
+# memory_monitor.py — RSS / tracemalloc growth tracking for long-running units
+#
+# Two levels, picked with config.MEMORY_MONITOR:
+#
+#   "rss"          resident set size every MEMORY_RSS_SECONDS. Costs a
+#                  /proc read, so it can stay on for weeks.
+#   "tracemalloc"  also a tracemalloc snapshot every MEMORY_SNAPSHOT_SECONDS,
+#                  compared with the baseline snapshot and grouped per module.
+#                  Every Python allocation is traced, so this is for soak
+#                  runs and field investigations, not the default.
+#
+# The baseline is taken MEMORY_BASELINE_AFTER seconds in, once sprite
+# caches, the model and the first level are loaded; growth is measured
+# from there. Every MEMORY_ALERT_MB of RSS growth raises an alert (printed
+# and passed to listeners, e.g. telemetry).
+#
+# pygame surfaces (SDL) and MediaPipe's C++ allocations never show up in
+# tracemalloc. With tracing on, RSS minus traced memory is that native side
+# plus allocator fragmentation: if it keeps growing while traced memory
+# stays flat, the leak or fragmentation is not in Python objects.
+import os
+import time
+import tracemalloc
+from collections import deque
+
+import config
+
+MB = 1024 * 1024
+PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+# the monitor's own bookkeeping is not what we are looking for
+SNAPSHOT_FILTERS = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, __file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, "<unknown>"),
+)
+
+
+def read_rss():
+    """Resident set size in bytes, or None where it cannot be read."""
+    try:
+        with open("/proc/self/statm", "rb") as f:
+            return int(f.read().split()[1]) * PAGE_SIZE
+    except (OSError, ValueError, IndexError):
+        pass
+    try:
+        import psutil  # optional: Windows / macOS kiosks
+    except ImportError:
+        return None
+    return psutil.Process().memory_info().rss
+
+
+def module_name(filename):
+    """'/.../site-packages/numpy/core/x.py' -> 'numpy', '/.../cursor.py' -> 'cursor'."""
+    parts = filename.replace("\\", "/").split("/")
+    for marker in ("site-packages", "dist-packages"):
+        if marker in parts:
+            i = parts.index(marker)
+            if i + 1 < len(parts):
+                return os.path.splitext(parts[i + 1])[0]
+    return os.path.splitext(parts[-1])[0]
+
+
+class MemoryMonitor:
+    def __init__(self, mode=None, rss_interval=None, snapshot_interval=None,
+                 baseline_after=None, alert_mb=None, trace_frames=None, source=time.perf_counter):
+        self.mode = config.MEMORY_MONITOR if mode is None else mode
+        self.tracing = self.mode == "tracemalloc"
+        self.rss_interval = rss_interval or config.MEMORY_RSS_SECONDS
+        self.snapshot_interval = snapshot_interval or config.MEMORY_SNAPSHOT_SECONDS
+        self.baseline_after = config.MEMORY_BASELINE_AFTER if baseline_after is None else baseline_after
+        self.alert_bytes = (alert_mb or config.MEMORY_ALERT_MB) * MB
+        self._source = source
+
+        self._started_tracing = False
+        if self.tracing and not tracemalloc.is_tracing():
+            tracemalloc.start(trace_frames or config.MEMORY_TRACE_FRAMES)
+            self._started_tracing = True
+
+        self.started = source()
+        self._next_rss = self.started
+        self._next_snapshot = self.started + self.baseline_after  # first one is the baseline
+
+        self.samples = deque(maxlen=4096)  # (t, rss bytes)
+        self.rss = None
+        self.peak_rss = 0
+        self.baseline_rss = None
+        self.baseline_at = None
+        self._next_alert = self.alert_bytes
+
+        self._baseline_snapshot = None
+        self.traced = None          # current tracemalloc total (bytes)
+        self.baseline_traced = None
+        self.module_growth = []     # [(module, bytes)] largest growth first, from the last snapshot
+
+        self._listeners = []        # fn(monitor, growth_bytes, message)
+        self.alerts = []            # (time, growth bytes, message)
+
+    def add_listener(self, fn):
+        self._listeners.append(fn)
+
+    # ---------------------------------------------------------
+    # SAMPLING
+    # ---------------------------------------------------------
+    def poll(self, now=None):
+        """Sample whatever is due; cheap when nothing is."""
+        now = self._source() if now is None else now
+        if now >= self._next_rss:
+            self._next_rss = now + self.rss_interval
+            self.sample_rss(now)
+        if self.tracing and now >= self._next_snapshot:
+            self._next_snapshot = now + self.snapshot_interval
+            self.snapshot(now)
+
+    def sample_rss(self, now=None):
+        now = self._source() if now is None else now
+        rss = read_rss()
+        if rss is None:
+            return None
+        self.rss = rss
+        self.peak_rss = max(self.peak_rss, rss)
+        self.samples.append((now, rss))
+
+        if self.baseline_rss is None:
+            if now - self.started >= self.baseline_after:
+                self.baseline_rss = rss
+                self.baseline_at = now
+            return rss
+
+        growth = rss - self.baseline_rss
+        if growth >= self._next_alert:
+            self._next_alert = growth + self.alert_bytes
+            self._alert(now, growth)
+        return rss
+
+    def snapshot(self, now=None):
+        """tracemalloc snapshot; per-module growth against the baseline snapshot."""
+        if not tracemalloc.is_tracing():
+            return
+        traced = tracemalloc.get_traced_memory()[0]
+        snap = tracemalloc.take_snapshot().filter_traces(SNAPSHOT_FILTERS)
+        self.traced = traced
+        if self._baseline_snapshot is None:
+            self._baseline_snapshot = snap
+            self.baseline_traced = self.traced
+            return
+
+        growth = {}
+        for stat in snap.compare_to(self._baseline_snapshot, "filename"):
+            module = module_name(stat.traceback[0].filename)
+            growth[module] = growth.get(module, 0) + stat.size_diff
+        self.module_growth = sorted(growth.items(), key=lambda item: -item[1])
+
+    # ---------------------------------------------------------
+    # ANALYSIS
+    # ---------------------------------------------------------
+    @property
+    def growth(self):
+        if self.baseline_rss is None or self.rss is None:
+            return 0
+        return self.rss - self.baseline_rss
+
+    def growth_rate(self):
+        """Least-squares RSS slope since the baseline, bytes per hour."""
+        if self.baseline_at is None:
+            return 0.0
+        points = [(t, rss) for t, rss in self.samples if t >= self.baseline_at]
+        n = len(points)
+        if n < 2:
+            return 0.0
+        mean_t = sum(t for t, _ in points) / n
+        mean_r = sum(r for _, r in points) / n
+        var = sum((t - mean_t) ** 2 for t, _ in points)
+        if var == 0.0:
+            return 0.0
+        cov = sum((t - mean_t) * (r - mean_r) for t, r in points)
+        return cov / var * 3600.0
+
+    def _top_modules(self, n=3):
+        return ", ".join(f"{m} {size / MB:+.1f} MB" for m, size in self.module_growth[:n] if size > 0)
+
+    def _alert(self, now, growth):
+        message = (f"RSS {growth / MB:+.1f} MB since baseline "
+                   f"({self.growth_rate() / MB:+.1f} MB/h)")
+        top = self._top_modules()
+        if top:
+            message += f"; top: {top}"
+        self.alerts.append((now, growth, message))
+        print(f"memory: {message}")
+        for fn in self._listeners:
+            fn(self, growth, message)
+
+    def report(self):
+        if self.rss is None:
+            return "memory       rss unavailable"
+        lines = [f"memory       rss={self.rss / MB:.1f}MB peak={self.peak_rss / MB:.1f}MB "
+                 f"growth={self.growth / MB:+.1f}MB ({self.growth_rate() / MB:+.2f} MB/h) "
+                 f"alerts={len(self.alerts)}"]
+        if self.traced is not None:
+            untraced = self.rss - self.traced
+            lines.append(f"             traced={self.traced / MB:.1f}MB "
+                         f"({(self.traced - (self.baseline_traced or 0)) / MB:+.1f}MB) "
+                         f"untraced={untraced / MB:.1f}MB (native / SDL / fragmentation)")
+        for module, size in self.module_growth[:5]:
+            lines.append(f"             {module:<24} {size / 1024:+10.1f} KB")
+        return "\n".join(lines)
+
+    def close(self):
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
@@ -1,41 +1,102 @@
+import time
+
 import cv2
 import mediapipe as mp
+import numpy as np
+import config
+from samples import HandSample
+
+# config.POSE_LANDMARK → PoseLandmark name suffix
+POSE_LANDMARKS = {
+    "wrist": "WRIST",
+    "index": "INDEX",
+    "foot": "FOOT_INDEX",
+}
 
 
 class PalmTracker:
-    def __init__(self):
-        self.cap = cv2.VideoCapture(0)
+    def __init__(self, source=0, presence=None, landmark=None, side=None, on_ready=None):
+        # on_ready(phase) is called with "camera_open" / "model_loaded" as they happen
+        on_ready = on_ready or (lambda phase: None)
+
+        self.cap = cv2.VideoCapture(source)
+        if self.cap.isOpened():
+            on_ready("camera_open")
 
         self.mp_pose = mp.solutions.pose
-        self.pose = self.mp_pose.Pose()
+        self.pose = self.mp_pose.Pose(
+            static_image_mode=False,
+            model_complexity=config.POSE_MODEL_COMPLEXITY,
+            smooth_landmarks=config.POSE_SMOOTH_LANDMARKS,
+            enable_segmentation=False,
+            min_detection_confidence=config.POSE_MIN_DET_CONF,
+            min_tracking_confidence=config.POSE_MIN_TRK_CONF,
+        )
+        on_ready("model_loaded")
+
+        landmark = landmark or config.POSE_LANDMARK
+        side = (side or config.POSE_SIDE).upper()
+        self.landmark = self.mp_pose.PoseLandmark[f"{side}_{POSE_LANDMARKS[landmark]}"]
+
+        # optional PresenceMonitor (same idle gating as the hand tracker)
+        self.presence = presence
 
-        # last known coords (for stability)
-        self.x = 0
-        self.y = 0
+        # last known coords (for stability), normalised floats
+        self.seq = 0
+        self.last_sample = HandSample(t=time.perf_counter(), seq=0, x=0.5, y=0.5, present=False)
+
+    def warm_up(self, frames=None):
+        """Run Pose on blank frames so graph init is paid before real input."""
+        frames = config.WARMUP_FRAMES if frames is None else frames
+        blank = np.zeros((config.CAMERA_HEIGHT, config.CAMERA_WIDTH, 3), dtype=np.uint8)
+        for _ in range(frames):
+            self.pose.process(blank)
 
     def process_frame(self):
-        """Returns: (frame, (x, y)) — coordinates of LEFT_FOOT_INDEX"""
+        """
+        Returns: (frame, HandSample) for the configured pose landmark — the
+        same record as HandCursorTracker, so it plugs into the same cursor
+        pipeline. Pose has no hand landmarks, pinch or gestures.
+        """
 
         ret, frame = self.cap.read()
+        now = time.perf_counter()
         if not ret:
-            return None, (self.x, self.y)
+            return None, None
 
+        self.seq += 1
         frame = cv2.flip(frame, 1)
+
+        if self.presence is not None and not self.presence.should_infer(frame, now):
+            return frame, None
+
         rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        start = time.perf_counter()
         results = self.pose.process(rgb)
+        inference = time.perf_counter() - start
 
-        h, w, _ = frame.shape
-
+        point = None
         if results.pose_landmarks:
-            foot = results.pose_landmarks.landmark[
-                self.mp_pose.PoseLandmark.LEFT_WRIST_INDEX
-            ]
+            point = results.pose_landmarks.landmark[self.landmark]
+            # off-frame landmarks are still extrapolated; only trust visible ones
+            if point.visibility < config.POSE_MIN_VISIBILITY:
+                point = None
+
+        present = point is not None
+        if self.presence is not None:
+            self.presence.update(present)
 
-            self.x = int(foot.x * w)
-            self.y = int(foot.y * h)
+        if present:
+            sample = HandSample(t=now, seq=self.seq, x=point.x, y=point.y, present=True,
+                                confidence=point.visibility, inference=inference)
+        else:
+            last = self.last_sample
+            sample = HandSample(t=now, seq=self.seq, x=last.x, y=last.y, present=False,
+                                inference=inference)
+        self.last_sample = sample
 
         # return coords (no drawings)
-        return frame, (self.x, self.y)
+        return frame, sample
 
     def release(self):
         self.cap.release()
@@ -0,0 +1,95 @@
+# precondition.py — LUT gamma / contrast normalisation before hand inference
+#
+# Dim rooms give MediaPipe low-contrast, noisy hands. Tracking confidence
+# then drops below MP_MIN_TRK_CONF and every loss costs a palm-detector
+# re-run. One 256-entry LUT (cv2.LUT: one table lookup per byte) lifts
+# the image before inference; the displayed camera frame and the motion
+# check are left alone.
+#
+#   "off"    frames pass through untouched
+#   "gamma"  fixed PRECONDITION_GAMMA
+#   "auto"   every PRECONDITION_EVERY frames the mean luminance of a
+#            1/8-subsampled frame is measured. Below PRECONDITION_DIM_BELOW
+#            the LUT stretches the PRECONDITION_CLIP percentiles to full
+#            range and picks the gamma that brings the mean to
+#            PRECONDITION_TARGET. It disengages 10 levels above the
+#            threshold. Parameters are quantised, so the LUT is rebuilt
+#            only when the room actually changes.
+#
+# benchmarks/bench_tracking_continuity.py tunes these on recorded videos.
+import math
+
+import cv2
+import numpy as np
+import config
+
+GAMMA_MIN = 0.4      # strongest brightening auto mode will apply
+GAMMA_STEP = 0.05
+LEVEL_STEP = 4       # contrast-stretch bounds are quantised to this many grey levels
+HYSTERESIS = 10
+
+
+def build_lut(gamma=1.0, lo=0, hi=255):
+    """(256,) uint8: stretch [lo, hi] to [0, 255], then apply gamma (< 1 brightens)."""
+    x = (np.arange(256, dtype=np.float64) - lo) / max(hi - lo, 1)
+    return (np.clip(x, 0.0, 1.0) ** gamma * 255.0 + 0.5).astype(np.uint8)
+
+
+class FramePreconditioner:
+    def __init__(self, mode=None, gamma=None, dim_below=None, target=None, clip=None, every=None):
+        self.mode = mode or config.PRECONDITION_MODE
+        self.dim_below = config.PRECONDITION_DIM_BELOW if dim_below is None else dim_below
+        self.target = target or config.PRECONDITION_TARGET
+        self.clip = config.PRECONDITION_CLIP if clip is None else clip
+        self.every = every or config.PRECONDITION_EVERY
+
+        self.params = None      # (gamma, lo, hi) of the current LUT, None = pass-through
+        self.lut = None
+        self.luminance = None   # last measured mean (0..255)
+        self.rebuilds = 0
+        self._frames = 0
+
+        if self.mode == "gamma":
+            self._set((gamma or config.PRECONDITION_GAMMA, 0, 255))
+        elif self.mode not in ("off", "auto"):
+            raise ValueError(f"unknown PRECONDITION_MODE {self.mode!r}")
+
+    @property
+    def active(self):
+        return self.lut is not None
+
+    def _set(self, params):
+        if params == self.params:
+            return
+        self.params = params
+        self.lut = None if params is None else build_lut(*params)
+        self.rebuilds += 1
+
+    def choose(self, frame):
+        """Auto mode: LUT parameters for this scene, or None when it is bright enough."""
+        sample = frame[::8, ::8]
+        mean = self.luminance = float(sample.mean())
+        threshold = self.dim_below + (HYSTERESIS if self.active else 0)
+        if mean >= threshold:
+            return None
+
+        lo, hi = np.percentile(sample, (self.clip, 100.0 - self.clip))
+        lo = int(lo) // LEVEL_STEP * LEVEL_STEP
+        hi = min(255, -(-int(hi) // LEVEL_STEP) * LEVEL_STEP)
+        if hi - lo < 16:
+            return None  # (nearly) black frame: nothing to stretch
+
+        stretched = min(max((mean - lo) / (hi - lo), 1e-3), 0.999)
+        gamma = math.log(self.target / 255.0) / math.log(stretched)
+        gamma = min(max(round(gamma / GAMMA_STEP) * GAMMA_STEP, GAMMA_MIN), 1.0)
+        return round(gamma, 2), lo, hi
+
+    def __call__(self, frame):
+        """Preconditioned copy of a uint8 frame (or the frame itself when off / bright)."""
+        if self.mode == "auto":
+            if self._frames % self.every == 0:
+                self._set(self.choose(frame))
+            self._frames += 1
+        if self.lut is None:
+            return frame
+        return cv2.LUT(frame, self.lut)
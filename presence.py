@@ -0,0 +1,109 @@
+# presence.py — Hand-presence gating for the tracking thread
+#
+# While a hand is visible every frame goes through MediaPipe. After
+# PRESENCE_IDLE_AFTER seconds without a hand we only run inference at
+# IDLE_DETECT_HZ, unless a cheap motion check (frame difference on a tiny
+# grey image) fires — then the very next frame is processed at full cost.
+import time
+
+import cv2
+import config
+from histogram import Histogram, linear_edges
+
+
+class PresenceMonitor:
+    def __init__(self, idle_after=None, idle_detect_hz=None, motion_threshold=None,
+                 source=time.perf_counter):
+        self.idle_after = config.PRESENCE_IDLE_AFTER if idle_after is None else idle_after
+        self.idle_detect_hz = idle_detect_hz or config.IDLE_DETECT_HZ
+        self.motion_threshold = (config.MOTION_THRESHOLD if motion_threshold is None
+                                 else motion_threshold)
+        self._source = source
+
+        now = source()
+        self.present = False
+        self._last_seen = now
+        self._last_inference = 0.0
+        self._prev_small = None
+        self._motion_since = None  # first motion of the current wake-up (for wake latency)
+
+        # instrumentation
+        self.wake_latency = Histogram(linear_edges(0.0, 2.0, 0.01))  # first motion -> hand found (s)
+        self.inferences = 0
+        self.skipped = 0
+        self._cpu_mark = (time.process_time(), now)
+        self.cpu = {"active": [0.0, 0.0], "idle": [0.0, 0.0]}  # [cpu s, wall s]
+
+    # ---------------------------------------------------------
+
+    @property
+    def idle(self):
+        return self._source() - self._last_seen > self.idle_after
+
+    def _motion(self, frame):
+        small = cv2.resize(frame, config.MOTION_SIZE, interpolation=cv2.INTER_AREA)
+        small = cv2.cvtColor(small, cv2.COLOR_BGR2GRAY)
+
+        prev = self._prev_small
+        self._prev_small = small
+        if prev is None:
+            return True
+        return cv2.absdiff(small, prev).mean() > self.motion_threshold
+
+    def should_infer(self, frame, now=None):
+        """Decide whether this camera frame is worth a MediaPipe pass."""
+        now = self._source() if now is None else now
+        self._account_cpu(now)
+
+        if not self.idle:
+            self._prev_small = None
+            self._motion_since = None
+            self.inferences += 1
+            self._last_inference = now
+            return True
+
+        if self._motion(frame):
+            # kept across frames without a hand until detection or the motion stops
+            if self._motion_since is None:
+                self._motion_since = now
+        else:
+            self._motion_since = None  # back to throttled detection: that wake-up is over
+            if now - self._last_inference < 1.0 / self.idle_detect_hz:
+                self.skipped += 1
+                return False
+
+        self.inferences += 1
+        self._last_inference = now
+        return True
+
+    def update(self, hand_found, now=None):
+        """Report the inference result for the frame just processed."""
+        now = self._source() if now is None else now
+
+        if hand_found:
+            if not self.present and self._motion_since is not None:
+                self.wake_latency.add(now - self._motion_since)
+            self.present = True
+            self._last_seen = now
+            self._motion_since = None
+        else:
+            self.present = False
+
+    # ---------------------------------------------------------
+
+    def _account_cpu(self, now):
+        cpu_now = time.process_time()
+        cpu_prev, wall_prev = self._cpu_mark
+        bucket = self.cpu["idle" if self.idle else "active"]
+        bucket[0] += cpu_now - cpu_prev
+        bucket[1] += now - wall_prev
+        self._cpu_mark = (cpu_now, now)
+
+    def report(self):
+        lines = []
+        for state, (cpu, wall) in self.cpu.items():
+            pct = 100.0 * cpu / wall if wall else 0.0
+            lines.append(f"{state:<7} cpu {pct:5.1f}% of one core over {wall:7.1f}s")
+        lines.append(f"wake    {self.wake_latency.summary()}")
+        lines.append(f"frames  inferred={self.inferences} skipped={self.skipped}")
+        return "\n".join(lines)
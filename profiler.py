@@ -0,0 +1,161 @@
+# profiler.py — Sampling profiler that can be toggled in a running app
+#
+# A daemon thread wakes every PROFILE_INTERVAL seconds, reads every other
+# thread's current Python stack with sys._current_frames() and counts it.
+# Nothing is hooked into the profiled code, so the main (render) thread and
+# the tracker executor run at full speed; when stopped, the thread does not
+# exist and the cost is zero.
+#
+# stop() writes two files to PROFILE_DIR (halt() + finish() split it so the
+# join and the write can run off the render loop):
+#   profile-<time>.collapsed   "thread;outer;...;inner count" lines, for
+#                              flamegraph.pl / speedscope / inferno
+#   profile-<time>.txt         per-function self / total sample percentages
+#
+# In the app: PROFILE_HOTKEY (default F9) or SIGUSR1 toggles it;
+# main.py --profile starts it with the app.
+import os
+import sys
+import threading
+import time
+
+import config
+
+
+class SamplingProfiler:
+    def __init__(self, interval=None, out_dir=None, max_seconds=None):
+        self.interval = interval or config.PROFILE_INTERVAL
+        self.out_dir = out_dir or config.PROFILE_DIR
+        self.max_seconds = config.PROFILE_MAX_SECONDS if max_seconds is None else max_seconds
+
+        self._thread = None
+        self._stop = threading.Event()
+        self._labels = {}      # code object -> "func (file:line)"
+        self.stacks = {}       # (thread name, label, ...) outermost first -> samples
+        self.samples = 0
+        self.started = None
+        self.elapsed = 0.0
+
+    @property
+    def running(self):
+        return self._thread is not None
+
+    # ---------------------------------------------------------
+    # CONTROL
+    # ---------------------------------------------------------
+    def start(self):
+        if self.running:
+            return
+        self.stacks = {}
+        self.samples = 0
+        self.elapsed = 0.0
+        self.started = time.perf_counter()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="profiler", daemon=True)
+        self._thread.start()
+        print(f"profiler: started ({1.0 / self.interval:.0f} Hz)")
+
+    def halt(self):
+        """Tell the sampling thread to stop without waiting; returns it for finish(), or None."""
+        if not self.running:
+            return None
+        self._stop.set()
+        thread, self._thread = self._thread, None
+        self.elapsed = time.perf_counter() - self.started
+        return thread
+
+    def finish(self, thread):
+        """Join a halted sampling thread and write the results (blocking). Returns the paths."""
+        thread.join()
+        paths = self.write()
+        print(f"profiler: {self.samples} samples in {self.elapsed:.1f} s -> {paths[0]}")
+        return paths
+
+    def stop(self):
+        """Stop sampling and write the results. Returns the written paths, or None."""
+        thread = self.halt()
+        return None if thread is None else self.finish(thread)
+
+    def toggle(self):
+        if self.running:
+            return self.stop()
+        self.start()
+        return None
+
+    # ---------------------------------------------------------
+    # SAMPLING THREAD
+    # ---------------------------------------------------------
+    def _label(self, code):
+        label = self._labels.get(code)
+        if label is None:
+            label = f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+            self._labels[code] = label
+        return label
+
+    def _run(self):
+        own = threading.get_ident()
+        stacks = self.stacks
+        label = self._label
+        deadline = self.started + self.max_seconds if self.max_seconds else None
+
+        while not self._stop.wait(self.interval):
+            names = {t.ident: t.name for t in threading.enumerate()}
+            for ident, frame in sys._current_frames().items():
+                if ident == own:
+                    continue
+                stack = []
+                while frame is not None:
+                    stack.append(label(frame.f_code))
+                    frame = frame.f_back
+                stack.append(names.get(ident, str(ident)))
+                key = tuple(reversed(stack))
+                stacks[key] = stacks.get(key, 0) + 1
+            self.samples += 1
+            if deadline is not None and time.perf_counter() >= deadline:
+                break  # forgotten toggle: stop collecting, stop() still writes
+
+    # ---------------------------------------------------------
+    # OUTPUT
+    # ---------------------------------------------------------
+    def collapsed(self):
+        """Brendan Gregg's collapsed-stack format, heaviest stacks first."""
+        lines = []
+        for stack, count in sorted(self.stacks.items(), key=lambda item: -item[1]):
+            lines.append(";".join(part.replace(";", ":") for part in stack) + f" {count}")
+        return "\n".join(lines) + "\n"
+
+    def summary(self, limit=40):
+        """Per-function self and total (inclusive) samples, by thread."""
+        threads = {}
+        for stack, count in self.stacks.items():
+            thread = stack[0]
+            total_self, totals, selfs = threads.setdefault(thread, [0, {}, {}])
+            threads[thread][0] = total_self + count
+            for func in set(stack[1:]):
+                totals[func] = totals.get(func, 0) + count
+            if len(stack) > 1:
+                selfs[stack[-1]] = selfs.get(stack[-1], 0) + count
+
+        rate = self.samples / self.elapsed if self.elapsed else 0.0
+        lines = [f"{self.samples} samples over {self.elapsed:.2f} s "
+                 f"({rate:.0f} Hz, interval {self.interval * 1000.0:.1f} ms)"]
+        for thread, (samples, totals, selfs) in sorted(threads.items(), key=lambda item: -item[1][0]):
+            lines.append("")
+            lines.append(f"thread {thread}: {samples} samples")
+            lines.append(f"  {'self %':>7} {'total %':>8}  function")
+            ranked = sorted(totals, key=lambda f: (-selfs.get(f, 0), -totals[f]))
+            for func in ranked[:limit]:
+                lines.append(f"  {selfs.get(func, 0) * 100.0 / samples:7.1f} "
+                             f"{totals[func] * 100.0 / samples:8.1f}  {func}")
+        return "\n".join(lines) + "\n"
+
+    def write(self, stem=None):
+        os.makedirs(self.out_dir, exist_ok=True)
+        stem = stem or time.strftime("profile-%Y%m%d-%H%M%S")
+        base = os.path.join(self.out_dir, stem)
+        paths = (base + ".collapsed", base + ".txt")
+        with open(paths[0], "w", encoding="utf-8") as f:
+            f.write(self.collapsed())
+        with open(paths[1], "w", encoding="utf-8") as f:
+            f.write(self.summary())
+        return paths
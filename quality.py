@@ -0,0 +1,129 @@
+# quality.py — Frame-budget governor stepping between render quality tiers
+#
+# Every presented frame's cost (pacer wake → flip) goes into a fixed-bucket
+# histogram; each QUALITY_WINDOW frames its percentile is compared to the
+# frame budget (1 / TARGET_FPS):
+#
+#   above QUALITY_DEGRADE_AT x budget            → one tier down, right away
+#   below QUALITY_UPGRADE_AT x budget for
+#   QUALITY_UPGRADE_HOLD seconds                 → one tier up
+#
+# The gap between the two ratios plus the hold time is the hysteresis. An
+# upgrade that has to be undone within the hold time doubles the hold for
+# that tier, so a machine sitting on a boundary stops flip-flopping.
+import time
+from typing import NamedTuple
+
+import config
+from histogram import Histogram, linear_edges
+
+
+class QualityTier(NamedTuple):
+    name: str
+    glow_layers: int     # max glow rings around the idle cursor (skins have up to 4)
+    arc_step: int        # degrees between pinch-arc frames
+    screen_fades: bool   # full-screen red / green feedback fades
+    render_scale: float  # scene canvas size relative to the display
+
+
+TIERS = (
+    QualityTier("high", 4, config.CURSOR_ARC_STEP, True, 1.0),
+    QualityTier("medium", 2, 6, True, 1.0),
+    QualityTier("low", 1, 12, True, 0.75),
+    QualityTier("minimal", 0, 24, False, 0.5),
+)
+
+
+class QualityGovernor:
+    def __init__(self, target_hz=None, tiers=TIERS, start=None, source=time.perf_counter):
+        self.tiers = tiers
+        self.budget = 1.0 / (target_hz or config.TARGET_FPS)
+        self.window = config.QUALITY_WINDOW
+        self.percentile = config.QUALITY_PERCENTILE
+        self.degrade_at = config.QUALITY_DEGRADE_AT
+        self.upgrade_at = config.QUALITY_UPGRADE_AT
+        self.min_dwell = config.QUALITY_MIN_DWELL
+        self._source = source
+
+        names = [t.name for t in tiers]
+        self.index = names.index(start or config.QUALITY_START_TIER)
+
+        now = source()
+        self._costs = Histogram(linear_edges(0.0, 0.050, 0.00025))
+        self._changed_at = now
+        self._upgraded_at = None
+        self._good_since = None
+        self._upgrade_hold = [config.QUALITY_UPGRADE_HOLD] * len(tiers)  # per target tier
+
+        self._listeners = []   # fn(old_tier, new_tier, frame_cost_percentile)
+        self.changes = []      # (time, old name, new name, percentile seconds)
+        self.last_percentile = 0.0
+
+    @property
+    def tier(self):
+        return self.tiers[self.index]
+
+    def add_listener(self, fn):
+        self._listeners.append(fn)
+
+    # ---------------------------------------------------------
+
+    def add(self, frame_cost, now=None):
+        """Feed one presented frame's cost (s). Returns the new tier if it changed, else None."""
+        costs = self._costs
+        costs.add(frame_cost)
+        if costs.count < self.window:
+            return None
+
+        now = self._source() if now is None else now
+        p = costs.percentile(self.percentile)
+        costs.reset()
+        self.last_percentile = p
+
+        if p > self.budget * self.degrade_at:
+            self._good_since = None
+            if self.index + 1 < len(self.tiers):
+                current = self.index
+                hold = self._upgrade_hold[current]
+                undo = self._upgraded_at is not None and now - self._upgraded_at < hold
+                tier = self._change(current + 1, now, p)
+                if tier is not None:  # not blocked by min_dwell
+                    # undoing a recent upgrade: that tier needs a longer hold next time
+                    if undo:
+                        self._upgrade_hold[current] = min(hold * 2.0, config.QUALITY_UPGRADE_HOLD_MAX)
+                    self._upgraded_at = None
+                return tier
+            return None
+
+        if p < self.budget * self.upgrade_at and self.index > 0:
+            if self._good_since is None:
+                self._good_since = now
+            hold = self._upgrade_hold[self.index - 1]
+            if now - self._good_since >= hold:
+                tier = self._change(self.index - 1, now, p)
+                if tier is not None:
+                    self._good_since = None
+                    self._upgraded_at = now
+                return tier
+        else:
+            self._good_since = None
+        return None
+
+    def _change(self, index, now, percentile):
+        if now - self._changed_at < self.min_dwell:
+            return None
+        old = self.tier
+        self.index = index
+        self._changed_at = now
+        self.changes.append((now, old.name, self.tier.name, percentile))
+        for fn in self._listeners:
+            fn(old, self.tier, percentile)
+        return self.tier
+
+    def report(self):
+        lines = [f"quality      tier={self.tier.name} changes={len(self.changes)} "
+                 f"p{self.percentile:g}={self.last_percentile * 1000.0:.2f}ms "
+                 f"budget={self.budget * 1000.0:.2f}ms"]
+        for t, old, new, p in self.changes[-5:]:
+            lines.append(f"             {old} -> {new} (p{self.percentile:g} {p * 1000.0:.2f} ms)")
+        return "\n".join(lines)
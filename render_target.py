@@ -0,0 +1,59 @@
+# render_target.py — Scene canvas that can be smaller than the display
+#
+# Full-screen work (clear, fades, backgrounds) is drawn into `scene`. Its
+# size is the internal render resolution (RENDER_WIDTH x RENDER_HEIGHT,
+# default: the display) times the quality tier's render scale; when that
+# differs from the display it is an offscreen surface upscaled onto the
+# display once per frame by present(). The cursor and particles are drawn
+# on the display afterwards, at native resolution, so cursor coordinates
+# never go through the scale and stay exact.
+import pygame
+import config
+
+
+class RenderTarget:
+    def __init__(self, display, base_size=None, scale=1.0, smooth=None):
+        self.display = display
+        w, h = display.get_size()
+        bw, bh = base_size or (None, None)
+        self.base_size = (bw or w, bh or h)
+        self.smooth = config.RENDER_SMOOTH if smooth is None else smooth
+        self.scale = None
+        self.scene = display
+        self.set_scale(scale)
+
+    def set_scale(self, scale):
+        if scale == self.scale:
+            return
+        self.scale = scale
+        bw, bh = self.base_size
+        size = (max(1, round(bw * scale)), max(1, round(bh * scale)))
+        if size == self.display.get_size():
+            self.scene = self.display
+        else:
+            self.scene = pygame.Surface(size).convert(self.display)
+
+    @property
+    def scaled(self):
+        return self.scene is not self.display
+
+    def to_scene(self, x, y):
+        """Display pixels → scene-canvas pixels."""
+        sw, sh = self.scene.get_size()
+        w, h = self.display.get_size()
+        return x * sw / w, y * sh / h
+
+    def to_display(self, x, y):
+        """Scene-canvas pixels → display pixels."""
+        sw, sh = self.scene.get_size()
+        w, h = self.display.get_size()
+        return x * w / sw, y * h / sh
+
+    def present(self):
+        """Scale the scene canvas onto the display (no-op when it is the display)."""
+        if not self.scaled:
+            return
+        if self.smooth:
+            pygame.transform.smoothscale(self.scene, self.display.get_size(), self.display)
+        else:
+            pygame.transform.scale(self.scene, self.display.get_size(), self.display)
@@ -0,0 +1,38 @@
+# samples.py — Immutable tracker output record shared by every pipeline stage
+from operator import attrgetter
+from typing import NamedTuple, Optional
+
+import numpy as np
+
+from gestures import Gesture
+
+
+class HandSample(NamedTuple):
+    t: float                       # time.perf_counter() when the frame was captured
+    seq: int                       # per-tracker frame sequence number
+    x: float                       # cursor anchor, normalised camera coords (0..1)
+    y: float
+    present: bool                  # hand (or pose landmark) detected in this frame
+    landmarks: Optional[np.ndarray] = None  # (21, 3) float32, read-only; None if absent
+    confidence: float = 0.0        # detector / handedness score
+    handedness: str = ""           # "Left" / "Right" (MediaPipe label), "" if unknown
+    gestures: Gesture = Gesture.NONE
+    inference: float = 0.0         # seconds in the model for this frame; 0 = not inferred here
+
+    @property
+    def pinched(self):
+        return bool(self.gestures & Gesture.PINCH)
+
+
+_XYZ = attrgetter("x", "y", "z")
+
+
+def landmark_array(landmarks):
+    """MediaPipe landmark list -> (N, 3) float32, without a Python-level loop per landmark."""
+    return np.array(list(map(_XYZ, landmarks)), dtype=np.float32)
+
+
+def freeze(array):
+    """Mark a landmark array read-only so samples can be shared across threads."""
+    array.flags.writeable = False
+    return array
@@ -1,8 +1,9 @@
 # smooth.py — Adaptive smoothing + dead-zone filtering for cursor stabilization
 
 class CursorSmoother:
-    def __init__(self, dead_zone=12):
+    def __init__(self, dead_zone=12, responsiveness=1.0):
         self.dead_zone = dead_zone
+        self.responsiveness = responsiveness  # scales both interpolation rates (1 = original tuning)
 
         # internal state
         self.last_x = None
@@ -46,7 +47,7 @@ class CursorSmoother:
         # adaptive interpolation
         # slow movement → more smoothing
         # fast movement → more responsive
-        adaptive_alpha = 0.25 - (0.20 * (1 - (vel_clamped / 80)))
+        adaptive_alpha = min(1.0, (0.25 - (0.20 * (1 - (vel_clamped / 80)))) * self.responsiveness)
 
         # apply interpolation
         self.last_x += (tx - self.last_x) * adaptive_alpha
@@ -55,7 +56,7 @@ class CursorSmoother:
         # -----------------------------
         # MICRO-SMOOTHING
         # -----------------------------
-        micro_alpha = 0.10 if vel_clamped > 25 else 0.05
+        micro_alpha = min(1.0, (0.10 if vel_clamped > 25 else 0.05) * self.responsiveness)
 
         self.smooth_x += (self.last_x - self.smooth_x) * micro_alpha
         self.smooth_y += (self.last_y - self.smooth_y) * micro_alpha
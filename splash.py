@@ -0,0 +1,69 @@
+# splash.py — Lightweight startup screen shown until input is ready
+#
+# Only the default pygame font and a spinning arc: nothing to load, so it can
+# be drawn from the very first frame while the tracker opens the camera and
+# warms the model up on the executor. Text surfaces are rendered once per
+# status and reused. When the backend failed to open, the reason and the
+# retry countdown replace the spinner.
+import math
+
+import pygame
+import config
+from input_backends import Readiness
+
+STATUS_TEXT = (
+    (Readiness.CAMERA_OPEN, "Starting camera..."),
+    (Readiness.MODEL_LOADED, "Loading tracking model..."),
+    (Readiness.WARMED_UP, "Warming up..."),
+    (Readiness.FIRST_DETECTION, "Show your hand to the camera"),
+)
+
+
+ERROR_COLOR = (255, 80, 80)
+
+
+class Splash:
+    def __init__(self, title="Hand Cursor Game", color=(153, 255, 255)):
+        self.color = color
+        self._title = pygame.font.Font(None, 72).render(title, True, config.WHITE)
+        self._font = pygame.font.Font(None, 36)
+        self._text = {}  # status -> rendered surface
+
+    def status(self, readiness):
+        for flag, text in STATUS_TEXT:
+            if not readiness & flag:
+                return text
+        return "Ready"
+
+    def _label(self, text, color=config.WHITE):
+        label = self._text.get((text, color))
+        if label is None:
+            label = self._text[(text, color)] = self._font.render(text, True, color)
+        return label
+
+    def draw(self, surface, now, readiness, error=None, retry_at=None):
+        """error: why the input backend failed to open; retry_at: when it is tried again."""
+        w, h = surface.get_size()
+        cx, cy = w // 2, h // 2
+        surface.fill(config.BLACK)
+
+        surface.blit(self._title, self._title.get_rect(center=(cx, cy - 120)))
+
+        if error is not None:
+            label = self._label(error, ERROR_COLOR)
+            surface.blit(label, label.get_rect(center=(cx, cy)))
+            if retry_at is not None:
+                text = f"Retrying in {max(math.ceil(retry_at - now), 0)} s"
+            else:
+                text = "Check the input setup and restart"
+            label = self._label(text)
+            surface.blit(label, label.get_rect(center=(cx, cy + 50)))
+            return
+
+        radius = 36
+        start = (now * 4.0) % (2 * math.pi)
+        pygame.draw.arc(surface, self.color, (cx - radius, cy - radius, radius * 2, radius * 2),
+                        start, start + 4.0, 6)
+
+        label = self._label(self.status(readiness))
+        surface.blit(label, label.get_rect(center=(cx, cy + 90)))
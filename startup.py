@@ -0,0 +1,37 @@
+# startup.py — Cold-start phase timing
+#
+# Import this first (main.py does) so PROCESS_START is as close to
+# interpreter start as Python code can get. Phases are marked once, in
+# seconds since PROCESS_START, and reported together after the first
+# frame + first sample.
+import time
+
+PROCESS_START = time.perf_counter()
+
+
+class StartupLog:
+    def __init__(self, origin=PROCESS_START, source=time.perf_counter):
+        self.origin = origin
+        self._source = source
+        self.marks = {}  # phase -> seconds since origin (first mark wins)
+
+    def mark(self, phase, now=None):
+        """Record a phase once; later marks of the same phase are ignored."""
+        if phase not in self.marks:
+            now = self._source() if now is None else now
+            self.marks[phase] = now - self.origin
+        return self.marks[phase]
+
+    def add(self, phase, seconds):
+        """Record a measured duration (e.g. an import) rather than a point in time."""
+        self.marks.setdefault(phase, seconds)
+
+    def __contains__(self, phase):
+        return phase in self.marks
+
+    def get(self, phase):
+        return self.marks.get(phase)
+
+    def report(self, label="startup"):
+        parts = [f"{phase} {seconds * 1000.0:.0f} ms" for phase, seconds in self.marks.items()]
+        return f"{label:<12} " + ", ".join(parts)
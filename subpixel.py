@@ -0,0 +1,55 @@
+# subpixel.py — Pre-shifted sprite variants for sub-pixel positioning
+#
+# pygame blits on integer pixels, so a float cursor position snaps and jitters.
+# We render the sprite once at `phases`x resolution, then downsample copies
+# shifted by 1/phases of a pixel; drawing picks the copy whose phase matches
+# the fractional part of the position.
+import math
+
+import pygame
+
+
+def build_phase_sprites(builder, phases=4):
+    """
+    builder(scale) must return the sprite drawn at `scale` times its size.
+    Returns phases * phases surfaces, row-major by (phase_y, phase_x).
+    """
+    hi = builder(phases)
+    if phases == 1:
+        return [hi]
+
+    w, h = hi.get_size()
+    out_w, out_h = w // phases + 1, h // phases + 1
+
+    sprites = []
+    for py in range(phases):
+        for px in range(phases):
+            canvas = pygame.Surface((out_w * phases, out_h * phases), pygame.SRCALPHA)
+            canvas.blit(hi, (px, py))
+            sprites.append(pygame.transform.smoothscale(canvas, (out_w, out_h)))
+    return sprites
+
+
+class SubpixelSprite:
+    def __init__(self, sprites, phases, size):
+        self.sprites = sprites
+        self.phases = phases
+        self.half_w = size[0] / 2  # logical (unshifted) sprite size
+        self.half_h = size[1] / 2
+
+    def blit(self, surface, center):
+        x0 = center[0] - self.half_w
+        y0 = center[1] - self.half_h
+        ix = math.floor(x0)
+        iy = math.floor(y0)
+
+        px = round((x0 - ix) * self.phases)
+        py = round((y0 - iy) * self.phases)
+        if px == self.phases:
+            ix += 1
+            px = 0
+        if py == self.phases:
+            iy += 1
+            py = 0
+
+        surface.blit(self.sprites[py * self.phases + px], (ix, iy))
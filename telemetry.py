@@ -0,0 +1,192 @@
+# telemetry.py — In-process counters/histograms flushed off the hot path
+#
+# Hot-path calls (incr / observe) only touch in-memory dicts and fixed-bucket
+# histograms under a lock held for O(1) work. A daemon thread swaps the
+# buffers every TELEMETRY_FLUSH_SECONDS and writes them to a sink: a rotating
+# JSON-lines file or a StatsD-style UDP socket. The render loop never waits
+# on I/O.
+#
+# Stand-in StatsD receiver:  python telemetry.py --listen
+import json
+import os
+import socket
+import threading
+import time
+
+import config
+from histogram import Histogram, linear_edges
+
+DEFAULT_EDGES = linear_edges(0.0, 50.0, 0.5)  # milliseconds
+
+
+class JsonlSink:
+    def __init__(self, path=None, max_bytes=None, backups=None):
+        self.path = path or config.TELEMETRY_PATH
+        self.max_bytes = max_bytes or config.TELEMETRY_MAX_BYTES
+        self.backups = config.TELEMETRY_BACKUPS if backups is None else backups
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+
+    def _rotate(self):
+        for i in range(self.backups - 1, 0, -1):
+            src = f"{self.path}.{i}"
+            if os.path.exists(src):
+                os.replace(src, f"{self.path}.{i + 1}")
+        if self.backups:
+            os.replace(self.path, f"{self.path}.1")
+        else:
+            os.remove(self.path)
+
+    def write(self, record):
+        line = json.dumps(record, separators=(",", ":")) + "\n"
+        try:
+            if os.path.exists(self.path) and os.path.getsize(self.path) + len(line) > self.max_bytes:
+                self._rotate()
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line)
+        except OSError:
+            pass
+
+    def close(self):
+        pass
+
+
+class StatsdSink:
+    def __init__(self, host=None, port=None, prefix=None):
+        self.addr = (host or config.TELEMETRY_STATSD_HOST, port or config.TELEMETRY_STATSD_PORT)
+        self.prefix = prefix if prefix is not None else f"handcursor.{config.UNIT_ID}."
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.sock.setblocking(False)
+
+    def write(self, record):
+        lines = [f"{self.prefix}{k}:{v}|c" for k, v in record["counters"].items()]
+        for name, h in record["histograms"].items():
+            for stat in ("mean", "p50", "p95", "p99", "max"):
+                lines.append(f"{self.prefix}{name}.{stat}:{h[stat]:.3f}|g")
+
+        # keep datagrams well under a typical MTU
+        packet = []
+        size = 0
+        for line in lines:
+            if size + len(line) > 1200 and packet:
+                self._send(packet)
+                packet, size = [], 0
+            packet.append(line)
+            size += len(line) + 1
+        if packet:
+            self._send(packet)
+
+    def _send(self, lines):
+        try:
+            self.sock.sendto("\n".join(lines).encode("ascii"), self.addr)
+        except OSError:
+            pass  # nobody listening / buffer full: drop, never block
+
+    def close(self):
+        self.sock.close()
+
+
+class Telemetry:
+    def __init__(self, sink=None, interval=None, unit_id=None, thread=True):
+        self.sink = sink
+        self.interval = interval or config.TELEMETRY_FLUSH_SECONDS
+        self.unit_id = unit_id or config.UNIT_ID
+
+        self._lock = threading.Lock()
+        self._counters = {}
+        self._histograms = {}
+        self._edges = {}
+
+        self._stop = threading.Event()
+        self._thread = None
+        if sink is not None and thread:
+            # without the thread the owner calls flush() itself (e.g. an asyncio task)
+            self._thread = threading.Thread(target=self._run, name="telemetry", daemon=True)
+            self._thread.start()
+
+    @classmethod
+    def from_config(cls, **kwargs):
+        if not config.TELEMETRY_ENABLED:
+            return cls(**kwargs)
+        if config.TELEMETRY_SINK == "statsd":
+            return cls(StatsdSink(), **kwargs)
+        return cls(JsonlSink(), **kwargs)
+
+    # ---------------------------------------------------------
+    # HOT PATH
+    # ---------------------------------------------------------
+    def define_histogram(self, name, edges):
+        self._edges[name] = list(edges)
+
+    def incr(self, name, n=1):
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + n
+
+    def observe(self, name, value):
+        with self._lock:
+            h = self._histograms.get(name)
+            if h is None:
+                h = self._histograms[name] = Histogram(self._edges.get(name, DEFAULT_EDGES))
+            h.add(value)
+
+    # ---------------------------------------------------------
+    # FLUSH (background thread)
+    # ---------------------------------------------------------
+    def _swap(self):
+        with self._lock:
+            counters, self._counters = self._counters, {}
+            histograms, self._histograms = self._histograms, {}
+        return counters, histograms
+
+    def snapshot(self):
+        counters, histograms = self._swap()
+        return {
+            "ts": time.time(),
+            "unit": self.unit_id,
+            "counters": counters,
+            "histograms": {
+                name: {
+                    "count": h.count,
+                    "mean": h.mean,
+                    "p50": h.percentile(50),
+                    "p95": h.percentile(95),
+                    "p99": h.percentile(99),
+                    "max": h.max,
+                    "edges": [h.edges[0], h.edges[-1], len(h.edges)],
+                    "buckets": h.counts,
+                }
+                for name, h in histograms.items()
+            },
+        }
+
+    def flush(self):
+        if self.sink is not None:
+            self.sink.write(self.snapshot())
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.flush()
+
+    def close(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=2.0)
+        self.flush()
+        if self.sink is not None:
+            self.sink.close()
+
+
+def listen(host=None, port=None):
+    """Print StatsD packets sent by StatsdSink (stand-in receiver)."""
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sock.bind((host or config.TELEMETRY_STATSD_HOST, port or config.TELEMETRY_STATSD_PORT))
+    print(f"listening on {sock.getsockname()}")
+    while True:
+        data, _ = sock.recvfrom(65535)
+        print(data.decode("ascii", "replace"))
+
+
+if __name__ == "__main__":
+    import sys
+
+    if "--listen" in sys.argv:
+        listen()
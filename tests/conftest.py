@@ -0,0 +1,6 @@
+# conftest.py — Headless pygame and repo-root imports for the test suite
+import os
+import sys
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
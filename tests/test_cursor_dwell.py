@@ -0,0 +1,51 @@
+# test_cursor_dwell.py — Selection time is CURSOR_DWELL_MS at any frame rate
+import pytest
+
+from cursor import SmoothCursor
+from frame_clock import VirtualClock
+
+DWELL_MS = 800
+
+
+def time_to_close(fps):
+    clock = VirtualClock(step=1.0 / fps)
+    cursor = SmoothCursor(outer_radius=50, inner_radius=40, dwell_ms=DWELL_MS, clock=clock)
+    start = clock.now
+    cursor.start_animation()
+    while clock.now - start < 5.0:
+        cursor.update(clock.tick())
+        if cursor.finished:
+            return cursor, clock.now - start
+    pytest.fail(f"arc never closed at {fps} fps")
+
+
+@pytest.mark.parametrize("fps", (30, 60, 144, 240))
+def test_dwell_duration_is_independent_of_frame_rate(fps):
+    _, elapsed = time_to_close(fps)
+    # seen on the first frame at or after the deadline, never earlier
+    assert DWELL_MS / 1000.0 - 1e-9 <= elapsed < DWELL_MS / 1000.0 + 1.0 / fps + 1e-9
+
+
+def test_closed_arc_is_reported_until_a_trigger_consumes_it():
+    cursor, _ = time_to_close(60)
+    clock = cursor.clock
+    for _ in range(10):
+        cursor.start_animation()  # pinch still held: cooldown, no restart
+        cursor.update(clock.tick())
+    assert cursor.finished
+
+    cursor.trigger_correct()
+    assert not cursor.finished
+
+
+def test_trigger_listeners_fire_once_per_trigger():
+    cursor, _ = time_to_close(60)
+    events = []
+    cursor.add_listener("correct", lambda c, now: events.append(("correct", now)))
+    cursor.add_listener("wrong", lambda c, now: events.append(("wrong", now)))
+
+    now = cursor.clock.now
+    cursor.trigger_wrong()
+    cursor.update(cursor.clock.tick())
+
+    assert events == [("wrong", now)]
@@ -0,0 +1,38 @@
+# test_frame_clock.py — FrameClock / VirtualClock time keeping
+import pytest
+
+from frame_clock import VirtualClock
+from tween import Animator
+
+
+def test_tick_steps_now_and_dt():
+    clock = VirtualClock(start=1.0, step=0.25)
+    assert clock.tick() == 1.25
+    assert (clock.now, clock.dt, clock.frame) == (1.25, 0.25, 1)
+
+
+def test_advance_is_visible_without_a_tick():
+    clock = VirtualClock()
+    clock.advance(0.5)
+    assert clock.now == 0.5
+    assert clock.time() == 0.5
+    assert clock.dt == 0.5
+    assert clock.frame == 0
+
+
+def test_tick_after_advance_measures_dt_from_the_last_tick():
+    clock = VirtualClock()
+    clock.tick()
+    clock.advance(0.1)
+    clock.advance(0.2)
+    clock.tick()
+    assert clock.dt == pytest.approx(0.3)
+    assert clock.frame == 2
+
+
+def test_animator_sees_advanced_time():
+    clock = VirtualClock()
+    anim = Animator(clock)
+    anim.play("x", 0.0, 10.0, 1.0)
+    clock.advance(0.5)
+    assert anim.value("x") == pytest.approx(5.0)
@@ -0,0 +1,79 @@
+# test_tween.py — Tracks, easings and completion callbacks on a VirtualClock
+import pytest
+
+from frame_clock import VirtualClock
+from tween import EASINGS, Animator, Track
+
+
+@pytest.mark.parametrize("name", sorted(EASINGS))
+def test_easing_endpoints(name):
+    easing = EASINGS[name]
+    assert easing(0.0) == pytest.approx(0.0, abs=1e-12)
+    assert easing(1.0) == pytest.approx(1.0, abs=1e-12)
+
+
+def test_track_value_is_clamped_to_its_duration():
+    track = Track(10.0, 20.0, 2.0, t0=5.0)
+    assert track.value(4.0) == 10.0
+    assert track.value(6.0) == pytest.approx(15.0)
+    assert track.value(7.0) == 20.0
+    assert track.value(100.0) == 20.0
+    assert track.remaining(6.5) == pytest.approx(0.5)
+    assert track.done(7.0) and not track.done(6.99)
+
+
+def run(clock, anim, seconds):
+    end = clock.now + seconds
+    while clock.now < end:
+        anim.update(clock.tick())
+
+
+def test_completion_fires_exactly_once_at_the_exact_end_time():
+    clock = VirtualClock(step=1.0 / 60.0)
+    anim = Animator(clock)
+    calls = []
+    anim.play("fade", 1.0, 0.0, 0.5, on_complete=calls.append)
+
+    run(clock, anim, 2.0)
+
+    assert calls == [pytest.approx(0.5)]
+    assert anim.value("fade") == 0.0  # finished tracks hold their end value
+
+
+def test_restart_replaces_the_pending_callback():
+    clock = VirtualClock(step=0.01)
+    anim = Animator(clock)
+    calls = []
+    anim.play("arc", 0.0, 1.0, 0.3, on_complete=lambda end: calls.append(("first", end)))
+    run(clock, anim, 0.1)
+    track = anim.play("arc", 0.0, 1.0, 0.3, on_complete=lambda end: calls.append(("second", end)))
+
+    run(clock, anim, 1.0)
+
+    assert calls == [("second", pytest.approx(track.t0 + 0.3))]
+
+
+def test_stopped_track_never_completes():
+    clock = VirtualClock(step=0.01)
+    anim = Animator(clock)
+    calls = []
+    anim.play("hold", 1.0, 0.0, 0.2, on_complete=calls.append)
+    anim.stop("hold")
+
+    run(clock, anim, 1.0)
+
+    assert calls == []
+    assert not anim.running()
+
+
+def test_zero_duration_completes_on_the_next_update():
+    clock = VirtualClock(step=0.01)
+    anim = Animator(clock)
+    calls = []
+    anim.play("snap", 0.0, 1.0, 0.0, on_complete=calls.append)
+    assert anim.value("snap") == 1.0
+
+    anim.update(clock.tick())
+    anim.update(clock.tick())
+
+    assert len(calls) == 1
@@ -0,0 +1,351 @@
+# tracker_net.py — HandSample streaming between processes / hosts
+#
+# A TrackerServer runs any input backend (usually hand tracking) on its own
+# and sends every sample as one datagram to each subscribed client, over
+# UDP or a Unix datagram socket. Clients subscribe by pinging; the same
+# ping/pong estimates the server→client clock offset (NTP style, keeping
+# the minimum-RTT exchange of the last few), so sample timestamps can be
+# compared with the client's own perf_counter().
+#
+# Datagrams are independent: a lost or late packet is simply skipped and
+# the client always uses the newest sequence number it has seen. Every
+# server process picks a random session id; a packet from a new session
+# (server restarted, seq back at 1) resets the client's sequence and clock
+# offset state instead of being dropped as stale.
+#
+# Packet (little endian):
+#   sample  "<2sBBIIddfffHB" magic b"HS", version, flags, session, seq, t_send,
+#                            t_capture, x, y, confidence, gestures, handedness
+#                            (43 bytes)
+#           + 21 x 3 float16 landmarks when FLAG_LANDMARKS is set
+#   ping    "<2sBd"   magic b"HP", version, client t0
+#   pong    "<2sBddd" magic b"HO", version, t0, server receive t1, server send t2
+#
+# Addresses: "udp://host:port" or "unix:///path/to/socket".
+#
+#   python tracker_net.py --serve [--input hand] [--bind udp://0.0.0.0:5005]
+import os
+import select
+import socket
+import struct
+import tempfile
+import threading
+import time
+from collections import deque
+
+import numpy as np
+import config
+from gestures import Gesture
+from histogram import Histogram, linear_edges
+from samples import HandSample, freeze
+
+VERSION = 2
+SAMPLE = struct.Struct("<2sBBIIddfffHB")
+PING = struct.Struct("<2sBd")
+PONG = struct.Struct("<2sBddd")
+LANDMARK_BYTES = 21 * 3 * 2  # float16
+
+FLAG_PRESENT = 1
+FLAG_LANDMARKS = 2
+
+HANDEDNESS = ("", "Left", "Right")
+SEQ_MASK = 0xFFFFFFFF
+
+
+def parse_address(address):
+    """'udp://host:port' -> (AF_INET, (host, port)); 'unix:///path' -> (AF_UNIX, path)."""
+    if address.startswith("unix://"):
+        return socket.AF_UNIX, address[len("unix://"):]
+    if address.startswith("udp://"):
+        address = address[len("udp://"):]
+    host, _, port = address.rpartition(":")
+    return socket.AF_INET, (host or "127.0.0.1", int(port))
+
+
+def new_session():
+    """Random non-zero id for one server process."""
+    return int.from_bytes(os.urandom(4), "little") or 1
+
+
+def encode_sample(sample, seq, t_send, landmarks=True, session=0):
+    flags = FLAG_PRESENT if sample.present else 0
+    has_landmarks = landmarks and sample.landmarks is not None
+    if has_landmarks:
+        flags |= FLAG_LANDMARKS
+    handedness = HANDEDNESS.index(sample.handedness) if sample.handedness in HANDEDNESS else 0
+    head = SAMPLE.pack(b"HS", VERSION, flags, session, seq & SEQ_MASK, t_send, sample.t,
+                       sample.x, sample.y, sample.confidence, int(sample.gestures), handedness)
+    if has_landmarks:
+        return head + sample.landmarks.astype(np.float16).tobytes()
+    return head
+
+
+def decode_sample(data, clock_offset=0.0):
+    """Returns (session, seq, t_send, HandSample) with times moved onto the local clock."""
+    (magic, version, flags, session, seq, t_send, t_capture,
+     x, y, confidence, gestures, handedness) = SAMPLE.unpack_from(data)
+    if magic != b"HS" or version != VERSION:
+        raise ValueError("not a HandSample packet")
+
+    landmarks = None
+    if flags & FLAG_LANDMARKS and len(data) >= SAMPLE.size + LANDMARK_BYTES:
+        raw = np.frombuffer(data, dtype=np.float16, count=63, offset=SAMPLE.size)
+        landmarks = freeze(raw.astype(np.float32).reshape(21, 3))
+
+    sample = HandSample(
+        t=t_capture - clock_offset,
+        seq=seq,
+        x=x,
+        y=y,
+        present=bool(flags & FLAG_PRESENT),
+        landmarks=landmarks,
+        confidence=confidence,
+        handedness=HANDEDNESS[handedness] if handedness < len(HANDEDNESS) else "",
+        gestures=Gesture(gestures),
+    )
+    return session, seq, t_send - clock_offset, sample
+
+
+def seq_newer(a, b):
+    """True if sequence number a is after b (uint32 wrap-around safe)."""
+    return 0 < ((a - b) & SEQ_MASK) < 0x80000000
+
+
+# ---------------------------------------------------------
+# SERVER
+# ---------------------------------------------------------
+class TrackerServer:
+    def __init__(self, address=None, landmarks=True, client_timeout=None, source=time.perf_counter):
+        self.address = address or config.TRACKER_ADDRESS
+        self.landmarks = landmarks
+        self.client_timeout = client_timeout or config.TRACKER_CLIENT_TIMEOUT
+        self._source = source
+
+        family, addr = parse_address(self.address)
+        self.sock = socket.socket(family, socket.SOCK_DGRAM)
+        if family == socket.AF_UNIX and os.path.exists(addr):
+            os.unlink(addr)
+        self.sock.bind(addr)
+        self.sock.setblocking(False)
+        self._unix_path = addr if family == socket.AF_UNIX else None
+
+        self._clients = {}  # address -> last ping time
+        self._lock = threading.Lock()
+        self.session = new_session()
+        self.seq = 0
+        self.sent = 0
+        self.send_errors = 0
+
+        self._stop = threading.Event()
+        self._control = threading.Thread(target=self._serve_control, name="tracker-net", daemon=True)
+        self._control.start()
+
+    @property
+    def clients(self):
+        with self._lock:
+            return list(self._clients)
+
+    def _serve_control(self):
+        """Answer pings immediately (their receive time feeds the clients' offset estimate)."""
+        sock = self.sock
+        while not self._stop.is_set():
+            ready, _, _ = select.select([sock], [], [], 0.2)
+            if not ready:
+                continue
+            try:
+                data, addr = sock.recvfrom(64)
+            except OSError:
+                continue
+            t1 = self._source()
+            if len(data) != PING.size or data[:2] != b"HP":
+                continue
+            _, version, t0 = PING.unpack(data)
+            if version != VERSION or not addr:
+                continue
+            with self._lock:
+                self._clients[addr] = t1
+            try:
+                sock.sendto(PONG.pack(b"HO", VERSION, t0, t1, self._source()), addr)
+            except OSError:
+                pass
+
+    def publish(self, sample):
+        """Send one sample to every live client; never blocks the tracker."""
+        self.seq = (self.seq + 1) & SEQ_MASK
+        now = self._source()
+        packet = encode_sample(sample, self.seq, now, self.landmarks, self.session)
+
+        with self._lock:
+            stale = [a for a, seen in self._clients.items() if now - seen > self.client_timeout]
+            for addr in stale:
+                del self._clients[addr]
+            clients = list(self._clients)
+
+        for addr in clients:
+            try:
+                self.sock.sendto(packet, addr)
+                self.sent += 1
+            except (BlockingIOError, OSError):
+                self.send_errors += 1  # full buffer / client gone: drop, the next one replaces it
+
+    def serve(self, backend):
+        """Run a backend forever, publishing every sample."""
+        backend.open()
+        print(f"tracker server: {backend.name} on {self.address}")
+        try:
+            while True:
+                frame, sample = backend.process_frame()
+                if sample is not None:
+                    self.publish(sample)
+                elif frame is None:
+                    time.sleep(0.001)  # read failure: don't spin
+        finally:
+            backend.release()
+
+    def close(self):
+        self._stop.set()
+        self._control.join(timeout=1.0)
+        self.sock.close()
+        if self._unix_path and os.path.exists(self._unix_path):
+            os.unlink(self._unix_path)
+
+
+# ---------------------------------------------------------
+# CLIENT
+# ---------------------------------------------------------
+class TrackerClient:
+    """Subscribes to a TrackerServer; poll() returns the newest sample, dropping stale ones."""
+
+    def __init__(self, address=None, ping_interval=None, offset_window=8, source=time.perf_counter):
+        self.address = address or config.TRACKER_ADDRESS
+        self.ping_interval = ping_interval or config.TRACKER_PING_SECONDS
+        self._source = source
+
+        family, self.server = parse_address(self.address)
+        self.sock = socket.socket(family, socket.SOCK_DGRAM)
+        self._unix_path = None
+        if family == socket.AF_UNIX:
+            # unix datagram replies need a bound client address
+            self._unix_path = tempfile.mktemp(prefix="handcursor-client-", suffix=".sock")
+            self.sock.bind(self._unix_path)
+        self.sock.setblocking(False)
+
+        self._exchanges = deque(maxlen=offset_window)  # (rtt, offset)
+        self.clock_offset = 0.0   # server clock - local clock
+        self.rtt = None
+        self._next_ping = 0.0
+
+        self.session = None
+        self.last_seq = None
+        self.latest = None
+        self.received = 0
+        self.lost = 0        # sequence gaps
+        self.stale = 0       # arrived after a newer packet
+        self.resyncs = 0     # server restarts (new session id)
+        self.transit = Histogram(linear_edges(0.0, 0.020, 0.00002))  # receive - send (s)
+
+    def ping(self, now=None):
+        now = self._source() if now is None else now
+        self._next_ping = now + self.ping_interval
+        try:
+            self.sock.sendto(PING.pack(b"HP", VERSION, now), self.server)
+        except OSError:
+            pass
+
+    def _on_pong(self, data, t3):
+        _, _, t0, t1, t2 = PONG.unpack(data)
+        rtt = (t3 - t0) - (t2 - t1)
+        offset = ((t1 - t0) + (t2 - t3)) / 2.0
+        self._exchanges.append((rtt, offset))
+        self.rtt, self.clock_offset = min(self._exchanges)  # least-delayed exchange wins
+
+    def poll(self, now=None):
+        """Drain the socket. Returns the newest HandSample received since the last call, or None."""
+        now = self._source() if now is None else now
+        if now >= self._next_ping:
+            self.ping(now)
+
+        newest = None
+        while True:
+            try:
+                data = self.sock.recv(2048)
+            except (BlockingIOError, InterruptedError):
+                break
+            except OSError:
+                break
+            t = self._source()
+
+            if data[:2] == b"HO" and len(data) == PONG.size:
+                self._on_pong(data, t)
+                continue
+            try:
+                session, seq, t_send, sample = decode_sample(data, self.clock_offset)
+            except (ValueError, struct.error):
+                continue
+
+            if session != self.session:
+                if self.session is not None:
+                    self._resync(t)
+                    session, seq, t_send, sample = decode_sample(data, self.clock_offset)
+                self.session = session
+                self.last_seq = None
+
+            self.received += 1
+            if self.last_seq is not None:
+                if not seq_newer(seq, self.last_seq):
+                    self.stale += 1
+                    continue
+                self.lost += ((seq - self.last_seq) & SEQ_MASK) - 1
+            self.last_seq = seq
+            self.transit.add(t - t_send)
+            newest = sample
+
+        if newest is not None:
+            self.latest = newest
+        return newest
+
+    def _resync(self, now):
+        """Server restarted: forget the old process's clock offset and re-ping."""
+        self.resyncs += 1
+        self._exchanges.clear()
+        self.rtt = None
+        self.clock_offset = 0.0
+        self.ping(now)
+
+    def wait(self, timeout):
+        """Block up to timeout seconds for the next datagram (pongs included)."""
+        ready, _, _ = select.select([self.sock], [], [], timeout)
+        return bool(ready)
+
+    def close(self):
+        self.sock.close()
+        if self._unix_path and os.path.exists(self._unix_path):
+            os.unlink(self._unix_path)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    from input_backends import BACKENDS, create_backend
+
+    parser = argparse.ArgumentParser(description="Stream HandSamples to display clients")
+    parser.add_argument("--serve", action="store_true", help="run the tracker server")
+    parser.add_argument("--bind", default=None, help="udp://host:port or unix:///path")
+    parser.add_argument("--input", choices=sorted(set(BACKENDS) - {"mouse", "remote"}),
+                        default=None)
+    parser.add_argument("--replay", help="batch_extract.py session folder for --input replay")
+    parser.add_argument("--no-landmarks", action="store_true", help="send only the cursor anchor")
+    args = parser.parse_args()
+
+    if not args.serve:
+        parser.print_help()
+    else:
+        name = args.input or ("replay" if args.replay else config.TRACKING_MODE)
+        backend = create_backend(name, path=args.replay) if name == "replay" else create_backend(name)
+        server = TrackerServer(args.bind, landmarks=not args.no_landmarks)
+        try:
+            server.serve(backend)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.close()
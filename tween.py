@@ -0,0 +1,132 @@
+# tween.py — Duration-based tweens on an injectable clock
+#
+# A Track interpolates start → end over a fixed duration with an easing
+# curve; its value is a pure function of time, so an animation takes the
+# same wall-clock time at 30 FPS or 240 FPS. Animator keeps named tracks
+# and fires each completion callback exactly once, from update().
+#
+#   anim = Animator(clock=frame_clock)
+#   anim.play("arc", 0.0, 360.0, 0.8, easing="ease_out_quad", on_complete=done)
+#   anim.update()            # once per frame
+#   angle = anim.value("arc", 360.0)
+import math
+import time
+
+
+def linear(p):
+    return p
+
+
+def ease_in_quad(p):
+    return p * p
+
+
+def ease_out_quad(p):
+    return p * (2.0 - p)
+
+
+def ease_in_out_quad(p):
+    return 2.0 * p * p if p < 0.5 else 1.0 - 2.0 * (1.0 - p) * (1.0 - p)
+
+
+def ease_out_cubic(p):
+    q = 1.0 - p
+    return 1.0 - q * q * q
+
+
+def ease_in_out_sine(p):
+    return 0.5 - 0.5 * math.cos(math.pi * p)
+
+
+EASINGS = {
+    "linear": linear,
+    "ease_in_quad": ease_in_quad,
+    "ease_out_quad": ease_out_quad,
+    "ease_in_out_quad": ease_in_out_quad,
+    "ease_out_cubic": ease_out_cubic,
+    "ease_in_out_sine": ease_in_out_sine,
+}
+
+
+class Track:
+    def __init__(self, start, end, duration, t0, easing="linear", on_complete=None):
+        self.start = start
+        self.end = end
+        self.duration = max(duration, 0.0)
+        self.t0 = t0
+        self.easing = EASINGS[easing] if isinstance(easing, str) else easing
+        self.on_complete = on_complete  # fn(end_time), called once by Animator.update()
+        self.completed = False
+
+    def progress(self, now):
+        if self.duration <= 0.0:
+            return 1.0
+        return min(max((now - self.t0) / self.duration, 0.0), 1.0)
+
+    def value(self, now):
+        return self.start + (self.end - self.start) * self.easing(self.progress(now))
+
+    def remaining(self, now):
+        return max(self.t0 + self.duration - now, 0.0)
+
+    def done(self, now):
+        return now >= self.t0 + self.duration
+
+
+class Animator:
+    def __init__(self, clock=None):
+        self.clock = clock  # FrameClock / VirtualClock; None -> sample perf_counter
+        self._tracks = {}   # name -> Track
+
+    def _time(self, now=None):
+        if now is not None:
+            return now
+        if self.clock is not None:
+            return self.clock.now
+        return time.perf_counter()
+
+    def play(self, name, start, end, duration, now=None, easing="linear", on_complete=None):
+        """Start (or restart) a named track; replaces any track with the same name."""
+        track = Track(start, end, duration, self._time(now), easing, on_complete)
+        self._tracks[name] = track
+        return track
+
+    def stop(self, name):
+        """Remove a track without firing its callback."""
+        self._tracks.pop(name, None)
+
+    def get(self, name):
+        return self._tracks.get(name)
+
+    def value(self, name, default=None, now=None):
+        """Current value of a track; finished tracks hold their end value until stopped."""
+        track = self._tracks.get(name)
+        if track is None:
+            return default
+        return track.value(self._time(now))
+
+    def remaining(self, name, now=None):
+        track = self._tracks.get(name)
+        return 0.0 if track is None else track.remaining(self._time(now))
+
+    def active(self, name, now=None):
+        """True while the named track exists and has not reached its end."""
+        track = self._tracks.get(name)
+        return track is not None and not track.done(self._time(now))
+
+    def running(self, now=None):
+        now = self._time(now)
+        return any(not track.done(now) for track in self._tracks.values())
+
+    def update(self, now=None):
+        """Fire completion callbacks of tracks that ended since the last update."""
+        now = self._time(now)
+        finished = [t for t in self._tracks.values() if not t.completed and t.done(now)]
+        for track in finished:
+            track.completed = True
+            if track.on_complete is not None:
+                # the exact end time, so chained tracks don't inherit frame jitter
+                track.on_complete(track.t0 + track.duration)
+
+    def clear(self):
+        self._tracks.clear()